@@ -7,11 +7,14 @@ Main Plugin API
 """
 
 from autohooks.config import Config
+from autohooks.precommit.inputs import register_plugin_inputs
+from autohooks.precommit.metadata import PluginMetadata
 from autohooks.precommit.run import ReportProgress
 from autohooks.terminal import bold_info, error, fail, info, ok, out, warning
 
 __all__ = [
     "Config",
+    "PluginMetadata",
     "ReportProgress",
     "bold_info",
     "error",
@@ -19,5 +22,6 @@ __all__ = [
     "info",
     "ok",
     "out",
+    "register_plugin_inputs",
     "warning",
 ]
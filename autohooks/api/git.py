@@ -7,39 +7,53 @@
 Plugin API for handling git related tasks
 """
 
+import codecs
 import os
+import re
 import subprocess
-from collections.abc import Iterable, Iterator
+import threading
+from collections.abc import Generator, Iterable, Iterator
+from contextlib import contextmanager, suppress
 from enum import Enum
 from os import PathLike
 from pathlib import Path
-from tempfile import NamedTemporaryFile
+from tempfile import NamedTemporaryFile, TemporaryDirectory, TemporaryFile
 from types import TracebackType
-from typing import Any
+from typing import IO, Any
 
-from autohooks.utils import GitError, exec_git, get_project_root_path
+from typing_extensions import Self
+
+from autohooks.utils import (
+    GITLINK_MODE,
+    GitError,
+    exec_git,
+    get_project_root_path,
+    get_repository_context,
+)
 
 __all__ = [
     "GitError",
     "Status",
     "StatusEntry",
     "exec_git",
+    "get_changed_status",
+    "get_staged_changed_lines",
+    "get_staged_contents",
     "get_staged_status",
     "get_status",
+    "get_tracked_status",
+    "get_uncommitted_status",
     "is_partially_staged_status",
     "is_staged_status",
+    "stage_changed_files",
     "stage_files",
+    "staged_snapshot",
     "stash_unstaged_changes",
 ]
 
 
-def _get_git_toplevel_path():
-    try:
-        git_dir = exec_git("rev-parse", "--show-toplevel").rstrip()
-    except subprocess.CalledProcessError as e:
-        print("could not determine toplevel directory. {e.output.decode()}")
-        raise e from None
-    return Path(git_dir).resolve()
+def _get_git_toplevel_path() -> Path:
+    return get_repository_context().toplevel_path
 
 
 class Status(Enum):
@@ -53,6 +67,7 @@ class Status(Enum):
     DELETED = "D"
     RENAMED = "R"
     COPIED = "C"
+    TYPE_CHANGED = "T"
     UPDATED = "U"
     UNTRACKED = "?"
     IGNORED = "!"
@@ -69,7 +84,7 @@ class StatusEntry:
         working_tree: Status in the working tree
         path: Path to the file
         root_path: An optional path to a root directory
-        old_path: Set for renamed files
+        old_path: Set for renamed and copied files
     """
 
     def __init__(
@@ -84,7 +99,7 @@ class StatusEntry:
         self.working_tree = Status(status[1])
         self.root_path = root_path
 
-        if self.index == Status.RENAMED:
+        if self.index in (Status.RENAMED, Status.COPIED):
             new_filename, old_filename = filename.split("\0")
             self.path = Path(new_filename)
             self.old_path = Path(old_filename)
@@ -118,7 +133,7 @@ def _parse_status(output: str) -> Iterator[str]:
     output_list = output.split("\0")
     while output_list:
         line = output_list.pop(0)
-        if line[0] == Status.RENAMED.value:
+        if line[0] in (Status.RENAMED.value, Status.COPIED.value):
             yield f"{line}\0{output_list.pop(0)}"
         else:
             yield line
@@ -165,24 +180,42 @@ def is_partially_staged_status(status: StatusEntry) -> bool:
     )
 
 
-def get_status(files: Iterable[PathLike] | None = None) -> list[StatusEntry]:
+def _get_status_options() -> list[str]:
+    context = get_repository_context()
+    # a file system monitor configured by the user, e.g. a hook script, takes
+    # precedence over the builtin daemon
+    if context.fsmonitor and not context.has_fsmonitor_configured:
+        # let the file system monitor daemon report the changed files instead
+        # of checking every tracked file of the working tree
+        return ["-c", "core.fsmonitor=true"]
+    return []
+
+
+def get_status(
+    files: Iterable[PathLike] | None = None, *, ignore_submodules: bool = True
+) -> list[StatusEntry]:
     """Get information about the current git status.
 
     Arguments:
         files: (optional) specify an iterable of :py:class:`os.PathLike` and
             exclude all other paths for the status.
+        ignore_submodules: (optional) exclude changes of submodules from the
+            status. True by default.
 
     Returns:
         A list of :py:class:`StatusEntry` instances that contain the status of
         the specific files.
     """
     args = [
+        *_get_status_options(),
         "status",
         "-z",
-        "--ignore-submodules",
         "--untracked-files=no",
     ]
 
+    if ignore_submodules:
+        args.append("--ignore-submodules")
+
     if files is not None:
         args.append("--")
         args.extend([os.fspath(f) for f in files])
@@ -192,21 +225,296 @@ def get_status(files: Iterable[PathLike] | None = None) -> list[StatusEntry]:
     return [StatusEntry(f, root_path) for f in _parse_status(output)]
 
 
-def get_staged_status(
+def _parse_name_status(output: str) -> Iterator[tuple[str, str, str]]:
+    # parse the output of git diff --name-status -z into tuples of the status
+    # letter, the path and the old path of renamed and copied files
+    output = output.rstrip("\0")
+    if not output:
+        return
+
+    output_list = output.split("\0")
+    while output_list:
+        status = output_list.pop(0)[0]
+        path = output_list.pop(0)
+        if status in (Status.RENAMED.value, Status.COPIED.value):
+            old_path, path = path, output_list.pop(0)
+        else:
+            old_path = path
+        yield status, path, old_path
+
+
+# maximum number of paths passed to git as arguments. If there are more paths
+# the whole working tree is compared to avoid too long command lines.
+_MAX_PATHSPECS = 1000
+
+
+def _get_working_tree_status(
+    paths: list[str], *, ignore_submodules: bool
+) -> dict[str, str]:
+    # compare the working tree with the index only for the passed paths
+    # relative to the top-level directory of the working tree
+    if not paths:
+        return {}
+
+    args = [
+        *_get_status_options(),
+        "--literal-pathspecs",
+        "-C",
+        str(_get_git_toplevel_path()),
+        "diff",
+        "--name-status",
+        "-z",
+        "--no-renames",
+        "--no-relative",
+    ]
+
+    if ignore_submodules:
+        args.append("--ignore-submodules")
+
+    if len(paths) <= _MAX_PATHSPECS:
+        args.append("--")
+        args.extend(paths)
+
+    output = exec_git(*args)
+    return {path: status for status, path, _ in _parse_name_status(output)}
+
+
+def _get_status_list(
+    args: list[str],
+    files: Iterable[PathLike] | None,
+    *,
+    ignore_submodules: bool,
+    with_working_tree: bool,
+) -> list[StatusEntry]:
+    # determine the status entries of the added, changed, renamed and copied
+    # files from the output of the git diff command args. the paths must be
+    # relative to the root of the repository even if diff.relative is set.
+    args = [*args, "--name-status", "-z", "-M", "--no-relative"]
+
+    if ignore_submodules:
+        args.append("--ignore-submodules")
+
+    if files is not None:
+        args.append("--")
+        args.extend([os.fspath(f) for f in files])
+
+    output = exec_git(*args)
+    changed = [
+        (status, path, old_path)
+        for status, path, old_path in _parse_name_status(output)
+        if status != Status.DELETED.value
+    ]
+
+    working_tree_status = (
+        _get_working_tree_status(
+            [path for _, path, _ in changed],
+            ignore_submodules=ignore_submodules,
+        )
+        if with_working_tree
+        else {}
+    )
+
+    root_path = _get_git_toplevel_path()
+    status_list = []
+    for status, path, old_path in changed:
+        working_tree = working_tree_status.get(path, Status.UNMODIFIED.value)
+        status_string = f"{status}{working_tree} {path}"
+        if status in (Status.RENAMED.value, Status.COPIED.value):
+            status_string = f"{status_string}\0{old_path}"
+        status_list.append(StatusEntry(status_string, root_path))
+
+    return status_list
+
+
+def get_changed_status(
+    from_ref: str,
+    to_ref: str = "HEAD",
     files: Iterable[PathLike] | None = None,
+    *,
+    ignore_submodules: bool = True,
+) -> list[StatusEntry]:
+    """Get a list of :py:class:`StatusEntry` instances containing the files
+    changed between two commits.
+
+    The changes are determined since the merge base of both commits like for
+    a pull request. The status of the files in the working tree is always
+    :py:attr:`Status.UNMODIFIED`.
+
+    Arguments:
+        from_ref: The commit to compare with, for example the target branch
+            of a pull request. If it is the empty tree all files of to_ref are
+            considered as changed.
+        to_ref: The commit containing the changes. HEAD by default.
+        files: (optional) specify an iterable of files and exclude all other
+            paths.
+        ignore_submodules: (optional) exclude changes of submodules. True by
+            default.
+
+    Returns:
+        A list of :py:class:`StatusEntry` instances with the added, modified,
+        renamed and copied files.
+    """
+    if from_ref == get_repository_context().empty_tree:
+        # all files of to_ref are considered as changed. the empty tree has
+        # no merge base.
+        revisions = [from_ref, to_ref]
+    else:
+        revisions = [f"{from_ref}...{to_ref}"]
+
+    return _get_status_list(
+        ["diff", *revisions],
+        files,
+        ignore_submodules=ignore_submodules,
+        with_working_tree=False,
+    )
+
+
+def get_uncommitted_status(
+    files: Iterable[PathLike] | None = None, *, ignore_submodules: bool = True
+) -> list[StatusEntry]:
+    """Get a list of :py:class:`StatusEntry` instances containing the files
+    which would be committed if all changes of the working tree were staged.
+
+    The working tree is compared with the HEAD commit. Untracked files which
+    are not ignored are considered as added. The index status of the entries
+    is the status of the changes in the working tree and the working tree
+    status is always :py:attr:`Status.UNMODIFIED`.
+
+    Arguments:
+        files: (optional) specify an iterable of files and exclude all other
+            paths.
+        ignore_submodules: (optional) exclude changes of submodules. True by
+            default.
+
+    Returns:
+        A list of :py:class:`StatusEntry` instances with the added, modified,
+        renamed and copied files.
+    """
+    try:
+        exec_git("rev-parse", "--verify", "--quiet", "HEAD")
+        head = "HEAD"
+    except GitError:
+        # no commit yet
+        head = get_repository_context().empty_tree
+
+    status_list = _get_status_list(
+        ["diff", head],
+        files,
+        ignore_submodules=ignore_submodules,
+        with_working_tree=False,
+    )
+
+    args = ["ls-files", "-z", "--others", "--exclude-standard", "--full-name"]
+    if files is not None:
+        args.append("--")
+        args.extend([os.fspath(f) for f in files])
+
+    root_path = _get_git_toplevel_path()
+    status_list.extend(
+        StatusEntry(
+            f"{Status.ADDED.value}{Status.UNMODIFIED.value} {path}", root_path
+        )
+        for path in exec_git(*args).split("\0")
+        if path
+    )
+    return status_list
+
+
+def _filter_status_list(
+    status_list: list[StatusEntry], files: Iterable[PathLike] | None
+) -> list[StatusEntry]:
+    # keep the entries of the files and of the files within the directories
+    if files is None:
+        return list(status_list)
+
+    paths = [Path(f).resolve() for f in files]
+    filtered = []
+    for entry in status_list:
+        absolute_path = entry.absolute_path()
+        if any(
+            absolute_path == path or path in absolute_path.parents
+            for path in paths
+        ):
+            filtered.append(entry)
+    return filtered
+
+
+def get_tracked_status(
+    files: Iterable[PathLike] | None = None, *, ignore_submodules: bool = True
+) -> list[StatusEntry]:
+    """Get a list of :py:class:`StatusEntry` instances containing all files
+    tracked in the index.
+
+    The index is compared with the empty tree. Therefore all files have the
+    index status :py:attr:`Status.ADDED`. The working tree status is
+    determined like for :py:func:`get_staged_status`.
+
+    Arguments:
+        files: (optional) specify an iterable of files and exclude all other
+            paths.
+        ignore_submodules: (optional) exclude submodules. True by default.
+
+    Returns:
+        A list of :py:class:`StatusEntry` instances with all tracked files.
+    """
+    return _get_status_list(
+        ["diff", "--cached", get_repository_context().empty_tree],
+        files,
+        ignore_submodules=ignore_submodules,
+        with_working_tree=True,
+    )
+
+
+def get_staged_status(
+    files: Iterable[PathLike] | None = None, *, ignore_submodules: bool = True
 ) -> list[StatusEntry]:
     """Get a list of :py:class:`StatusEntry` instances containing only staged
     files.
 
+    Only the index is compared with the HEAD commit to find the staged files.
+    The working tree status is determined for the staged files only. Therefore
+    the costs depend on the number of staged changes and not on the size of
+    the repository.
+
+    If autohooks is run for a commit range, for example via
+    ``autohooks run --from-ref``, the files changed in the commit range are
+    returned instead. See :py:func:`get_changed_status`. If autohooks is run
+    for all tracked files, for example via ``autohooks run --all-files``, the
+    tracked files are returned. See :py:func:`get_tracked_status`.
+
     Arguments:
         files: (optional) specify an iterable of files and exclude all other
             paths for the status.
+        ignore_submodules: (optional) exclude changes of submodules from the
+            status. True by default.
 
     Returns:
         A list of :py:class:`StatusEntry` instances with files that are staged.
     """
-    status = get_status(files)
-    return [s for s in status if is_staged_status(s)]
+    context = get_repository_context()
+    if context.status_list is not None:
+        return _filter_status_list(context.status_list, files)
+
+    if context.commit_range:
+        return get_changed_status(
+            *context.commit_range, files, ignore_submodules=ignore_submodules
+        )
+
+    if context.tracked_files is not None:
+        return _filter_status_list(
+            get_tracked_status(
+                context.tracked_files or None,
+                ignore_submodules=ignore_submodules,
+            ),
+            files,
+        )
+
+    return _get_status_list(
+        ["diff", "--cached"],
+        files,
+        ignore_submodules=ignore_submodules,
+        with_working_tree=True,
+    )
 
 
 def stage_files_from_status_list(status_list: Iterable[StatusEntry]) -> None:
@@ -230,6 +538,141 @@ def stage_files(files: Iterable[PathLike]) -> None:
     exec_git("add", *filenames)
 
 
+def _run_git_with_input(args: list[str], data: bytes) -> bytes:
+    try:
+        process = subprocess.run(
+            ["git", *args], input=data, check=True, capture_output=True
+        )
+        return process.stdout
+    except subprocess.CalledProcessError as e:
+        raise GitError(e.returncode, e.cmd, e.output, e.stderr) from None
+
+
+def _get_file_system_time(directory: Path) -> int:
+    # the current time of the file system in nanoseconds. the clock and the
+    # resolution of the timestamps of a file system may differ from the
+    # system clock.
+    with TemporaryFile(dir=directory) as f:
+        return os.fstat(f.fileno()).st_mtime_ns
+
+
+class stage_changed_files:  # pylint: disable=invalid-name
+    """
+    A context manager that stages the files changed while the context is
+    active.
+
+    The inode, size and modification time of the files are recorded when
+    entering the context. When exiting, only the files whose stat data has
+    changed are hashed and only the files whose content differs from the
+    index are staged with a single git update-index call. Therefore
+    formatting many files doesn't rehash and restage the unchanged ones.
+    Like git does for racily clean index entries, files modified not before
+    the context has been entered are always hashed, because a rewrite within
+    the same timestamp tick doesn't change their modification time.
+
+    Like :py:func:`stage_files` the whole content of a changed file is
+    staged. Use :py:class:`stash_unstaged_changes` to keep unstaged changes
+    of partially staged files out of the index.
+
+    Attributes:
+        changed: Paths of the staged files relative to the root of the
+            repository. Set when the context manager exits.
+
+    Example: ::
+
+        files = get_staged_status()
+        with stash_unstaged_changes(files), stage_changed_files(files):
+            subprocess.run(["formatter", *files], check=True)
+    """
+
+    def __init__(self, files: Iterable[PathLike] | None = None) -> None:
+        """
+        Args:
+            files: Optional iterable of path like objects of files in the
+                index. By default all staged files are considered.
+        """
+        if files is None:
+            files = get_staged_status()
+
+        self._entries = dict(_get_index_entries(files))
+        self._root_path = _get_git_toplevel_path()
+        self._stats: dict[Path, tuple[int, int, int] | None] = {}
+        self._time = 0
+        self.changed: list[Path] = []
+
+    def _stat(self, path: Path) -> tuple[int, int, int] | None:
+        try:
+            st = (self._root_path / path).lstat()
+        except FileNotFoundError:
+            return None
+        return (st.st_ino, st.st_size, st.st_mtime_ns)
+
+    def _is_racily_clean(self, stat: tuple[int, int, int] | None) -> bool:
+        return stat is not None and stat[2] >= self._time
+
+    def _get_changed(self) -> list[Path]:
+        modified = [
+            path
+            for path, stat in self._stats.items()
+            if self._stat(path) != stat or self._is_racily_clean(stat)
+        ]
+        # removed files and files with unusual names are staged unhashed
+        hashable = [
+            path
+            for path in modified
+            if self._stats[path] is not None
+            and (self._root_path / path).is_file()
+            and "\n" not in os.fspath(path)
+        ]
+        if not hashable:
+            return modified
+
+        output = _run_git_with_input(
+            ["-C", str(self._root_path), "hash-object", "--stdin-paths"],
+            "\n".join(os.fspath(path) for path in hashable).encode(),
+        )
+        names = dict(zip(hashable, output.decode().split(), strict=True))
+        return [
+            path
+            for path in modified
+            if path not in names or names[path] != self._entries[path]
+        ]
+
+    def __enter__(self) -> Self:
+        self._stats = {path: self._stat(path) for path in self._entries}
+        self._time = _get_file_system_time(
+            get_repository_context().git_directory_path
+        )
+        self.changed = []
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> Any:
+        if exc_type is not None:
+            return
+
+        self.changed = self._get_changed()
+        if not self.changed:
+            return
+
+        _run_git_with_input(
+            [
+                "-C",
+                str(self._root_path),
+                "update-index",
+                "--add",
+                "--remove",
+                "-z",
+                "--stdin",
+            ],
+            b"".join(os.fsencode(path) + b"\0" for path in self.changed),
+        )
+
+
 def get_diff(files: Iterable[StatusEntry] | None = None) -> str:
     """Get the diff of the passed files
 
@@ -248,6 +691,315 @@ def get_diff(files: Iterable[StatusEntry] | None = None) -> str:
     return exec_git(*args)
 
 
+def _pathspec(path: PathLike) -> str:
+    # paths of status entries are relative to the root of the repository
+    if isinstance(path, StatusEntry):
+        return str(path.absolute_path())
+    return os.fspath(path)
+
+
+_HUNK_HEADER = re.compile(rb"^@@ -\d+(?:,(\d+))? \+(\d+)(?:,(\d+))? @@")
+
+
+def _unquote_diff_path(path: bytes) -> str:
+    """
+    Convert a path from a diff header into a string
+
+    git puts paths containing special characters into quotes and escapes them.
+    Paths containing spaces are terminated by a tab.
+    """
+    path = path.rstrip(b"\t")
+    if path.startswith(b'"') and path.endswith(b'"'):
+        path = codecs.escape_decode(path[1:-1])[0]
+    return os.fsdecode(path)
+
+
+def _parse_diff_git_path(header: bytes) -> str | None:
+    """
+    Get the path from a "diff --git a/<path> b/<path>" header
+
+    Returns:
+        The path or None if the old and the new path differ. In that case the
+        path is taken from the following extended headers.
+    """
+    paths = header[len(b"diff --git ") :]
+    # both paths have the same length if the file hasn't been renamed
+    half = (len(paths) - 1) // 2
+    old_path = _unquote_diff_path(paths[:half])[2:]
+    new_path = _unquote_diff_path(paths[half + 1 :])[2:]
+    return new_path if old_path == new_path else None
+
+
+def _parse_changed_lines(diff: bytes) -> dict[Path, list[range]]:
+    changed_lines: dict[Path, list[range]] = {}
+    path: str | None = None
+    deleted = False
+    current: list[range] = []
+    # number of removed and added lines remaining in the current hunk
+    remaining_old = remaining_new = 0
+
+    def add_file() -> None:
+        if path is not None and not deleted:
+            changed_lines[Path(path)] = current
+
+    for line in diff.split(b"\n"):
+        if remaining_old or remaining_new:
+            # the content of a line may look like a header
+            if line.startswith(b"-"):
+                remaining_old -= 1
+            elif line.startswith(b"+"):
+                remaining_new -= 1
+            elif line.startswith(b" "):
+                remaining_old -= 1
+                remaining_new -= 1
+            continue
+
+        if line.startswith(b"diff --git "):
+            add_file()
+            path = _parse_diff_git_path(line)
+            deleted = False
+            current = []
+        elif line.startswith(b"deleted file mode "):
+            deleted = True
+        elif line.startswith(b"rename to "):
+            path = _unquote_diff_path(line[len(b"rename to ") :])
+        elif line.startswith(b"+++ "):
+            if line[4:] == b"/dev/null":
+                deleted = True
+            else:
+                path = _unquote_diff_path(line[4:])[2:]
+        elif line.startswith(b"@@ "):
+            match = _HUNK_HEADER.match(line)
+            if not match:
+                continue
+
+            remaining_old = 1 if match.group(1) is None else int(match.group(1))
+            start = int(match.group(2))
+            count = 1 if match.group(3) is None else int(match.group(3))
+            remaining_new = count
+            if not count:
+                # only lines have been removed
+                continue
+
+            if current and current[-1].stop == start:
+                # merge adjacent ranges
+                current[-1] = range(current[-1].start, start + count)
+            else:
+                current.append(range(start, start + count))
+
+    add_file()
+    return changed_lines
+
+
+def get_staged_changed_lines(
+    files: Iterable[PathLike] | None = None,
+) -> dict[Path, list[range]]:
+    """Get the line ranges of the staged content that have been changed
+    compared to HEAD.
+
+    The changes of all files are determined with a single git call. Removed
+    lines aren't taken into account. Deleted files are not contained in the
+    result. Files without changed lines (for example binary files or files
+    where only lines have been removed) are mapped to an empty list.
+
+    Arguments:
+        files: (optional) specify an iterable of :py:class:`os.PathLike` and
+            exclude all other paths.
+
+    Returns:
+        A dict mapping the paths of the staged files, relative to the root of
+        the git repository, to a sorted list of ranges of the changed line
+        numbers. Line numbers start at 1.
+
+    Example: ::
+
+        changed_lines = get_staged_changed_lines()
+        for path, ranges in changed_lines.items():
+            for warning in lint(path):
+                if any(warning.line in lines for lines in ranges):
+                    report(warning)
+    """
+    args = [
+        "git",
+        "diff",
+        "--cached",
+        "--unified=0",
+        "--no-color",
+        "--no-ext-diff",
+        "--find-renames",
+        "--src-prefix=a/",
+        "--dst-prefix=b/",
+        # the paths must be relative to the root of the repository
+        "--no-relative",
+    ]
+
+    if files is not None:
+        args.append("--")
+        args.extend([_pathspec(f) for f in files])
+
+    try:
+        diff = subprocess.check_output(args, stderr=subprocess.PIPE)
+    except subprocess.CalledProcessError as e:
+        raise GitError(e.returncode, e.cmd, e.output, e.stderr) from None
+
+    return _parse_changed_lines(diff)
+
+
+def _get_repository_path(path: PathLike, root_path: Path) -> str | None:
+    # the path relative to the root of the repository as listed by git
+    # ls-files or None if the path is outside of the repository
+    if isinstance(path, StatusEntry) and path.root_path == root_path:
+        return path.path.as_posix()
+
+    absolute = Path(os.path.abspath(_pathspec(path)))
+    try:
+        relative = absolute.relative_to(root_path)
+    except ValueError:
+        try:
+            relative = absolute.resolve().relative_to(root_path)
+        except ValueError:
+            return None
+    return relative.as_posix()
+
+
+def _get_index_entries(files: Iterable[PathLike]) -> list[tuple[Path, str]]:
+    """
+    Get the paths and blob object names of the files in the index
+
+    All entries of the index are listed with a single git call and filtered
+    afterwards. Passing many paths as pathspecs to git is slow because
+    matching them is quadratic and may exceed the maximum length of the
+    arguments.
+
+    Returns:
+        A list of tuples containing the path relative to the root of the git
+        repository and the object name of the blob
+    """
+    root_path = _get_git_toplevel_path()
+    paths = {
+        path
+        for path in (_get_repository_path(f, root_path) for f in files)
+        if path is not None
+    }
+    if not paths:
+        return []
+
+    output = exec_git("-C", str(root_path), "ls-files", "--stage", "-z")
+
+    # directories match all files below them
+    everything = "." in paths
+    entries = []
+    for line in output.split("\0"):
+        if not line:
+            continue
+
+        info, path = line.split("\t", 1)
+        mode, name, _ = info.split(" ")
+        if mode == GITLINK_MODE:
+            continue
+
+        if everything or path in paths:
+            entries.append((Path(path), name))
+            continue
+
+        parent = path.rpartition("/")[0]
+        while parent:
+            if parent in paths:
+                entries.append((Path(path), name))
+                break
+            parent = parent.rpartition("/")[0]
+
+    return entries
+
+
+def _write_object_names(stdin: IO[bytes], names: Iterable[str]) -> None:
+    # git may have been stopped already if reading the objects is aborted
+    with suppress(BrokenPipeError, ValueError):
+        try:
+            for name in names:
+                stdin.write(f"{name}\n".encode())
+        finally:
+            stdin.close()
+
+
+def get_staged_contents(
+    files: Iterable[PathLike] | None = None, *, as_memoryview: bool = False
+) -> Iterator[tuple[Path, bytes | memoryview]]:
+    """Read the staged content of files directly from the git index.
+
+    The working tree isn't touched. Therefore the content can be checked
+    without stashing the unstaged changes. All contents are streamed from a
+    single git process.
+
+    Arguments:
+        files: (optional) specify an iterable of :py:class:`os.PathLike` to
+            read. By default the content of all staged files is read.
+        as_memoryview: Return the contents as :py:class:`memoryview` instead of
+            bytes.
+
+    Returns:
+        An iterator of tuples containing the path of the file relative to the
+        root of the git repository and its staged content.
+
+    Example: ::
+
+        for path, content in get_staged_contents(get_staged_status()):
+            check(path, content.decode())
+    """
+    if files is None:
+        files = get_staged_status()
+
+    files = list(files)
+    if not files:
+        return
+
+    entries = _get_index_entries(files)
+    if not entries:
+        return
+
+    process = subprocess.Popen(
+        ["git", "cat-file", "--batch"],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+    )
+    writer = threading.Thread(
+        target=_write_object_names,
+        args=(process.stdin, [name for _, name in entries]),
+        daemon=True,
+    )
+    writer.start()
+
+    stdout: IO[bytes] = process.stdout  # type: ignore[assignment]
+    try:
+        for path, name in entries:
+            header = stdout.readline().split()
+            if len(header) != 3:
+                raise GitError(
+                    1,
+                    process.args,
+                    f"Could not read blob {name} of {path}",
+                )
+
+            size = int(header[2])
+            content: bytes | memoryview
+            if as_memoryview:
+                buffer = bytearray(size)
+                stdout.readinto(buffer)  # type: ignore[attr-defined]
+                content = memoryview(buffer)
+            else:
+                content = stdout.read(size)
+
+            # skip the line feed after the content
+            stdout.read(1)
+
+            yield path, content
+    finally:
+        process.kill()
+        process.wait()
+        stdout.close()
+        writer.join()
+
+
 def _write_tree() -> str:
     """
     Create a tree object from the current index
@@ -328,6 +1080,23 @@ def _apply_diff(patch: bytes) -> None:
         )
 
 
+def _apply_diff_atomically(patch: bytes, *include: str) -> None:
+    with NamedTemporaryFile(mode="wb", buffering=0) as f:
+        f.write(patch)
+
+        # git apply ignores files outside of the current directory
+        exec_git(
+            "-C",
+            str(_get_git_toplevel_path()),
+            "apply",
+            "--whitespace=nowarn",
+            "--recount",
+            "--unidiff-zero",
+            *[f"--include={path}" for path in include],
+            f.name,
+        )
+
+
 INDEX_REF = "refs/autohooks/index"
 WORKING_REF = "refs/autohooks/working"
 
@@ -432,3 +1201,181 @@ class stash_unstaged_changes:  # pylint: disable=invalid-name
                     rootpath = get_project_root_path()
                     for path in rootpath.glob("*.rej"):
                         path.unlink()
+
+
+# directory backed by memory on most Linux systems
+_SHM_PATH = Path("/dev/shm")
+
+# serializes writing snapshots back into the index
+_snapshot_lock = threading.Lock()
+
+# name of the lock file serializing writing snapshots back across processes
+_SNAPSHOT_LOCK_FILE_NAME = "autohooks-snapshot.lock"
+
+
+@contextmanager
+def _lock_snapshot() -> Generator[None, None, None]:
+    # plugins running in worker processes don't share the thread lock
+    with _snapshot_lock:
+        try:
+            import fcntl
+        except ImportError:
+            # worker processes are not supported on these platforms anyway
+            yield
+            return
+
+        lock_path = (
+            get_repository_context().git_directory_path
+            / _SNAPSHOT_LOCK_FILE_NAME
+        )
+        with lock_path.open("ab") as f:
+            fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(f, fcntl.LOCK_UN)
+
+
+def _get_scratch_parent_directory() -> Path | None:
+    if _SHM_PATH.is_dir() and os.access(_SHM_PATH, os.W_OK):
+        return _SHM_PATH
+    return None
+
+
+class staged_snapshot:  # pylint: disable=invalid-name
+    """
+    A context manager that exports the staged content of files into a scratch
+    directory.
+
+    In contrast to :py:class:`stash_unstaged_changes` neither the working tree
+    nor the index are modified while the context is active. Therefore several
+    snapshots can be used concurrently. Changes made to the files in the
+    scratch directory are added to the index with a single index update when
+    the context manager exits. Files modified not before the snapshot has
+    been exported are always rehashed, because a rewrite within the same
+    timestamp tick doesn't change their stat data. Afterwards the changes are applied to the
+    working tree too. If a change conflicts with an unstaged change of a file
+    the working tree of this file is kept untouched.
+
+    By default the scratch directory is created in memory (/dev/shm) if
+    possible.
+
+    Attributes:
+        path: Path to the scratch directory
+        files: Absolute paths of the exported files in the scratch directory
+
+    Example: ::
+
+        with staged_snapshot(get_staged_status()) as snapshot:
+            subprocess.run(["formatter", *snapshot.files], check=True)
+    """
+
+    def __init__(
+        self,
+        files: Iterable[PathLike] | None = None,
+        *,
+        directory: PathLike | None = None,
+    ) -> None:
+        """
+        Args:
+            files: Optional iterable of path like objects to export. By
+                default all staged files are exported. Additional files like
+                config files can be exported too.
+            directory: Optional directory to create the scratch directory in
+        """
+        if files is None:
+            files = get_staged_status()
+
+        self._paths = [path for path, _ in _get_index_entries(files)]
+        self._directory = (
+            Path(directory)
+            if directory is not None
+            else _get_scratch_parent_directory()
+        )
+        self._temp_dir: TemporaryDirectory | None = None
+        self._time = 0
+        self.path = Path()
+        self.files: list[Path] = []
+
+    def _stat(self) -> dict[Path, tuple[int, int, int]]:
+        stats = {}
+        for path in self._paths:
+            try:
+                st = (self.path / path).stat()
+                stats[path] = (st.st_ino, st.st_size, st.st_mtime_ns)
+            except FileNotFoundError:
+                pass
+        return stats
+
+    def _write_back(self, changed: list[Path]) -> None:
+        with _lock_snapshot():
+            index = _write_tree()
+
+            # stage the changed files from the scratch directory
+            exec_git(
+                f"--work-tree={self.path}",
+                "add",
+                "--",
+                *[os.fspath(path) for path in changed],
+            )
+
+            changed_tree = _write_tree()
+            if changed_tree == index:
+                return
+
+            patch = _get_tree_diff(index, changed_tree)
+            try:
+                _apply_diff_atomically(patch)
+            except GitError:
+                # apply the changes for all files without conflicts
+                for path in changed:
+                    try:
+                        _apply_diff_atomically(patch, os.fspath(path))
+                    except GitError:
+                        print(
+                            f"Found conflicts between changes of {path} and "
+                            "local changes. The changes are only staged."
+                        )
+
+    def __enter__(self) -> Self:
+        self._temp_dir = TemporaryDirectory(
+            prefix="autohooks-", dir=self._directory
+        )
+        self.path = Path(self._temp_dir.name)
+        self.files = [self.path / path for path in self._paths]
+
+        if self._paths:
+            exec_git(
+                "-C",
+                str(_get_git_toplevel_path()),
+                "checkout-index",
+                f"--prefix={self.path}{os.sep}",
+                "--",
+                *[os.fspath(path) for path in self._paths],
+            )
+
+        self._stats = self._stat()
+        self._time = _get_file_system_time(self.path)
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> Any:
+        try:
+            if exc_type is None:
+                stats = self._stat()
+                # files exported within the current timestamp tick may have
+                # been rewritten without changing their stat data. they are
+                # rehashed when adding them.
+                changed = [
+                    path
+                    for path, stat in stats.items()
+                    if self._stats.get(path) != stat or stat[2] >= self._time
+                ]
+                if changed:
+                    self._write_back(changed)
+        finally:
+            self._temp_dir.cleanup()  # type: ignore[union-attr]
@@ -0,0 +1,160 @@
+# SPDX-FileCopyrightText: 2026 Greenbone AG
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+"""
+Plugin API for processing work units in parallel
+"""
+
+import math
+import os
+from collections.abc import Callable, Iterable, Sequence
+from typing import TYPE_CHECKING, TypeVar
+
+from autohooks.precommit.run import ReportProgress
+
+if TYPE_CHECKING:
+    from concurrent.futures import Executor, Future
+
+__all__ = [
+    "get_worker_count",
+    "parallel_map",
+]
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+# number of chunks created per worker by default
+_CHUNKS_PER_WORKER = 4
+
+
+def get_worker_count() -> int:
+    """
+    Returns the number of CPUs usable by the current process
+    """
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def _map_chunk(func: Callable[[T], R], chunk: Sequence[T]) -> list[R]:
+    return [func(item) for item in chunk]
+
+
+def _chunk(items: Sequence[T], chunksize: int) -> list[Sequence[T]]:
+    return [
+        items[start : start + chunksize]
+        for start in range(0, len(items), chunksize)
+    ]
+
+
+def parallel_map(
+    func: Callable[[T], R],
+    items: Iterable[T],
+    *,
+    report_progress: ReportProgress | None = None,
+    workers: int | None = None,
+    chunksize: int | None = None,
+    threads: bool = False,
+) -> list[R]:
+    """
+    Call a function for each item in parallel
+
+    The items are split into chunks which are distributed to a pool of
+    processes or threads. The results are returned in the order of the items.
+
+    Arguments:
+        func: Function to call for each item. If processes are used the
+            function and the items must be picklable, for example the function
+            must be defined at the module level.
+        items: Items to process. Most of the time these are the files to
+            process.
+        report_progress: Optional ReportProgress instance passed to the
+            precommit function. If set the progress is initialized with the
+            number of items and updated whenever a chunk has been processed.
+        workers: Number of processes or threads to use. By default the number
+            of available CPUs.
+        chunksize: Number of items to process per task. By default the items
+            are split into a few chunks per worker.
+        threads: Use threads instead of processes. Threads are preferable if
+            the function mostly waits, for example on a subprocess.
+
+    Returns:
+        A list containing the result of the function for each item
+
+    Example: ::
+
+        from autohooks.api.git import get_staged_status
+        from autohooks.api.parallel import parallel_map
+
+        def lint(path):
+            ...
+            return 0
+
+        def precommit(report_progress, **kwargs):
+            files = [f.absolute_path() for f in get_staged_status()]
+            results = parallel_map(lint, files, report_progress=report_progress)
+            return 1 if any(results) else 0
+    """
+    items = list(items)
+
+    if report_progress:
+        report_progress.init(len(items))
+
+    if not items:
+        return []
+
+    if workers is None:
+        workers = get_worker_count()
+
+    workers = max(1, min(workers, len(items)))
+
+    if chunksize is None:
+        chunksize = math.ceil(len(items) / (workers * _CHUNKS_PER_WORKER))
+
+    chunks = _chunk(items, max(1, chunksize))
+
+    if workers == 1:
+        results: list[R] = []
+        for chunk in chunks:
+            results.extend(_map_chunk(func, chunk))
+            if report_progress:
+                report_progress.update(len(chunk))
+        return results
+
+    # the pools are imported only if they are used to keep the hooks starting
+    # fast
+    from concurrent.futures import (
+        FIRST_EXCEPTION,
+        ProcessPoolExecutor,
+        ThreadPoolExecutor,
+        wait,
+    )
+
+    executor: Executor
+    if threads:
+        executor = ThreadPoolExecutor(max_workers=workers)
+    else:
+        executor = ProcessPoolExecutor(max_workers=workers)
+
+    with executor:
+        futures: dict[Future, Sequence[T]] = {
+            executor.submit(_map_chunk, func, chunk): chunk for chunk in chunks
+        }
+        not_done: Iterable[Future] = futures.keys()
+        while not_done:
+            done, not_done = wait(not_done, return_when=FIRST_EXCEPTION)
+            for future in done:
+                if future.exception():
+                    for pending in not_done:
+                        pending.cancel()
+                    raise future.exception()  # type: ignore[misc]
+
+                if report_progress:
+                    report_progress.update(len(futures[future]))
+
+        results = []
+        for future in futures:
+            results.extend(future.result())
+
+    return results
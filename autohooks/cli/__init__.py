@@ -5,11 +5,13 @@
 
 import argparse
 import sys
+from pathlib import Path
 
 import shtab
 
 from autohooks.__version__ import __version__ as version
 from autohooks.cli.activate import install_hooks
+from autohooks.cli.cache import cache, cache_stats, clear_cache, prune_cache
 from autohooks.cli.check import check_hooks
 from autohooks.cli.plugins import (
     add_plugins,
@@ -17,6 +19,13 @@ from autohooks.cli.plugins import (
     plugins,
     remove_plugins,
 )
+from autohooks.cli.run import (
+    merge_run_reports,
+    parse_jobs,
+    parse_shard,
+    run_hooks,
+)
+from autohooks.cli.watch import watch_files
 from autohooks.settings import Mode
 from autohooks.terminal import Terminal
 
@@ -62,6 +71,138 @@ def main():
     )
     check_parser.set_defaults(func=check_hooks)
 
+    run_parser = subparsers.add_parser(
+        "run",
+        help="Run the pre-commit plugins without committing, for example in "
+        "a CI pipeline.",
+    )
+    files_group = run_parser.add_mutually_exclusive_group()
+    files_group.add_argument(
+        "--staged",
+        action="store_true",
+        help="Run the plugins on the staged files. This is the default.",
+    )
+    files_group.add_argument(
+        "--all-files",
+        action="store_true",
+        help="Run the plugins on all tracked files.",
+    )
+    files_group.add_argument(
+        "--files",
+        nargs="+",
+        metavar="FILE",
+        help="Run the plugins on the tracked files matching FILE.",
+    )
+    files_group.add_argument(
+        "--from-ref",
+        metavar="REF",
+        help="Run the plugins on the files changed since the merge base of "
+        "REF and --to-ref instead of the staged files.",
+    )
+    run_parser.add_argument(
+        "--to-ref",
+        metavar="REF",
+        default="HEAD",
+        help="Commit containing the changes to check if --from-ref is used. "
+        "Default: %(default)s",
+    )
+    run_parser.add_argument(
+        "-j",
+        "--jobs",
+        type=parse_jobs,
+        metavar="N",
+        help="Number of worker processes to run the plugins in. 0 runs the "
+        "plugins sequentially. Overrides the workers setting.",
+    )
+    run_parser.add_argument(
+        "--plugin",
+        dest="plugins",
+        action="append",
+        metavar="NAME",
+        help="Only run the configured plugin NAME. Can be passed multiple "
+        "times.",
+    )
+    run_parser.add_argument(
+        "--shard",
+        type=parse_shard,
+        metavar="NUMBER/COUNT",
+        help="Split the files into COUNT shards and only check the files of "
+        "shard NUMBER, e.g. 1/4. The shards are the same on all machines.",
+    )
+    run_parser.add_argument(
+        "--report",
+        type=Path,
+        metavar="FILE",
+        help="Store the results of the plugins as JSON report in FILE.",
+    )
+    run_parser.set_defaults(func=run_hooks)
+
+    merge_reports_parser = subparsers.add_parser(
+        "merge-reports",
+        help="Combine the reports of several 'autohooks run --shard' runs.",
+    )
+    merge_reports_parser.add_argument(
+        "reports",
+        nargs="+",
+        type=Path,
+        metavar="REPORT",
+        help="Reports to merge",
+    )
+    merge_reports_parser.add_argument(
+        "-o",
+        "--output",
+        type=Path,
+        metavar="FILE",
+        help="Store the merged report in FILE.",
+    )
+    merge_reports_parser.set_defaults(func=merge_run_reports)
+
+    watch_parser = subparsers.add_parser(
+        "watch",
+        help="Check the changed files in the background whenever files are "
+        "saved and cache the results for the next commit.",
+    )
+    watch_parser.add_argument(
+        "--debounce",
+        type=float,
+        default=0.5,
+        metavar="SECONDS",
+        help="Seconds without further changes before running the plugins. "
+        "Default: %(default)s",
+    )
+    watch_parser.add_argument(
+        "--poll",
+        action="store_true",
+        help="Poll the working tree for changes instead of using inotify.",
+    )
+    watch_parser.set_defaults(func=watch_files)
+
+    cache_parser = subparsers.add_parser(
+        "cache", help="Manage the result cache of the plugins"
+    )
+    cache_parser.set_defaults(func=cache)
+
+    cache_subparsers = cache_parser.add_subparsers(
+        dest="subcommand", required=True
+    )
+
+    cache_stats_parser = cache_subparsers.add_parser(
+        "stats", help="Show the size and the hit rate of the cache."
+    )
+    cache_stats_parser.set_defaults(cache_func=cache_stats)
+
+    prune_cache_parser = cache_subparsers.add_parser(
+        "prune",
+        help="Remove the expired and least recently used entries exceeding "
+        "the limits of the cache.",
+    )
+    prune_cache_parser.set_defaults(cache_func=prune_cache)
+
+    clear_cache_parser = cache_subparsers.add_parser(
+        "clear", help="Remove all entries and statistics of the cache."
+    )
+    clear_cache_parser.set_defaults(cache_func=clear_cache)
+
     plugins_parser = subparsers.add_parser(
         "plugins", help="Manage autohooks plugins"
     )
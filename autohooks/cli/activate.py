@@ -6,10 +6,11 @@
 from argparse import Namespace
 
 from autohooks.config import (
+    AutohooksConfig,
     get_pyproject_toml_path,
     load_config_from_pyproject_toml,
 )
-from autohooks.hooks import PreCommitHook
+from autohooks.hooks import ADDITIONAL_HOOKS, PreCommitHook
 from autohooks.settings import AutohooksSettings, Mode
 from autohooks.terminal import Terminal
 
@@ -19,6 +20,11 @@ def install_hooks(term: Terminal, args: Namespace) -> None:
     pyproject_toml = get_pyproject_toml_path()
     config = load_config_from_pyproject_toml(pyproject_toml)
 
+    if args.mode:
+        mode = Mode.from_string(args.mode)
+    else:
+        mode = config.get_mode().get_effective_mode()
+
     if pre_commit_hook.exists() and not args.force:
         term.warning(
             "autohooks pre-commit hook is already"
@@ -35,11 +41,6 @@ def install_hooks(term: Terminal, args: Namespace) -> None:
                 "the installed pre-commit hook."
             )
     else:
-        if args.mode:
-            mode = Mode.from_string(args.mode)
-        else:
-            mode = config.get_mode().get_effective_mode()
-
         if not config.has_autohooks_config():
             settings = AutohooksSettings(mode=mode)
             config.settings = settings
@@ -59,3 +60,33 @@ def install_hooks(term: Terminal, args: Namespace) -> None:
             f"autohooks pre-commit hook installed at {pre_commit_hook}"
             f" using {mode} mode."
         )
+
+    install_additional_hooks(term, config, mode, force=args.force)
+
+
+def install_additional_hooks(
+    term: Terminal, config: AutohooksConfig, mode: Mode, *, force: bool
+) -> None:
+    """
+    Install the pre-push, commit-msg, post-checkout and post-merge hooks if
+    plugins are configured for them
+    """
+    for hook_class in ADDITIONAL_HOOKS:
+        if not config.get_script_names(hook_class.name):
+            continue
+
+        hook = hook_class()
+        if hook.exists() and not force:
+            if not hook.is_autohooks_hook():
+                term.warning(
+                    f"A different {hook.name} hook is already installed at "
+                    f"{hook}. Run 'autohooks activate --force' to override "
+                    "it."
+                )
+            continue
+
+        hook.write(mode=mode)
+
+        term.ok(
+            f"autohooks {hook.name} hook installed at {hook} using {mode} mode."
+        )
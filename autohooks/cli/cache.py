@@ -0,0 +1,91 @@
+# SPDX-FileCopyrightText: 2026 Greenbone AG
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+
+from argparse import Namespace
+
+from autohooks.config import load_config_from_pyproject_toml
+from autohooks.precommit.cache import ResultCache
+from autohooks.terminal import Terminal
+
+
+def cache(term: Terminal, args: Namespace) -> None:
+    args.cache_func(term, args)
+
+
+def format_size(size: float) -> str:
+    """
+    Format a size in bytes for humans, e.g. 1.5 MiB
+    """
+    for unit in ("B", "KiB", "MiB"):
+        if size < 1024:
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GiB"
+
+
+def format_duration(seconds: float) -> str:
+    """
+    Format a duration in seconds for humans, e.g. 30 days
+    """
+    for unit, length in (("day", 86400), ("hour", 3600), ("minute", 60)):
+        if seconds >= length and seconds % length == 0:
+            count = int(seconds // length)
+            return f"{count} {unit}{'s' if count != 1 else ''}"
+    return f"{seconds:g} seconds"
+
+
+def _get_result_cache() -> ResultCache:
+    return ResultCache.from_config(load_config_from_pyproject_toml())
+
+
+# pylint: disable=unused-argument
+def cache_stats(term: Terminal, args: Namespace) -> None:
+    """
+    CLI handler function to show the usage and the statistics of the cache
+    """
+    config = load_config_from_pyproject_toml()
+    result_cache = ResultCache.from_config(config)
+    count, size = result_cache.usage()
+    statistics = result_cache.get_statistics()
+    max_size = result_cache.local.max_size
+    max_age = result_cache.local.max_age
+
+    term.info(f"Location: {result_cache.path}")
+    term.info(f"Entries: {count}")
+    term.info(
+        f"Size: {format_size(size)}"
+        + (f" of {format_size(max_size)}" if max_size else "")
+    )
+    term.info(
+        "Maximum age: " + (format_duration(max_age) if max_age else "unlimited")
+    )
+    term.info(
+        f"Hits: {statistics.hits}, misses: {statistics.misses} "
+        f"({statistics.hit_rate:.0%} hit rate)"
+    )
+    shared_location = config.get_shared_cache_location()
+    if shared_location:
+        term.info(f"Shared cache: {shared_location}")
+
+
+# pylint: disable=unused-argument
+def prune_cache(term: Terminal, args: Namespace) -> None:
+    """
+    CLI handler function to remove the expired and least recently used cache
+    entries exceeding the limits
+    """
+    count, size = _get_result_cache().evict(force=True)
+    term.ok(f"Removed {count} cache entries ({format_size(size)}).")
+
+
+# pylint: disable=unused-argument
+def clear_cache(term: Terminal, args: Namespace) -> None:
+    """
+    CLI handler function to remove all cache entries and the statistics
+    """
+    result_cache = _get_result_cache()
+    count, size = result_cache.clear()
+    result_cache.reset_statistics()
+    term.ok(f"Removed {count} cache entries ({format_size(size)}).")
@@ -8,15 +8,19 @@ from pathlib import Path
 
 from autohooks.config import (
     AUTOHOOKS_SECTION,
+    AutohooksConfig,
     get_pyproject_toml_path,
     load_config_from_pyproject_toml,
 )
-from autohooks.hooks import PreCommitHook
+from autohooks.hooks import ADDITIONAL_HOOKS, PreCommitHook
 from autohooks.precommit.run import (
     CheckPluginError,
     CheckPluginWarning,
     autohooks_module_path,
     check_plugin,
+    check_settings,
+    get_plugin_function,
+    load_plugin,
 )
 from autohooks.settings import Mode
 from autohooks.terminal import Terminal
@@ -31,6 +35,11 @@ def check_hooks(term: Terminal, args: Namespace) -> None:
 
     check_config(term, pyproject_toml, pre_commit_hook)
 
+    if pyproject_toml.exists():
+        check_additional_hooks(
+            term, load_config_from_pyproject_toml(pyproject_toml)
+        )
+
 
 def check_pre_commit_hook(
     term: Terminal, pre_commit_hook: PreCommitHook
@@ -86,6 +95,8 @@ def check_config(
                 f' Please add a "{AUTOHOOKS_SECTION}" section.'
             )
         elif pre_commit_hook.exists():
+            check_settings(term, config)
+
             config_mode = config.get_mode()
             hook_mode = pre_commit_hook.read_mode()
 
@@ -130,3 +141,50 @@ def check_config(
                                 term.info(str(result))
                         else:
                             term.ok(f'Plugin "{name}" active and loadable.')
+
+
+def check_additional_hooks(term: Terminal, config: AutohooksConfig) -> None:
+    """
+    Check the pre-push, commit-msg, post-checkout and post-merge hooks and
+    their plugins if plugins are configured for them
+    """
+    for hook_class in ADDITIONAL_HOOKS:
+        names = config.get_script_names(hook_class.name)
+        if not names:
+            continue
+
+        hook = hook_class()
+        if not hook.exists() or not hook.is_autohooks_hook():
+            term.error(
+                f"autohooks {hook.name} hook is not active. Please run "
+                "'autohooks activate'."
+            )
+            continue
+
+        if hook.is_current_autohooks_hook():
+            term.ok(f"autohooks {hook.name} hook is active and up-to-date.")
+        else:
+            term.warning(
+                f"autohooks {hook.name} hook is outdated. Please run "
+                "'autohooks activate --force' to update it."
+            )
+
+        with autohooks_module_path():
+            for name in names:
+                try:
+                    plugin = load_plugin(name)
+                except ImportError as e:
+                    term.error(f'"{name}" is not a valid autohooks plugin. {e}')
+                    continue
+
+                if get_plugin_function(plugin, hook.function_names):
+                    term.ok(
+                        f'Plugin "{name}" active and loadable for the '
+                        f"{hook.name} hook."
+                    )
+                else:
+                    term.error(
+                        f'Plugin "{name}" has no '
+                        f"{' or '.join(hook.function_names)} function. It "
+                        f"can't be run by the {hook.name} hook."
+                    )
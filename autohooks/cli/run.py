@@ -0,0 +1,159 @@
+# SPDX-FileCopyrightText: 2026 Greenbone AG
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+
+import sys
+from argparse import ArgumentTypeError, Namespace
+from pathlib import Path
+
+from autohooks.api.git import get_staged_status
+from autohooks.config import load_config_from_pyproject_toml, parse_workers
+from autohooks.precommit.report import Report, get_missing_shards, merge_reports
+from autohooks.precommit.run import check_settings, run_plugins
+from autohooks.precommit.shard import shard_by_hash
+from autohooks.settings import AutohooksSettings
+from autohooks.terminal import Terminal, _set_terminal
+from autohooks.utils import GitError, exec_git, get_repository_context
+
+
+def parse_shard(value: str) -> tuple[int, int]:
+    """
+    Parse a shard argument like 2/4 into a tuple of the shard number and the
+    number of shards
+    """
+    try:
+        number, count = (int(part) for part in value.split("/"))
+    except ValueError:
+        raise ArgumentTypeError(
+            f"Invalid shard {value}. Expected NUMBER/COUNT, e.g. 1/4."
+        ) from None
+
+    if not 1 <= number <= count:
+        raise ArgumentTypeError(
+            f"Invalid shard {value}. The number must be between 1 and {count}."
+        )
+
+    return number, count
+
+
+def parse_jobs(value: str) -> int:
+    """
+    Parse the number of worker processes passed via --jobs
+    """
+    try:
+        return parse_workers(value)
+    except ValueError as e:
+        raise ArgumentTypeError(str(e)) from None
+
+
+def _verify_commit(term: Terminal, ref: str) -> bool:
+    try:
+        exec_git("rev-parse", "--verify", "--quiet", f"{ref}^{{commit}}")
+        return True
+    except GitError:
+        term.error(f"{ref} is not a valid commit.")
+        return False
+
+
+def _select_plugins(
+    term: Terminal, config: AutohooksSettings, plugins: list[str]
+) -> bool:
+    configured = list(config.pre_commit)
+    for plugin in plugins:
+        if plugin not in configured:
+            term.error(f"Plugin {plugin} is not configured.")
+            return False
+
+    config.pre_commit = plugins
+    return True
+
+
+def run_hooks(term: Terminal, args: Namespace) -> None:
+    config = load_config_from_pyproject_toml()
+    if not config.settings:
+        term.error(
+            "No autohooks configuration found. Please add a "
+            '"tool.autohooks" section to the pyproject.toml file.'
+        )
+        sys.exit(1)
+
+    check_settings(term, config)
+
+    if args.plugins and not _select_plugins(
+        term, config.settings, args.plugins
+    ):
+        sys.exit(1)
+
+    if args.jobs is not None:
+        config.settings.workers = args.jobs
+
+    context = get_repository_context()
+    context.fsmonitor = config.has_fsmonitor_enabled()
+
+    title = "staged files"
+    if args.all_files:
+        context.tracked_files = []
+        title = "all files"
+    elif args.files:
+        context.tracked_files = [Path(f) for f in args.files]
+        title = "selected files"
+    elif args.from_ref:
+        if not _verify_commit(term, args.from_ref) or not _verify_commit(
+            term, args.to_ref
+        ):
+            sys.exit(1)
+
+        context.commit_range = (args.from_ref, args.to_ref)
+        title = f"{args.from_ref}...{args.to_ref}"
+
+    report = Report()
+    if args.shard:
+        number, count = args.shard
+        # all nodes determine the same shards from the paths of the files
+        context.status_list = shard_by_hash(get_staged_status(), number, count)
+        report.shards.append(args.shard)
+        title = f"{title} (shard {number}/{count})"
+
+    if args.report:
+        report.files = [entry.path.as_posix() for entry in get_staged_status()]
+
+    _set_terminal(term)
+
+    retval = run_plugins(term, config, title=title, report=report)
+
+    if args.report:
+        report.write(args.report)
+
+    if retval:
+        sys.exit(retval)
+
+
+def merge_run_reports(term: Terminal, args: Namespace) -> None:
+    try:
+        report = merge_reports(Report.read(path) for path in args.reports)
+    except (OSError, ValueError) as e:
+        term.error(f"Could not read report. {e}")
+        sys.exit(1)
+
+    for plugin in report.plugins:
+        message = f"{plugin.name} ({plugin.duration:.2f}s)"
+        if plugin.result:
+            term.fail(message)
+        else:
+            term.ok(message)
+
+    missing = get_missing_shards(report)
+    if missing:
+        term.warning(
+            "Missing reports of shard(s) "
+            f"{', '.join(f'{number}/{count}' for number, count in missing)}."
+        )
+
+    if args.output:
+        report.write(args.output)
+
+    if report.result:
+        sys.exit(report.result)
+    if missing:
+        sys.exit(1)
@@ -0,0 +1,67 @@
+# SPDX-FileCopyrightText: 2026 Greenbone AG
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+
+import sys
+from argparse import Namespace
+
+from autohooks.config import load_config_from_pyproject_toml
+from autohooks.precommit.metadata import get_plugin_metadata
+from autohooks.precommit.run import autohooks_module_path, load_plugin
+from autohooks.precommit.watch import get_watcher, watch
+from autohooks.terminal import Terminal, _set_terminal
+from autohooks.utils import get_repository_context
+
+
+def _keeps_files(name: str) -> bool:
+    # plugins without metadata may change files
+    with autohooks_module_path():
+        try:
+            metadata = get_plugin_metadata(load_plugin(name))
+        except ImportError:
+            return False
+    return metadata is not None and not metadata.mutates_files
+
+
+def watch_files(term: Terminal, args: Namespace) -> None:
+    config = load_config_from_pyproject_toml()
+    if not config.settings:
+        term.error(
+            "No autohooks configuration found. Please add a "
+            '"tool.autohooks" section to the pyproject.toml file.'
+        )
+        sys.exit(1)
+
+    # only plugins whose results are cached are useful to run in the
+    # background. plugins which may change files must not touch the work of
+    # the developer while it is edited.
+    cache_plugins = config.get_cache_plugin_names()
+    plugins = [
+        name
+        for name in config.settings.pre_commit
+        if name in cache_plugins and _keeps_files(name)
+    ]
+    if not plugins:
+        term.error(
+            "No plugins to watch. Please add the pre-commit plugins to the "
+            '"plugins" setting of the "tool.autohooks.cache" section. Only '
+            "plugins declaring in their metadata that they don't change "
+            "files are run."
+        )
+        sys.exit(1)
+
+    config.settings.pre_commit = plugins
+
+    context = get_repository_context()
+    context.fsmonitor = config.has_fsmonitor_enabled()
+
+    _set_terminal(term)
+
+    path = context.toplevel_path
+    term.info(f"Watching {path} for changes. Press Ctrl+C to stop.")
+    try:
+        with get_watcher(path, polling=args.poll) as watcher:
+            watch(term, config, watcher, debounce=args.debounce)
+    except KeyboardInterrupt:
+        pass
@@ -3,6 +3,10 @@
 # SPDX-License-Identifier: GPL-3.0-or-later
 #
 
+import hashlib
+import json
+import re
+from collections.abc import Callable
 from pathlib import Path
 from typing import Any
 
@@ -13,6 +17,99 @@ from autohooks.utils import get_pyproject_toml_path, is_split_env
 
 AUTOHOOKS_SECTION = "tool.autohooks"
 
+_SIZE_UNITS = {
+    "": 1,
+    "b": 1,
+    "kb": 1000,
+    "mb": 1000**2,
+    "gb": 1000**3,
+    "kib": 1024,
+    "mib": 1024**2,
+    "gib": 1024**3,
+}
+
+_DURATION_UNITS = {"": 1, "s": 1, "m": 60, "h": 60 * 60, "d": 24 * 60 * 60}
+
+
+def parse_size(value: int | str) -> int:
+    """
+    Parse a size like 500MB or 1GiB into bytes
+
+    Raises:
+        ValueError: If the size is invalid
+    """
+    if isinstance(value, int):
+        return value
+
+    match = (
+        re.fullmatch(r"\s*(\d+)\s*([a-zA-Z]*)\s*", value)
+        if isinstance(value, str)
+        else None
+    )
+    unit = match.group(2).lower() if match else None
+    if not match or unit not in _SIZE_UNITS:
+        raise ValueError(f"Invalid size {value!r}. Expected e.g. 500MB.")
+    return int(match.group(1)) * _SIZE_UNITS[unit]
+
+
+def parse_duration(value: int | str) -> int:
+    """
+    Parse a duration like 30d or 12h into seconds
+
+    Raises:
+        ValueError: If the duration is invalid
+    """
+    if isinstance(value, int):
+        return value
+
+    match = (
+        re.fullmatch(r"\s*(\d+)\s*([a-zA-Z]*)\s*", value)
+        if isinstance(value, str)
+        else None
+    )
+    unit = match.group(2).lower() if match else None
+    if not match or unit not in _DURATION_UNITS:
+        raise ValueError(f"Invalid duration {value!r}. Expected e.g. 30d.")
+    return int(match.group(1)) * _DURATION_UNITS[unit]
+
+
+def parse_workers(value: int | str) -> int:
+    """
+    Parse the number of worker processes
+
+    Raises:
+        ValueError: If the number is invalid
+    """
+    try:
+        workers = int(value)
+    except (TypeError, ValueError):
+        workers = -1
+    if workers < 0:
+        raise ValueError(
+            f"Invalid number of workers {value!r}. Expected e.g. 4."
+        )
+    return workers
+
+
+def _parse_setting(
+    invalid_settings: list[str],
+    section: str,
+    key: str,
+    value: Any,
+    parser: Callable[[Any], Any],
+    default: Any = None,
+) -> Any:
+    # invalid settings are reported and replaced by their defaults
+    if value is None:
+        return default
+    try:
+        return parser(value)
+    except ValueError as e:
+        invalid_settings.append(
+            f'Ignoring invalid "{key}" setting in [{section}]. {e}'
+        )
+        return default
+
 
 class Config:
     """
@@ -27,6 +124,7 @@ class Config:
             config_dict: Dictionary to be used for the Config.
         """
         self._config_dict = config_dict or {}
+        self._hash: str | None = None
 
     def get(self, *keys: str) -> "Config":
         """
@@ -77,6 +175,23 @@ class Config:
         """
         return key in self._config_dict
 
+    def hash(self) -> str:
+        """
+        Returns a stable hash of the config data
+
+        Configs containing the same data have the same hash independent of
+        the order of the keys. The hash is computed only once.
+        """
+        if self._hash is None:
+            content = json.dumps(
+                self._config_dict,
+                sort_keys=True,
+                separators=(",", ":"),
+                default=str,
+            )
+            self._hash = hashlib.sha256(content.encode("utf8")).hexdigest()
+        return self._hash
+
 
 def _gather_mode(mode_string: str | None) -> Mode:
     """
@@ -96,25 +211,112 @@ def _gather_mode(mode_string: str | None) -> Mode:
     return mode
 
 
+def _plugin_config_keys(name: str) -> tuple[str, ...]:
+    # the plugins of a package like autohooks.plugins.ruff.check share the
+    # section of the package
+    parts = name.split(".")
+    if len(parts) > 2 and parts[:2] == ["autohooks", "plugins"]:
+        return ("tool", "autohooks", "plugins", parts[2])
+    return ("tool", "autohooks", "plugins", parts[-1])
+
+
 class AutohooksConfig:
     def __init__(
         self,
         *,
         settings: AutohooksSettings | None = None,
         config: Config | None = None,
+        invalid_settings: list[str] | None = None,
     ) -> None:
         self.config = Config() if config is None else config
         self.settings = settings
+        self.invalid_settings = invalid_settings or []
+        self._hashes: dict[tuple[str, ...], str] = {}
 
     def get_config(self) -> Config:
         return self.config
 
+    def get_config_hash(self, *keys: str) -> str:
+        """
+        Returns the hash of a sub-config, e.g. of the [tool.pylint] section
+
+        The hashes are memoized.
+
+        Args:
+            *keys: Variable length of keys to resolve the sub-config.
+        """
+        config_hash = self._hashes.get(keys)
+        if config_hash is None:
+            config_hash = self.config.get(*keys).hash()
+            self._hashes[keys] = config_hash
+        return config_hash
+
+    def get_plugin_config(self, name: str) -> Config:
+        """
+        Returns the settings of a plugin
+
+        The settings of a plugin are in the [tool.autohooks.plugins.<name>]
+        section. For plugins in a package like autohooks.plugins.pylint the
+        last part of the name is used. The plugins of a package like
+        autohooks.plugins.ruff.check and autohooks.plugins.ruff.format use
+        the section of the package, e.g. [tool.autohooks.plugins.ruff].
+
+        Args:
+            name: Name of the plugin
+        """
+        return self.config.get(*_plugin_config_keys(name))
+
+    def get_plugin_config_hash(self, name: str) -> str:
+        """
+        Returns the memoized hash of the settings of a plugin
+
+        Args:
+            name: Name of the plugin
+        """
+        return self.get_config_hash(*_plugin_config_keys(name))
+
+    def get_invalid_settings(self) -> list[str]:
+        """
+        Returns messages describing the invalid settings which have been
+        replaced by their defaults
+        """
+        return list(self.invalid_settings)
+
     def has_autohooks_config(self) -> bool:
         return self.settings is not None
 
     def get_pre_commit_script_names(self) -> list[str]:
         return self.settings.pre_commit if self.has_autohooks_config() else []  # type: ignore # pylint:disable
 
+    def get_script_names(self, hook_name: str) -> list[str]:
+        """
+        Returns the plugins configured for a git hook
+
+        Args:
+            hook_name: Name of the git hook, e.g. "pre-commit" or "pre-push"
+        """
+        if not self.has_autohooks_config():
+            return []
+
+        if hook_name == "pre-commit":
+            return list(self.settings.pre_commit)  # type: ignore
+        if hook_name == "pre-push":
+            return list(self.settings.pre_push)  # type: ignore
+        if hook_name == "commit-msg":
+            return list(self.settings.commit_msg)  # type: ignore
+        if hook_name in ("post-checkout", "post-merge"):
+            # the cached pre-commit plugins are run to warm up the cache
+            return (
+                [
+                    name
+                    for name in self.settings.pre_commit  # type: ignore
+                    if name in self.settings.cache_plugins  # type: ignore
+                ]
+                if self.settings.warm_cache  # type: ignore
+                else []
+            )
+        return []
+
     def get_mode(self) -> Mode:
         return (
             self.settings.mode  # type: ignore
@@ -122,6 +324,71 @@ class AutohooksConfig:
             else Mode.UNDEFINED
         )
 
+    def get_workers(self) -> int:
+        """
+        Number of worker processes to run the plugins in. 0 means the plugins
+        are run within the hook process.
+        """
+        return self.settings.workers if self.has_autohooks_config() else 0  # type: ignore
+
+    def get_shard_plugin_names(self) -> list[str]:
+        """
+        Returns the plugins whose files may be split into shards checked in
+        parallel by several worker processes
+        """
+        if not self.has_autohooks_config():
+            return []
+        return list(self.settings.shard_plugins)  # type: ignore
+
+    def get_cache_plugin_names(self) -> list[str]:
+        """
+        Returns the plugins whose successful results are cached for the
+        contents of the checked files
+        """
+        if not self.has_autohooks_config():
+            return []
+        return list(self.settings.cache_plugins)  # type: ignore
+
+    def get_cache_max_size(self) -> int | None:
+        """
+        Returns the maximum size of the local result cache in bytes or None if
+        the default size should be used
+        """
+        if not self.has_autohooks_config():
+            return None
+        return self.settings.cache_max_size  # type: ignore
+
+    def get_cache_max_age(self) -> int | None:
+        """
+        Returns the number of seconds after which unused entries of the local
+        result cache are removed or None if entries don't expire
+        """
+        if not self.has_autohooks_config():
+            return None
+        return self.settings.cache_max_age  # type: ignore
+
+    def get_shared_cache_location(self) -> str | None:
+        """
+        Returns the path of the directory or the URL of the HTTP content store
+        of the result cache shared with other developers and CI jobs
+        """
+        if not self.has_autohooks_config():
+            return None
+        return self.settings.shared_cache  # type: ignore
+
+    def has_submodules_enabled(self) -> bool:
+        """
+        Returns True if the pre-commit hooks of the submodules should be run
+        """
+        return self.has_autohooks_config() and self.settings.submodules  # type: ignore
+
+    def has_fsmonitor_enabled(self) -> bool:
+        """
+        Returns True if the file system monitor of git should be used for
+        querying the status of the working tree
+        """
+        return self.has_autohooks_config() and self.settings.fsmonitor  # type: ignore
+
     @staticmethod
     def from_dict(config_dict: dict[str, Any]) -> "AutohooksConfig":
         """
@@ -135,14 +402,51 @@ class AutohooksConfig:
         """
         config = Config(config_dict)
         autohooks_dict = config.get("tool", "autohooks")
+        invalid_settings: list[str] = []
         if autohooks_dict.is_empty():
             settings = None
         else:
+            cache_dict = autohooks_dict.get("cache")
+            cache_section = f"{AUTOHOOKS_SECTION}.cache"
             settings = AutohooksSettings(
                 mode=_gather_mode(autohooks_dict.get_value("mode")),
                 pre_commit=autohooks_dict.get_value("pre-commit", []),
+                pre_push=autohooks_dict.get_value("pre-push", []),
+                commit_msg=autohooks_dict.get_value("commit-msg", []),
+                workers=_parse_setting(
+                    invalid_settings,
+                    AUTOHOOKS_SECTION,
+                    "workers",
+                    autohooks_dict.get_value("workers"),
+                    parse_workers,
+                    0,
+                ),
+                shard_plugins=autohooks_dict.get_value("shard-plugins", []),
+                cache_plugins=cache_dict.get_value("plugins", []),
+                warm_cache=bool(cache_dict.get_value("warm", False)),
+                shared_cache=cache_dict.get_value("shared"),
+                cache_max_size=_parse_setting(
+                    invalid_settings,
+                    cache_section,
+                    "max-size",
+                    cache_dict.get_value("max-size"),
+                    parse_size,
+                ),
+                cache_max_age=_parse_setting(
+                    invalid_settings,
+                    cache_section,
+                    "max-age",
+                    cache_dict.get_value("max-age"),
+                    parse_duration,
+                ),
+                submodules=bool(autohooks_dict.get_value("submodules", False)),
+                fsmonitor=bool(autohooks_dict.get_value("fsmonitor", False)),
             )
-        return AutohooksConfig(settings=settings, config=config)
+        return AutohooksConfig(
+            settings=settings,
+            config=config,
+            invalid_settings=invalid_settings,
+        )
 
     @staticmethod
     def from_string(content: str) -> "AutohooksConfig":
@@ -16,45 +16,67 @@ from autohooks.template import (
     TEMPLATE_VERSION,
     UV_MULTILINE_SHEBANG,
     UV_SHEBANG,
+    HookTemplate,
     PreCommitTemplate,
+    get_background_hook_template_path,
 )
 from autohooks.utils import get_git_hook_directory_path
 
 
-def get_pre_commit_hook_path():
+def get_hook_path(name: str) -> Path:
+    """
+    Returns the path of the git hook with the given name, e.g. "pre-push"
+    """
     git_hook_dir_path = get_git_hook_directory_path()
-    return git_hook_dir_path / "pre-commit"
+    return git_hook_dir_path / name
 
 
-class PreCommitHook:
-    def __init__(self, pre_commit_hook_path: Path | None = None) -> None:
-        self._pre_commit_hook = None
+def get_pre_commit_hook_path():
+    return get_hook_path("pre-commit")
+
 
-        if pre_commit_hook_path is None:
-            self.pre_commit_hook_path = get_pre_commit_hook_path()
-        else:
-            self.pre_commit_hook_path = pre_commit_hook_path
+class GitHook:
+    """
+    A git hook managed by autohooks
+
+    Attributes:
+        name: Name of the git hook
+        git_command: The git command running the hook
+        function_names: Names of the plugin functions called by the hook in
+            the order of preference
+        hook_path: Path of the hook file
+    """
+
+    name = ""
+    git_command = ""
+    function_names: tuple[str, ...] = ()
+
+    def __init__(self, hook_path: Path | None = None) -> None:
+        self._content: str | None = None
+        self.hook_path = (
+            get_hook_path(self.name) if hook_path is None else hook_path
+        )
 
     @property
-    def pre_commit_hook(self) -> str:
-        if self._pre_commit_hook is None:
-            self._pre_commit_hook = self.pre_commit_hook_path.read_text()
+    def content(self) -> str:
+        if self._content is None:
+            self._content = self.hook_path.read_text()
 
-        return self._pre_commit_hook  # type: ignore
+        return self._content
 
     def exists(self) -> bool:
-        return self.pre_commit_hook_path.exists()
+        return self.hook_path.exists()
 
-    def is_autohooks_pre_commit_hook(self) -> bool:
-        lines = self.pre_commit_hook.split("\n")
+    def is_autohooks_hook(self) -> bool:
+        lines = self.content.split("\n")
         # seems to be false-positive ...
-        return len(lines) > 5 and "autohooks.precommit" in self.pre_commit_hook
+        return len(lines) > 5 and "autohooks.precommit" in self.content
 
-    def is_current_autohooks_pre_commit_hook(self) -> bool:
+    def is_current_autohooks_hook(self) -> bool:
         return self.read_version() == TEMPLATE_VERSION
 
     def read_mode(self) -> Mode:
-        lines = self.pre_commit_hook.split("\n")
+        lines = self.content.split("\n")
         if len(lines) < 1 or len(lines[0]) == 0:
             return Mode.UNDEFINED
 
@@ -84,21 +106,123 @@ class PreCommitHook:
 
     def read_version(self) -> int:
         matches = re.search(
-            r"{\s*version\s*=\s*?(\d+)\s*}$", self.pre_commit_hook, re.MULTILINE
+            r"{\s*version\s*=\s*?(\d+)\s*}$", self.content, re.MULTILINE
         )
         if not matches:
             return -1
 
         return int(matches.group(1))
 
+    def _render(self, mode: Mode) -> str:
+        template = HookTemplate(self.name, self.git_command)
+        return template.render(mode=mode)
+
     def write(self, *, mode: Mode) -> None:
+        self.hook_path.write_text(self._render(mode))
+        self.hook_path.chmod(0o775)
+
+        self._content = None
+
+    def __str__(self) -> str:
+        return str(self.hook_path)
+
+
+class PreCommitHook(GitHook):
+    name = "pre-commit"
+    git_command = "commit"
+    function_names = ("precommit",)
+
+    def __init__(self, pre_commit_hook_path: Path | None = None) -> None:
+        super().__init__(pre_commit_hook_path)
+
+    @property
+    def pre_commit_hook_path(self) -> Path:
+        return self.hook_path
+
+    @pre_commit_hook_path.setter
+    def pre_commit_hook_path(self, path: Path) -> None:
+        self.hook_path = path
+
+    @property
+    def pre_commit_hook(self) -> str:
+        return self.content
+
+    def is_autohooks_pre_commit_hook(self) -> bool:
+        return self.is_autohooks_hook()
+
+    def is_current_autohooks_pre_commit_hook(self) -> bool:
+        return self.is_current_autohooks_hook()
+
+    def _render(self, mode: Mode) -> str:
         template = PreCommitTemplate()
-        pre_commit_hook = template.render(mode=mode)
+        return template.render(mode=mode)
 
-        self.pre_commit_hook_path.write_text(pre_commit_hook)
-        self.pre_commit_hook_path.chmod(0o775)
 
-        self._pre_commit_hook = None
+class PrePushHook(GitHook):
+    """
+    The pre-push hook runs the plugins on the commits to be pushed
+    """
 
-    def __str__(self) -> str:
-        return str(self.pre_commit_hook_path)
+    name = "pre-push"
+    git_command = "push"
+    function_names = ("prepush", "precommit")
+
+
+class CommitMsgHook(GitHook):
+    """
+    The commit-msg hook runs the plugins for checking the commit message
+    """
+
+    name = "commit-msg"
+    git_command = "commit"
+    function_names = ("commitmsg",)
+
+
+class BackgroundHook(GitHook):
+    """
+    Base class of the git hooks warming up the result cache in the background
+    after a git command has finished
+
+    The hooks run the pre-commit functions of the cached plugins.
+    """
+
+    function_names = ("precommit",)
+
+    def _render(self, mode: Mode) -> str:
+        template = HookTemplate(
+            self.name, self.git_command, get_background_hook_template_path()
+        )
+        return template.render(mode=mode)
+
+
+class PostCheckoutHook(BackgroundHook):
+    """
+    The post-checkout hook warms up the result cache after switching branches
+    """
+
+    name = "post-checkout"
+    git_command = "checkout"
+
+
+class PostMergeHook(BackgroundHook):
+    """
+    The post-merge hook warms up the result cache after merging or pulling
+    """
+
+    name = "post-merge"
+    git_command = "merge"
+
+
+# hooks installed in addition to the pre-commit hook if plugins are configured
+# for them
+ADDITIONAL_HOOKS: tuple[type[GitHook], ...] = (
+    PrePushHook,
+    CommitMsgHook,
+    PostCheckoutHook,
+    PostMergeHook,
+)
+
+HOOKS: dict[str, type[GitHook]] = {
+    PreCommitHook.name: PreCommitHook,
+    **{hook.name: hook for hook in ADDITIONAL_HOOKS},
+}
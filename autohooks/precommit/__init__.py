@@ -3,6 +3,6 @@
 # SPDX-License-Identifier: GPL-3.0-or-later
 #
 
-from .run import run
+from .run import run, run_hook
 
-__all__ = ("run",)
+__all__ = ("run", "run_hook")
@@ -0,0 +1,638 @@
+# SPDX-FileCopyrightText: 2026 Greenbone AG
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+
+"""
+Cache the results of plugins for the contents of the checked files
+"""
+
+import hashlib
+import json
+import os
+import subprocess
+import time
+import uuid
+from abc import ABC, abstractmethod
+from collections.abc import Iterable
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from types import ModuleType
+from typing import TYPE_CHECKING, Any
+
+from autohooks.__version__ import __version__
+from autohooks.config import AutohooksConfig
+from autohooks.precommit.metadata import get_plugin_metadata
+from autohooks.utils import get_autohooks_git_directory_path
+
+if TYPE_CHECKING:
+    from autohooks.api.git import StatusEntry
+
+# version of the cache keys and entries. must be increased if the format
+# changes.
+CACHE_VERSION = 1
+
+# default maximum size of the local cache in bytes
+DEFAULT_MAX_SIZE = 100 * 1024 * 1024
+
+# minimum number of seconds between evicting the entries of the local cache
+_EVICTION_INTERVAL = 60 * 60
+
+
+def get_cache_path() -> Path:
+    """
+    Returns the path of the result cache directory of the repository
+    """
+    return get_autohooks_git_directory_path() / "cache"
+
+
+def get_blob_ids(status_list: Iterable["StatusEntry"]) -> dict[str, str] | None:
+    """
+    Returns the object names of the files in the working tree as they would
+    be stored by git
+
+    Returns:
+        A dict of the object names by the paths of the files relative to the
+        root of the repository or None if the object names can't be
+        determined.
+    """
+    entries = list(status_list)
+    paths = [str(entry.absolute_path()) for entry in entries]
+    if any("\n" in path for path in paths):
+        return None
+
+    try:
+        process = subprocess.run(
+            ["git", "hash-object", "--stdin-paths"],
+            input="\n".join(paths),
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+    except subprocess.CalledProcessError:
+        return None
+
+    names = process.stdout.splitlines()
+    return {
+        entry.path.as_posix(): name
+        for entry, name in zip(entries, names, strict=True)
+    }
+
+
+def get_tree_blob_ids(
+    commit: str, status_list: Iterable["StatusEntry"]
+) -> dict[str, str] | None:
+    """
+    Returns the object names of the files in the tree of a commit
+
+    All entries of the tree are listed with a single git call and filtered
+    afterwards.
+
+    Returns:
+        A dict of the object names by the paths of the files relative to the
+        root of the repository or None if the object names can't be
+        determined.
+    """
+    paths = {entry.path.as_posix() for entry in status_list}
+    try:
+        process = subprocess.run(
+            ["git", "ls-tree", "-r", "-z", "--full-tree", commit],
+            capture_output=True,
+            check=True,
+        )
+    except subprocess.CalledProcessError:
+        return None
+
+    blob_ids = {}
+    for line in process.stdout.decode("utf8", "surrogateescape").split("\0"):
+        if not line:
+            continue
+
+        info, path = line.split("\t", 1)
+        _, kind, name = info.split(" ")
+        if kind == "blob" and path in paths:
+            blob_ids[path] = name
+
+    # the files must exist in the tree
+    if len(blob_ids) != len(paths):
+        return None
+    return blob_ids
+
+
+def _hash_plugin_source(plugin: ModuleType) -> str:
+    path = getattr(plugin, "__file__", None)
+    if not path:
+        return ""
+    try:
+        return hashlib.sha256(Path(path).read_bytes()).hexdigest()
+    except OSError:
+        return ""
+
+
+def _hash(data: dict[str, Any]) -> str:
+    content = json.dumps(data, sort_keys=True, default=str)
+    return hashlib.sha256(content.encode("utf8")).hexdigest()
+
+
+def _plugin_data(
+    name: str, plugin: ModuleType, config_hash: str, function_name: str
+) -> dict[str, Any]:
+    metadata = get_plugin_metadata(plugin)
+    return {
+        "version": CACHE_VERSION,
+        "autohooks": __version__,
+        "plugin": name,
+        "plugin_version": metadata.version if metadata else None,
+        "function": function_name,
+        "source": _hash_plugin_source(plugin),
+        "config": config_hash,
+    }
+
+
+def get_cache_key(
+    name: str,
+    plugin: ModuleType,
+    config_hash: str,
+    blob_ids: dict[str, str],
+    *,
+    function_name: str = "precommit",
+) -> str:
+    """
+    Returns the key of the cached result of a plugin for a set of files
+
+    The key changes if the checked files, the plugin or its declared version,
+    its config and inputs or the version of autohooks change.
+
+    Args:
+        name: Name of the plugin
+        plugin: The loaded plugin
+        config_hash: Hash of the config and the other inputs of the
+            plugin
+        blob_ids: The object names of the checked files by their paths
+        function_name: Name of the called plugin function
+    """
+    data = _plugin_data(name, plugin, config_hash, function_name)
+    data["files"] = sorted(blob_ids.items())
+    return _hash(data)
+
+
+def get_file_cache_keys(
+    name: str,
+    plugin: ModuleType,
+    config_hash: str,
+    blob_ids: dict[str, str],
+    *,
+    function_name: str = "precommit",
+) -> dict[str, str]:
+    """
+    Returns the keys of the cached results of a plugin for single files
+
+    The results of plugins checking each file independently can be cached
+    per file. Therefore the results can be reused for any set of files.
+
+    Args:
+        name: Name of the plugin
+        plugin: The loaded plugin
+        config_hash: Hash of the config and the other inputs of the
+            plugin
+        blob_ids: The object names of the checked files by their paths
+        function_name: Name of the called plugin function
+
+    Returns:
+        A dict of the keys by the paths of the files
+    """
+    data = _plugin_data(name, plugin, config_hash, function_name)
+    return {
+        path: _hash({**data, "file": [path, blob_id]})
+        for path, blob_id in blob_ids.items()
+    }
+
+
+class CacheBackend(ABC):
+    """
+    Base class of the stores of the cache entries
+
+    Backends are best effort. Errors while accessing the store are ignored
+    and are handled like missing entries.
+    """
+
+    @abstractmethod
+    def get(self, key: str) -> bytes | None:
+        """
+        Returns the content of the entry for a key or None if the key isn't
+        stored
+        """
+
+    @abstractmethod
+    def set(self, key: str, content: bytes) -> None:
+        """
+        Store the content of the entry for a key
+        """
+
+    def evict(self) -> tuple[int, int]:
+        """
+        Remove entries to keep the store within its limits
+
+        Returns:
+            The number of removed entries and their size in bytes
+        """
+        return 0, 0
+
+
+class DirectoryBackend(CacheBackend):
+    """
+    Store the cache entries as files in a directory
+
+    The directory may be shared with other developers and CI jobs, for
+    example via a network file system. Entries are written to temporary files
+    first and moved into place afterwards. Therefore readers never see
+    partially written entries. Reading an entry updates its modification
+    time. When evicting, the entries unused for longer than the maximum age
+    are removed first. Afterwards the least recently used entries are removed
+    until the size of all entries is within the maximum size.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        *,
+        max_size: int | None = None,
+        max_age: float | None = None,
+    ) -> None:
+        """
+        Args:
+            path: Directory of the entries
+            max_size: Maximum size of all entries in bytes. Unlimited by
+                default.
+            max_age: Seconds after which unused entries are removed. Entries
+                don't expire by default.
+        """
+        self.path = path
+        self.max_size = max_size
+        self.max_age = max_age
+
+    def _entry_path(self, key: str) -> Path:
+        return self.path / key[:2] / key[2:]
+
+    def _entries(self) -> list[tuple[float, int, Path]]:
+        # the entries as tuples of the time of the last use, the size and the
+        # path. other files in the directory are ignored.
+        entries = []
+        try:
+            directories = [
+                path for path in self.path.iterdir() if path.is_dir()
+            ]
+        except OSError:
+            return []
+
+        for directory in directories:
+            try:
+                paths = list(directory.iterdir())
+            except OSError:
+                continue
+            for path in paths:
+                try:
+                    stat = path.stat()
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+        return entries
+
+    @staticmethod
+    def _remove(entries: list[tuple[float, int, Path]]) -> tuple[int, int]:
+        count = size = 0
+        for _, entry_size, path in entries:
+            try:
+                path.unlink()
+            except OSError:
+                continue
+            count += 1
+            size += entry_size
+        return count, size
+
+    def get(self, key: str) -> bytes | None:
+        path = self._entry_path(key)
+        try:
+            content = path.read_bytes()
+        except OSError:
+            return None
+
+        # mark the entry as recently used. entries of other users or on read
+        # only directories can't be marked but are still valid.
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return content
+
+    def set(self, key: str, content: bytes) -> None:
+        path = self._entry_path(key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # the name of the temporary file must be unique across all
+            # machines sharing the directory
+            temp_path = path.with_name(f"{path.name}.{uuid.uuid4().hex}.tmp")
+            temp_path.write_bytes(content)
+            temp_path.replace(path)
+        except OSError:
+            pass
+
+    def usage(self) -> tuple[int, int]:
+        """
+        Returns the number of entries and their size in bytes
+        """
+        entries = self._entries()
+        return len(entries), sum(size for _, size, _ in entries)
+
+    def evict(self) -> tuple[int, int]:
+        """
+        Remove the expired and the least recently used entries
+
+        Returns:
+            The number of removed entries and their size in bytes
+        """
+        if self.max_size is None and self.max_age is None:
+            return 0, 0
+
+        entries = sorted(self._entries())
+        remove = []
+        if self.max_age is not None:
+            expired = time.time() - self.max_age
+            while entries and entries[0][0] < expired:
+                remove.append(entries.pop(0))
+
+        if self.max_size is not None:
+            size = sum(size for _, size, _ in entries)
+            while entries and size > self.max_size:
+                entry = entries.pop(0)
+                remove.append(entry)
+                size -= entry[1]
+
+        return self._remove(remove)
+
+    def clear(self) -> tuple[int, int]:
+        """
+        Remove all entries
+
+        Returns:
+            The number of removed entries and their size in bytes
+        """
+        return self._remove(self._entries())
+
+
+class HttpBackend(CacheBackend):
+    """
+    Store the cache entries in a HTTP content store
+
+    Entries are read via GET and written via PUT requests to the URL of the
+    store followed by the key. A bearer token for authenticating at the store
+    can be passed via the AUTOHOOKS_CACHE_TOKEN environment variable. The
+    store is not used anymore after the first connection error to not slow
+    down the plugin runs. Evicting the entries is up to the store.
+    """
+
+    def __init__(self, url: str, *, timeout: float = 2.0) -> None:
+        """
+        Args:
+            url: URL of the store
+            timeout: Timeout of the requests in seconds
+        """
+        self.url = url.rstrip("/")
+        self.timeout = timeout
+        self._available = True
+
+    def _request(
+        self, method: str, key: str, content: bytes | None = None
+    ) -> bytes | None:
+        if not self._available:
+            return None
+
+        # urllib pulls in ssl and http.client. it is imported only if a HTTP
+        # store is used to keep the hooks starting fast.
+        import urllib.error
+        import urllib.request
+
+        request = urllib.request.Request(
+            f"{self.url}/{key}", data=content, method=method
+        )
+        token = os.environ.get("AUTOHOOKS_CACHE_TOKEN")
+        if token:
+            request.add_header("Authorization", f"Bearer {token}")
+        if content is not None:
+            request.add_header("Content-Type", "application/octet-stream")
+
+        try:
+            with urllib.request.urlopen(
+                request, timeout=self.timeout
+            ) as response:
+                return response.read()
+        except urllib.error.HTTPError:
+            # the entry doesn't exist or can't be written
+            return None
+        except (OSError, ValueError):
+            self._available = False
+            return None
+
+    def get(self, key: str) -> bytes | None:
+        return self._request("GET", key)
+
+    def set(self, key: str, content: bytes) -> None:
+        self._request("PUT", key, content)
+
+
+def get_cache_backend(location: str) -> CacheBackend:
+    """
+    Returns the backend for a cache location
+
+    Args:
+        location: URL of a HTTP content store or path of a directory
+    """
+    if location.startswith(("http://", "https://")):
+        return HttpBackend(location)
+    return DirectoryBackend(Path(location).expanduser())
+
+
+@dataclass
+class CacheStatistics:
+    """
+    Numbers of plugin runs found and not found in the result cache
+    """
+
+    hits: int = 0
+    misses: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class ResultCache:
+    """
+    A cache of successful plugin runs
+
+    The entries are stored as JSON in the local cache directory of the
+    repository. Optionally a cache shared with other developers and CI jobs
+    is used additionally. Entries found in the shared cache are copied to the
+    local cache.
+    """
+
+    def __init__(
+        self,
+        path: Path | None = None,
+        *,
+        shared: CacheBackend | None = None,
+        max_size: int | None = DEFAULT_MAX_SIZE,
+        max_age: float | None = None,
+    ) -> None:
+        """
+        Args:
+            path: Directory of the local cache. By default the cache directory
+                in the autohooks directory within the git directory.
+            shared: Optional backend of a shared cache
+            max_size: Maximum size of the local cache in bytes
+            max_age: Seconds after which unused entries of the local cache are
+                removed
+        """
+        self.path = path or get_cache_path()
+        self.local = DirectoryBackend(
+            self.path, max_size=max_size, max_age=max_age
+        )
+        self.shared = shared
+
+    @staticmethod
+    def from_config(config: AutohooksConfig) -> "ResultCache":
+        """
+        Create the result cache configured for the repository
+        """
+        location = config.get_shared_cache_location()
+        return ResultCache(
+            shared=get_cache_backend(location) if location else None,
+            max_size=config.get_cache_max_size() or DEFAULT_MAX_SIZE,
+            max_age=config.get_cache_max_age(),
+        )
+
+    @staticmethod
+    def _load(content: bytes | None) -> dict[str, Any] | None:
+        if content is None:
+            return None
+        try:
+            data = json.loads(content)
+        except ValueError:
+            return None
+        if not isinstance(data, dict) or data.get("version") != CACHE_VERSION:
+            return None
+        return data
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        """
+        Returns the cached entry for a key or None if the key isn't cached
+        """
+        data = self._load(self.local.get(key))
+        if data is not None or self.shared is None:
+            return data
+
+        content = self.shared.get(key)
+        data = self._load(content)
+        if content is not None and data is not None:
+            self.local.set(key, content)
+        return data
+
+    def set(self, key: str, entry: dict[str, Any]) -> None:
+        """
+        Store an entry for a key
+
+        Errors while writing the entry are ignored.
+        """
+        data = {"version": CACHE_VERSION, "created": time.time(), **entry}
+        content = json.dumps(data).encode("utf8")
+        self.local.set(key, content)
+        if self.shared is not None:
+            self.shared.set(key, content)
+
+    def evict(self, *, force: bool = False) -> tuple[int, int]:
+        """
+        Remove the expired and least recently used entries of the local cache
+
+        Scanning all entries is expensive for large caches. Therefore the
+        entries are only evicted once per eviction interval.
+
+        Args:
+            force: Evict the entries even if they have been evicted within
+                the eviction interval
+
+        Returns:
+            The number of removed entries and their size in bytes
+        """
+        marker = self.path / "evicted"
+        try:
+            if not force and time.time() - marker.stat().st_mtime < (
+                _EVICTION_INTERVAL
+            ):
+                return 0, 0
+        except OSError:
+            pass
+
+        removed = self.local.evict()
+        try:
+            marker.touch()
+        except OSError:
+            pass
+        return removed
+
+    def clear(self) -> tuple[int, int]:
+        """
+        Remove all entries of the local cache
+
+        Returns:
+            The number of removed entries and their size in bytes
+        """
+        return self.local.clear()
+
+    def usage(self) -> tuple[int, int]:
+        """
+        Returns the number of entries of the local cache and their size in
+        bytes
+        """
+        return self.local.usage()
+
+    def get_statistics(self) -> CacheStatistics:
+        """
+        Returns the statistics of all plugin runs using the cache
+        """
+        try:
+            data = json.loads(
+                (self.path / "statistics.json").read_text(encoding="utf8")
+            )
+            return CacheStatistics(int(data["hits"]), int(data["misses"]))
+        except (OSError, ValueError, KeyError, TypeError):
+            return CacheStatistics()
+
+    def add_statistics(self, statistics: CacheStatistics) -> None:
+        """
+        Add the numbers of cache hits and misses of a run to the statistics
+
+        Concurrent runs may overwrite the statistics of each other. Therefore
+        the statistics are approximate.
+        """
+        total = self.get_statistics()
+        total.hits += statistics.hits
+        total.misses += statistics.misses
+
+        path = self.path / "statistics.json"
+        try:
+            self.path.mkdir(parents=True, exist_ok=True)
+            temp_path = path.with_name(f"{path.name}.{uuid.uuid4().hex}.tmp")
+            temp_path.write_text(json.dumps(asdict(total)), encoding="utf8")
+            temp_path.replace(path)
+        except OSError:
+            pass
+
+    def reset_statistics(self) -> None:
+        """
+        Remove the statistics
+        """
+        try:
+            (self.path / "statistics.json").unlink()
+        except OSError:
+            pass
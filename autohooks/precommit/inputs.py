@@ -0,0 +1,145 @@
+# SPDX-FileCopyrightText: 2026 Greenbone AG
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+
+"""
+Registry of the inputs of the plugins besides the checked files
+"""
+
+import hashlib
+import json
+import os
+from collections.abc import Iterable
+from dataclasses import dataclass
+from pathlib import Path
+
+from autohooks.config import AutohooksConfig
+from autohooks.utils import get_repository_context
+
+
+@dataclass(frozen=True)
+class PluginInputs:
+    """
+    Inputs of a plugin which influence its results
+
+    Attributes:
+        files: Paths of the config files read by the plugin or the tools run
+            by the plugin, e.g. .pylintrc. Relative paths are relative to the
+            root of the repository.
+        sections: Dotted keys of the sections of the pyproject.toml file read
+            by the plugin or its tools, e.g. "tool.pylint"
+    """
+
+    files: tuple[Path, ...] = ()
+    sections: tuple[str, ...] = ()
+
+
+_PLUGIN_INPUTS: dict[str, PluginInputs] = {}
+
+# hashes of the input files by their paths, modification times and sizes
+_FILE_HASHES: dict[tuple[Path, int, int], str] = {}
+
+
+def register_plugin_inputs(
+    plugin: str,
+    *files: str | os.PathLike,
+    sections: Iterable[str] = (),
+) -> None:
+    """
+    Register the inputs of a plugin besides the checked files
+
+    The cached results of a plugin are invalidated if the contents of the
+    checked files or the settings of the plugin in the
+    [tool.autohooks.plugins.<name>] section change. Without registered inputs
+    any change of the pyproject.toml file invalidates the results. After
+    registering its inputs only changes of these inputs invalidate the
+    results additionally. Can be called several times.
+
+    Args:
+        plugin: Name of the plugin module, usually __name__
+        *files: Config files read by the plugin or its tools. Relative paths
+            are relative to the root of the repository. Missing files are
+            allowed.
+        sections: Dotted keys of the pyproject.toml sections read by the
+            plugin or its tools
+
+    Example: ::
+
+        from autohooks.api import register_plugin_inputs
+
+        register_plugin_inputs(__name__, ".pylintrc", sections=["tool.pylint"])
+    """
+    inputs = _PLUGIN_INPUTS.get(plugin, PluginInputs())
+    _PLUGIN_INPUTS[plugin] = PluginInputs(
+        files=inputs.files + tuple(Path(path) for path in files),
+        sections=inputs.sections + tuple(sections),
+    )
+
+
+def get_plugin_inputs(plugin: str) -> PluginInputs | None:
+    """
+    Returns the registered inputs of a plugin or None if the plugin hasn't
+    registered its inputs
+    """
+    return _PLUGIN_INPUTS.get(plugin)
+
+
+def _hash_file(path: Path) -> str | None:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+
+    key = (path, stat.st_mtime_ns, stat.st_size)
+    file_hash = _FILE_HASHES.get(key)
+    if file_hash is None:
+        try:
+            file_hash = hashlib.sha256(path.read_bytes()).hexdigest()
+        except OSError:
+            return None
+        _FILE_HASHES[key] = file_hash
+    return file_hash
+
+
+def get_plugin_inputs_hash(
+    plugin: str,
+    config: AutohooksConfig,
+    *,
+    files: Iterable[str | os.PathLike] | None = None,
+) -> str:
+    """
+    Returns a hash of the config and the other inputs of a plugin
+
+    Args:
+        plugin: Name of the plugin
+        config: The loaded config
+        files: Additional input files declared by the plugin, e.g. in its
+            metadata. If passed the plugin is considered to have declared
+            its inputs even if it hasn't registered any.
+    """
+    inputs = get_plugin_inputs(plugin)
+    if files is not None:
+        inputs = inputs or PluginInputs()
+        inputs = PluginInputs(
+            files=inputs.files + tuple(Path(path) for path in files),
+            sections=inputs.sections,
+        )
+
+    if inputs is None:
+        return config.get_config_hash()
+
+    root_path = get_repository_context().toplevel_path
+    data = {
+        "config": config.get_plugin_config_hash(plugin),
+        "sections": {
+            section: config.get_config_hash(*section.split("."))
+            for section in inputs.sections
+        },
+        "files": {
+            path.as_posix(): _hash_file(root_path / path)
+            for path in inputs.files
+        },
+    }
+    content = json.dumps(data, sort_keys=True)
+    return hashlib.sha256(content.encode("utf8")).hexdigest()
@@ -0,0 +1,83 @@
+# SPDX-FileCopyrightText: 2026 Greenbone AG
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+
+"""
+Optional metadata of the plugins describing how they may be run
+"""
+
+import fnmatch
+import os
+from dataclasses import dataclass
+from types import ModuleType
+
+# name of the module attribute containing the metadata of a plugin
+METADATA_ATTRIBUTE = "AUTOHOOKS_METADATA"
+
+
+@dataclass(frozen=True)
+class PluginMetadata:
+    """
+    Metadata of a plugin
+
+    A plugin provides its metadata as AUTOHOOKS_METADATA attribute of its
+    module. autohooks uses the metadata for caching, scheduling and skipping
+    the plugin.
+
+    Attributes:
+        version: Version of the plugin or of the tool run by the plugin.
+            Cached results of other versions are not reused.
+        patterns: fnmatch patterns of the files checked by the plugin, e.g.
+            "*.py". The plugin is skipped if no file matches. All files are
+            checked if no patterns are set.
+        mutates_files: True if the plugin changes files, like formatters do.
+            The results of these plugins are never cached and they never run
+            concurrently with other plugins.
+        parallel_safe: True if the plugin may run concurrently with other
+            plugins and checks each file independently. Its files may be
+            split into shards checked in parallel and its results are cached
+            per file. Otherwise the plugin is run on its own. Plugins without
+            metadata are never run concurrently with other plugins.
+        inputs: Config files read by the plugin or its tools, e.g.
+            ".pylintrc". Relative paths are relative to the root of the
+            repository. Cached results are invalidated if one of these files
+            changes.
+
+    Example: ::
+
+        from autohooks.api import PluginMetadata
+
+        AUTOHOOKS_METADATA = PluginMetadata(
+            version="1.0.0",
+            patterns=("*.py",),
+            parallel_safe=True,
+            inputs=(".pylintrc",),
+        )
+    """
+
+    version: str | None = None
+    patterns: tuple[str, ...] = ()
+    mutates_files: bool = False
+    parallel_safe: bool = False
+    inputs: tuple[str, ...] = ()
+
+    def matches(self, path: str | os.PathLike) -> bool:
+        """
+        Returns True if the plugin checks the file at the passed path
+        """
+        if not self.patterns:
+            return True
+        return any(
+            fnmatch.fnmatch(os.fspath(path), pattern)
+            for pattern in self.patterns
+        )
+
+
+def get_plugin_metadata(plugin: ModuleType) -> PluginMetadata | None:
+    """
+    Returns the metadata of a loaded plugin or None if the plugin doesn't
+    provide metadata
+    """
+    metadata = getattr(plugin, METADATA_ATTRIBUTE, None)
+    return metadata if isinstance(metadata, PluginMetadata) else None
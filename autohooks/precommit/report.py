@@ -0,0 +1,152 @@
+# SPDX-FileCopyrightText: 2026 Greenbone AG
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+
+"""
+Reports of running the plugins, for example on several CI nodes
+"""
+
+import json
+from collections.abc import Iterable
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any
+
+# version of the JSON format of the reports
+REPORT_VERSION = 1
+
+
+@dataclass
+class PluginReport:
+    """
+    Result of running a plugin
+
+    Attributes:
+        name: Name of the plugin
+        result: Return value of the plugin. 0 if the plugin succeeded.
+        duration: Duration of running the plugin in seconds. For a plugin run
+            in several shards it is the sum of the durations of the shards.
+    """
+
+    name: str
+    result: int
+    duration: float
+
+
+@dataclass
+class Report:
+    """
+    Results of running the plugins for a set of files
+
+    Attributes:
+        shards: The shards the report contains as tuples of the shard number
+            and the number of shards. Empty if the files haven't been split
+            into shards.
+        files: Paths of the checked files relative to the root of the
+            repository
+        plugins: Results of the plugins in the order they have been run
+    """
+
+    shards: list[tuple[int, int]] = field(default_factory=list)
+    files: list[str] = field(default_factory=list)
+    plugins: list[PluginReport] = field(default_factory=list)
+
+    @property
+    def result(self) -> int:
+        """
+        Result of the first failed plugin or 0 if all plugins succeeded
+        """
+        for plugin in self.plugins:
+            if plugin.result:
+                return plugin.result
+        return 0
+
+    def add_plugin(self, name: str, result: int, duration: float) -> None:
+        self.plugins.append(PluginReport(name, result, duration))
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "version": REPORT_VERSION,
+            "result": self.result,
+            "shards": [list(shard) for shard in self.shards],
+            "files": self.files,
+            "plugins": [asdict(plugin) for plugin in self.plugins],
+        }
+
+    @staticmethod
+    def from_dict(data: dict[str, Any]) -> "Report":
+        version = data.get("version")
+        if version != REPORT_VERSION:
+            raise ValueError(f"Unsupported report version {version}.")
+
+        return Report(
+            shards=[(number, count) for number, count in data["shards"]],
+            files=list(data["files"]),
+            plugins=[PluginReport(**plugin) for plugin in data["plugins"]],
+        )
+
+    def write(self, path: Path) -> None:
+        """
+        Store the report as JSON file
+        """
+        path.write_text(
+            json.dumps(self.to_dict(), indent=2) + "\n", encoding="utf8"
+        )
+
+    @staticmethod
+    def read(path: Path) -> "Report":
+        """
+        Load a report from a JSON file
+
+        Raises:
+            ValueError: If the file doesn't contain a valid report
+        """
+        try:
+            data = json.loads(path.read_text(encoding="utf8"))
+            return Report.from_dict(data)
+        except (KeyError, TypeError, json.JSONDecodeError) as e:
+            raise ValueError(f"Invalid report {path}. {e}") from None
+
+
+def merge_reports(reports: Iterable[Report]) -> Report:
+    """
+    Combine the reports of several shards into a single report
+
+    The results of the plugins are merged by name. A plugin failed if it
+    failed in one of the shards.
+    """
+    merged = Report()
+    plugins: dict[str, PluginReport] = {}
+
+    for report in sorted(reports, key=lambda report: report.shards):
+        merged.shards.extend(report.shards)
+        merged.files.extend(report.files)
+
+        for plugin in report.plugins:
+            merged_plugin = plugins.get(plugin.name)
+            if merged_plugin is None:
+                merged_plugin = PluginReport(plugin.name, 0, 0.0)
+                plugins[plugin.name] = merged_plugin
+                merged.plugins.append(merged_plugin)
+
+            merged_plugin.duration += plugin.duration
+            if not merged_plugin.result:
+                merged_plugin.result = plugin.result
+
+    merged.shards.sort()
+    merged.files.sort()
+    return merged
+
+
+def get_missing_shards(report: Report) -> list[tuple[int, int]]:
+    """
+    Returns the shards missing in a (merged) report
+    """
+    counts = {count for _, count in report.shards}
+    return [
+        (number, count)
+        for count in sorted(counts)
+        for number in range(1, count + 1)
+        if (number, count) not in report.shards
+    ]
@@ -5,18 +5,82 @@
 
 import importlib
 import inspect
+import os
+import shutil
 import sys
-from collections.abc import Generator
-from contextlib import contextmanager
+import tempfile
+import time
+from collections.abc import Callable, Generator, Iterable
+from contextlib import contextmanager, nullcontext
+from pathlib import Path
 from types import ModuleType
+from typing import TYPE_CHECKING, Any, NamedTuple
 
 from rich.progress import TaskID
 
-from autohooks.config import load_config_from_pyproject_toml
-from autohooks.hooks import PreCommitHook
+from autohooks.config import (
+    AutohooksConfig,
+    Config,
+    load_config_from_pyproject_toml,
+)
+from autohooks.hooks import (
+    HOOKS,
+    BackgroundHook,
+    CommitMsgHook,
+    GitHook,
+    PostCheckoutHook,
+    PreCommitHook,
+    PrePushHook,
+)
+from autohooks.precommit.cache import (
+    CacheStatistics,
+    ResultCache,
+    get_blob_ids,
+    get_cache_key,
+    get_file_cache_keys,
+    get_tree_blob_ids,
+)
+from autohooks.precommit.inputs import get_plugin_inputs_hash
+from autohooks.precommit.metadata import (
+    METADATA_ATTRIBUTE,
+    PluginMetadata,
+    get_plugin_metadata,
+)
+from autohooks.precommit.report import Report
+from autohooks.precommit.shard import (
+    distribute_duration,
+    get_shard_count,
+    shard_by_size,
+)
+from autohooks.precommit.submodules import run_submodules
+from autohooks.precommit.timings import TimingStore
+from autohooks.precommit.warm import start_warm_up
+from autohooks.precommit.worker import (
+    QueueProgress,
+    QueueTerminal,
+    WorkerPool,
+    is_worker_pool_supported,
+    send_message,
+)
 from autohooks.settings import Mode
-from autohooks.terminal import Progress, Terminal, _set_terminal
-from autohooks.utils import get_project_autohooks_plugins_path
+from autohooks.terminal import (
+    BufferedTerminal,
+    Progress,
+    Terminal,
+    _set_terminal,
+)
+from autohooks.utils import (
+    GitError,
+    exec_git,
+    get_project_autohooks_plugins_path,
+    get_repository_context,
+)
+
+if TYPE_CHECKING:
+    from autohooks.api.git import StatusEntry
+
+# object name used by git for commits that don't exist
+NULL_SHA = "0" * 40
 
 
 @contextmanager
@@ -46,25 +110,54 @@ def has_precommit_parameters(plugin: ModuleType) -> bool:
     return bool(signature.parameters)
 
 
-def check_hook_is_current(
-    term: Terminal, pre_commit_hook: PreCommitHook
-) -> None:
-    if not pre_commit_hook.is_current_autohooks_pre_commit_hook():
+def _get_plugin_metadata(name: str) -> PluginMetadata | None:
+    try:
+        return get_plugin_metadata(load_plugin(name))
+    except ImportError:
+        # the error is reported when running the plugin
+        return None
+
+
+def get_plugin_function(
+    plugin: ModuleType, function_names: Iterable[str]
+) -> Callable | None:
+    """
+    Returns the first function of a plugin found for the passed names
+    """
+    for function_name in function_names:
+        func = getattr(plugin, function_name, None)
+        if inspect.isfunction(func):
+            return func
+    return None
+
+
+def check_hook_is_current(term: Terminal, hook: GitHook) -> None:
+    if not hook.is_current_autohooks_hook():
         term.warning(
-            "autohooks pre-commit hook is outdated. Please run "
-            "'autohooks activate --force' to update your pre-commit "
+            f"autohooks {hook.name} hook is outdated. Please run "
+            f"'autohooks activate --force' to update your {hook.name} "
             "hook."
         )
 
 
-def check_hook_mode(term: Terminal, config_mode: Mode, hook_mode: Mode) -> None:
+def check_hook_mode(
+    term: Terminal,
+    config_mode: Mode,
+    hook_mode: Mode,
+    hook_name: str = "pre-commit",
+) -> None:
     if config_mode.get_effective_mode() != hook_mode.get_effective_mode():
         term.warning(
-            f'autohooks mode "{hook_mode!s}" in pre-commit hook differs '
+            f'autohooks mode "{hook_mode!s}" in {hook_name} hook differs '
             f'from mode "{config_mode!s}" in pyproject.toml file.'
         )
 
 
+def check_settings(term: Terminal, config: AutohooksConfig) -> None:
+    for message in config.get_invalid_settings():
+        term.warning(message)
+
+
 class CheckPluginResult:
     def __init__(self, message: str) -> None:
         self.message = message
@@ -106,6 +199,15 @@ def check_plugin(plugin_name: str) -> CheckPluginResult | None:
                 "signature for its precommit function. It "
                 "is missing the **kwargs parameter."
             )
+        elif (
+            hasattr(plugin, METADATA_ATTRIBUTE)
+            and get_plugin_metadata(plugin) is None
+        ):
+            return CheckPluginWarning(
+                f'Plugin "{plugin_name}" has invalid metadata. '
+                f"{METADATA_ATTRIBUTE} must be a PluginMetadata "
+                "instance."
+            )
     except ImportError as e:
         return CheckPluginError(
             f'"{plugin_name}" is not a valid autohooks plugin. {e}'
@@ -116,9 +218,15 @@ def check_plugin(plugin_name: str) -> CheckPluginResult | None:
 class ReportProgress:
     """
     A class to report progress of a plugin
+
+    The progress can be reported from several threads of a plugin
+    concurrently. If the plugin is run in a worker process the progress is
+    forwarded to the hook process.
     """
 
-    def __init__(self, progress: Progress, task_id: int) -> None:
+    def __init__(
+        self, progress: Progress | QueueProgress, task_id: int
+    ) -> None:
         self._progress = progress
         self._task_id = TaskID(task_id)
 
@@ -145,77 +253,1025 @@ class ReportProgress:
         self._progress.advance(self._task_id, advance)
 
 
-def run() -> int:
-    term = Terminal()
+def run_plugin(
+    term: Terminal,
+    name: str,
+    plugin: ModuleType,
+    config: Config,
+    report_progress: ReportProgress,
+    *,
+    function_names: Iterable[str] = ("precommit",),
+    **kwargs: Any,
+) -> int:
+    """
+    Call the hook function of a loaded plugin
+
+    Args:
+        term: Terminal for warnings
+        name: Name of the plugin
+        plugin: The loaded plugin
+        config: Config passed to the plugin
+        report_progress: ReportProgress passed to the plugin
+        function_names: Names of the plugin functions to look for. The first
+            function found is called.
+        kwargs: Additional keyword arguments passed to the plugin function
+
+    Returns:
+        The return value of the plugin function
+    """
+    func = get_plugin_function(plugin, function_names)
+    if func is None:
+        raise ValueError(f"No {' or '.join(function_names)} function found.")
+
+    if inspect.signature(func).parameters:
+        return func(config=config, report_progress=report_progress, **kwargs)
+
+    term.warning(
+        f"{func.__name__} function without kwargs is deprecated. "
+        f"Please update {name} to a newer version."
+    )
+    return func()
+
+
+# config, plugin function names, keyword arguments and shards of the files for
+# the plugins running in a worker process
+_worker_config = Config()
+_worker_function_names: tuple[str, ...] = ("precommit",)
+_worker_kwargs: dict[str, Any] = {}
+_worker_shards: dict[str, list[list["StatusEntry"]]] = {}
+_worker_status_list: list["StatusEntry"] | None = None
+
+
+def _init_plugin_worker(
+    config: Config,
+    function_names: tuple[str, ...],
+    kwargs: dict[str, Any],
+    shards: dict[str, list[list["StatusEntry"]]],
+) -> None:
+    # pylint: disable=global-statement
+    global _worker_config, _worker_function_names  # noqa: PLW0603
+    global _worker_kwargs, _worker_shards, _worker_status_list  # noqa: PLW0603
+    _worker_config = config
+    _worker_function_names = function_names
+    _worker_kwargs = kwargs
+    _worker_shards = shards
+    _worker_status_list = get_repository_context().status_list
 
+
+def _run_plugin_in_worker(
+    name: str, key: str | None = None, shard: int | None = None
+) -> None:
+    # the key identifies the messages of a shard of the plugin
+    key = key or name
+    term = QueueTerminal(key)
     _set_terminal(term)
 
-    config = load_config_from_pyproject_toml()
+    # a sharded plugin checks only the files of its shard
+    get_repository_context().status_list = (
+        _worker_status_list if shard is None else _worker_shards[name][shard]
+    )
 
-    pre_commit_hook = PreCommitHook()
+    start = time.monotonic()
+    try:
+        plugin = load_plugin(name)
+        report_progress = ReportProgress(QueueProgress(key), 0)
+        retval = run_plugin(
+            term,
+            name,
+            plugin,
+            _worker_config,
+            report_progress,
+            function_names=_worker_function_names,
+            **_worker_kwargs,
+        )
+        send_message(key, "result", retval, None, time.monotonic() - start)
+    except Exception as e:  # noqa: BLE001
+        send_message(
+            key,
+            "result",
+            1,
+            f"An error occurred while running plugin {name}. {e}.",
+            time.monotonic() - start,
+        )
 
-    check_hook_is_current(term, pre_commit_hook)
 
-    if config.has_autohooks_config():
-        check_hook_mode(term, config.get_mode(), pre_commit_hook.read_mode())
+def _check_plugin_function(
+    term: Terminal, name: str, plugin: ModuleType, hook: type[GitHook]
+) -> bool:
+    if get_plugin_function(plugin, hook.function_names):
+        return True
 
-    plugins = get_project_autohooks_plugins_path()
-    plugins_dir_name = str(plugins)
+    term.fail(
+        f"No {' or '.join(hook.function_names)} function found in plugin "
+        f"{name}. Your autohooks settings may be invalid."
+    )
+    return False
 
-    if plugins.is_dir():
-        sys.path.append(plugins_dir_name)
 
-    term.bold_info("autohooks => pre-commit")
+def _run_plugins_in_workers(
+    term: Terminal,
+    config: AutohooksConfig,
+    workers: int,
+    hook: type[GitHook],
+    names: list[str],
+    kwargs: dict[str, Any],
+    report: Report,
+    timings: TimingStore,
+) -> int:
+    if not names:
+        return 0
+
+    # import all plugins before forking the workers
+    for name in names:
+        try:
+            plugin = load_plugin(name)
+        except ImportError as e:
+            term.error(f"An error occurred while importing plugin {name}. {e}.")
+            return 1
+
+        if not _check_plugin_function(term, name, plugin, hook):
+            return 1
+
+    shards = _get_shards(config, names, workers, timings)
+    # expected durations of the plugins split to the shards
+    expected = {
+        name: duration / len(shards.get(name, [[]]))
+        for name, duration in timings.get_plugin_durations(names).items()
+    }
+
+    # the tasks to run as tuples of key, plugin name and shard index
+    tasks: list[tuple[str, str, int | None]] = []
+    for name in names:
+        if name in shards:
+            count = len(shards[name])
+            tasks.extend(
+                (f"{name} [{index + 1}/{count}]", name, index)
+                for index in range(count)
+            )
+        else:
+            tasks.append((name, name, None))
+
+    def expected_task_duration(task: tuple[str, str, int | None]) -> float:
+        # plugins without a known duration may run long as well
+        return expected.get(task[1], float("inf"))
+
+    # start the longest running tasks first to finish all tasks as early as
+    # possible
+    tasks.sort(key=expected_task_duration, reverse=True)
+
+    task_names = {key: name for key, name, _ in tasks}
+    remaining = {name: 0 for name in names}
+    for _, name, _ in tasks:
+        remaining[name] += 1
+
+    totals: dict[str, float] = {}
+    results: dict[str, int] = {}
+    durations = dict.fromkeys(names, 0.0)
+    task_durations: dict[str, float] = {}
+
+    with WorkerPool(
+        min(workers, len(tasks)),
+        initializer=_init_plugin_worker,
+        initargs=(config.get_config(), hook.function_names, kwargs, shards),
+    ) as pool:
+        # the workers are forked before the progress starts its refresh thread
+        futures = [
+            pool.submit(_run_plugin_in_worker, name, key, shard)
+            for key, name, shard in tasks
+        ]
+
+        with Progress(terminal=term) as progress:
+            task_ids = {}
+            buffers = {}
+            for name in names:
+                task_ids[name] = progress.add_task(
+                    f"Running {name}",
+                    total=None,
+                    name=name,
+                    expected=expected.get(name),
+                )
+                buffers[name] = BufferedTerminal()
+                buffers[name].info(f"Running {name}")
+                if name in shards:
+                    with buffers[name].indent():
+                        buffers[name].info(
+                            f"Split files into {len(shards[name])} shards"
+                        )
+
+            for key, kind, *args in pool.messages(futures):
+                name = task_names[key]
+                buffer = buffers[name]
+                if kind == "terminal":
+                    method, message = args
+                    with buffer.indent():
+                        getattr(buffer, method)(message)
+                elif kind == "total":
+                    # the total of a sharded plugin is the sum of the totals
+                    # of its shards
+                    if args[0] is not None:
+                        totals[key] = args[0]
+                    total = sum(
+                        value
+                        for shard_key, value in totals.items()
+                        if task_names[shard_key] == name
+                    )
+                    progress.update(task_ids[name], total=total or None)
+                elif kind == "advance":
+                    progress.advance(task_ids[name], args[0])
+                elif kind == "result":
+                    remaining[name] -= 1
+                    durations[name] += args[2]
+                    task_durations[key] = args[2]
+                    # the first failed shard determines the result
+                    if not results.get(name):
+                        results[name] = args[0]
+                    if args[1]:
+                        with buffer.indent():
+                            buffer.error(args[1])
+                    if not remaining[name]:
+                        report.add_plugin(name, results[name], durations[name])
+                        progress.finish_task(task_ids[name])
+                        # print the whole output of the plugin at once
+                        buffer.flush(term)
+
+            for name in names:
+                if remaining[name]:
+                    buffers[name].flush(term)
+
+    timings.add_plugin_durations(
+        {name: durations[name] for name in names if not remaining[name]}
+    )
+    _add_file_durations(timings, tasks, shards, task_durations)
+
+    for name in names:
+        if remaining[name]:
+            term.error(
+                f"The worker running plugin {name} terminated unexpectedly."
+            )
+            return 1
+
+        if results[name]:
+            return results[name]
 
+    return 0
+
+
+def _add_file_durations(
+    timings: TimingStore,
+    tasks: list[tuple[str, str, int | None]],
+    shards: dict[str, list[list["StatusEntry"]]],
+    task_durations: dict[str, float],
+) -> None:
+    # the durations of the files are estimated from the durations of the
+    # shards and summed up for all sharded plugins
+    file_durations: dict[str, float] = {}
+    for key, name, shard in tasks:
+        if shard is None or key not in task_durations:
+            continue
+
+        for path, duration in distribute_duration(
+            shards[name][shard], task_durations[key]
+        ).items():
+            file_durations[path] = file_durations.get(path, 0.0) + duration
+
+    timings.add_file_durations(file_durations)
+
+
+def _is_parallel_safe(
+    config: AutohooksConfig, name: str, metadata: PluginMetadata | None
+) -> bool:
+    """
+    Returns True if the plugin may run concurrently with other plugins
+
+    Plugins without metadata may change files, like formatters do. Therefore
+    only plugins declaring parallel_safe in their metadata and plugins listed
+    in shard-plugins are considered to be parallel safe.
+    """
+    if metadata is not None and metadata.parallel_safe:
+        return True
+    return name in config.get_shard_plugin_names()
+
+
+def _can_be_sharded(config: AutohooksConfig, name: str) -> bool:
+    metadata = _get_plugin_metadata(name)
+    if metadata is None:
+        return name in config.get_shard_plugin_names()
+    # plugins changing files must not run concurrently on the same files
+    if metadata.mutates_files:
+        return False
+    return metadata.parallel_safe or name in config.get_shard_plugin_names()
+
+
+def _get_shards(
+    config: AutohooksConfig,
+    names: list[str],
+    workers: int,
+    timings: TimingStore,
+) -> dict[str, list[list["StatusEntry"]]]:
+    """
+    Split the files into shards for the plugins which may be run sharded
+    """
+    shard_names = [name for name in names if _can_be_sharded(config, name)]
+    if workers < 2 or not shard_names:
+        return {}
+
+    # avoid a circular import because the plugin API imports this module
+    from autohooks.api.git import get_staged_status
+
+    status_list = get_staged_status()
+    count = get_shard_count(len(status_list), workers)
+    if count < 2:
+        return {}
+
+    durations = timings.get_file_durations(
+        entry.path.as_posix() for entry in status_list
+    )
+    shards = shard_by_size(status_list, count, durations=durations)
+    return {name: shards for name in shard_names}
+
+
+def _run_plugins(
+    term: Terminal,
+    config: AutohooksConfig,
+    hook: type[GitHook],
+    names: list[str],
+    kwargs: dict[str, Any],
+    report: Report,
+    timings: TimingStore,
+) -> int:
+    expected = timings.get_plugin_durations(names)
+    durations: dict[str, float] = {}
+
+    try:
+        return _run_plugins_sequentially(
+            term, config, hook, names, kwargs, report, expected, durations
+        )
+    finally:
+        timings.add_plugin_durations(durations)
+
+
+def _run_plugins_sequentially(
+    term: Terminal,
+    config: AutohooksConfig,
+    hook: type[GitHook],
+    names: list[str],
+    kwargs: dict[str, Any],
+    report: Report,
+    expected: dict[str, float],
+    durations: dict[str, float],
+) -> int:
     with (
         autohooks_module_path(),
         term.indent(),
         Progress(terminal=term) as progress,
     ):
-        for name in config.get_pre_commit_script_names():
+        for name in names:
             term.info(f"Running {name}")
             with term.indent():
                 try:
                     plugin = load_plugin(name)
-                    if not has_precommit_function(plugin):
-                        term.fail(
-                            f"No precommit function found in plugin {name}. "
-                            "Your autohooks settings may be invalid."
-                        )
+                    if not _check_plugin_function(term, name, plugin, hook):
                         return 1
 
                     task_id = progress.add_task(
-                        f"Running {name}", total=None, name=name
+                        f"Running {name}",
+                        total=None,
+                        name=name,
+                        expected=expected.get(name),
                     )
                     report_progress = ReportProgress(progress, task_id)
-                    if has_precommit_parameters(plugin):
-                        retval = plugin.precommit(
-                            config=config.get_config(),
-                            report_progress=report_progress,
-                        )
-                    else:
-                        term.warning(
-                            "precommit function without kwargs is deprecated. "
-                            f"Please update {name} to a newer version."
-                        )
-                        retval = plugin.precommit()
+                    start = time.monotonic()
+                    retval = run_plugin(
+                        term,
+                        name,
+                        plugin,
+                        config.get_config(),
+                        report_progress,
+                        function_names=hook.function_names,
+                        **kwargs,
+                    )
 
                     progress.update(task_id, total=1, advance=1)
 
+                    durations[name] = time.monotonic() - start
+                    report.add_plugin(name, retval, durations[name])
+
                     if retval:
                         return retval
 
                 except ImportError as e:
                     term.error(
-                        "An error occurred while importing pre-commit "
-                        f"hook {name}. {e}."
+                        f"An error occurred while importing plugin {name}. {e}."
                     )
                     return 1
                 except Exception as e:  # noqa: BLE001
                     term.error(
-                        "An error occurred while running pre-commit "
-                        f"hook {name}. {e}."
+                        f"An error occurred while running plugin {name}. {e}."
                     )
                     return 1
 
     return 0
+
+
+def run_plugins(
+    term: Terminal,
+    config: AutohooksConfig,
+    *,
+    title: str | None = None,
+    hook: type[GitHook] = PreCommitHook,
+    report: Report | None = None,
+    **kwargs: Any,
+) -> int:
+    """
+    Run the plugins configured for a git hook
+
+    Args:
+        term: Terminal for the output
+        config: Config containing the plugins to run
+        title: Title printed before running the plugins. By default the name
+            of the hook.
+        hook: The git hook to run the plugins for
+        report: Optional report to add the results of the plugins to
+        kwargs: Additional keyword arguments passed to the plugin functions
+
+    Returns:
+        0 if all plugins succeeded. Otherwise the result of the first failed
+        plugin.
+    """
+    plugins = get_project_autohooks_plugins_path()
+    plugins_dir_name = str(plugins)
+
+    if plugins.is_dir():
+        sys.path.append(plugins_dir_name)
+
+    term.bold_info(f"autohooks => {title or hook.name}")
+
+    if report is None:
+        report = Report()
+
+    names = config.get_script_names(hook.name)
+    for name in _get_skipped_plugins(hook, names):
+        with term.indent():
+            term.info(f"Running {name}")
+            with term.indent():
+                term.ok("No files to check.")
+        names.remove(name)
+        report.add_plugin(name, 0, 0.0)
+
+    cache = ResultCache.from_config(config)
+    statistics = CacheStatistics()
+
+    workers = config.get_workers()
+    use_workers = workers > 0 and is_worker_pool_supported()
+    if workers > 0 and not use_workers:
+        term.warning(
+            "Running plugins in worker processes is not supported on this "
+            "platform. Falling back to running the plugins sequentially."
+        )
+
+    with TimingStore() as timings:
+
+        def run_sequentially(names: list[str]) -> int:
+            return _run_plugins(
+                term, config, hook, names, kwargs, report, timings
+            )
+
+        def run_in_workers(names: list[str]) -> int:
+            # plugins which are not parallel safe run on their own
+            exclusive = [
+                name
+                for name in names
+                if not _is_parallel_safe(
+                    config, name, _get_plugin_metadata(name)
+                )
+            ]
+            retval = run_sequentially(exclusive) if exclusive else 0
+            if retval:
+                return retval
+
+            with autohooks_module_path(), term.indent():
+                return _run_plugins_in_workers(
+                    term,
+                    config,
+                    workers,
+                    hook,
+                    [name for name in names if name not in exclusive],
+                    kwargs,
+                    report,
+                    timings,
+                )
+
+        # plugins changing files run first and on their own when using
+        # workers. otherwise the other plugins may check files while they are
+        # changed.
+        changing = (
+            [name for name in names if _may_change_files(config, name)]
+            if use_workers
+            else names
+        )
+        parallel = [name for name in names if name not in changing]
+
+        # the results are looked up in the cache only after the plugins
+        # running before have changed the files
+        retval = 0
+        for batch in _split_after_changes(config, changing):
+            retval = _run_batch(
+                term,
+                config,
+                hook,
+                cache,
+                statistics,
+                report,
+                batch,
+                run_sequentially,
+            )
+            if retval:
+                break
+
+        if not retval and parallel:
+            retval = _run_batch(
+                term,
+                config,
+                hook,
+                cache,
+                statistics,
+                report,
+                parallel,
+                run_in_workers,
+            )
+
+    if statistics.hits or statistics.misses:
+        with term.indent():
+            term.info(
+                f"Result cache: {statistics.hits} hit(s), "
+                f"{statistics.misses} miss(es)"
+            )
+        cache.add_statistics(statistics)
+        cache.evict()
+
+    return retval
+
+
+def _may_change_files(config: AutohooksConfig, name: str) -> bool:
+    metadata = _get_plugin_metadata(name)
+    if metadata is None:
+        # plugins without metadata may be formatters
+        return name not in config.get_shard_plugin_names()
+    return metadata.mutates_files
+
+
+def _split_after_changes(
+    config: AutohooksConfig, names: list[str]
+) -> list[list[str]]:
+    """
+    Split the plugins into batches ending with a plugin which may change
+    files
+    """
+    batches: list[list[str]] = [[]]
+    for name in names:
+        batches[-1].append(name)
+        if _may_change_files(config, name):
+            batches.append([])
+    return [batch for batch in batches if batch]
+
+
+def _run_batch(
+    term: Terminal,
+    config: AutohooksConfig,
+    hook: type[GitHook],
+    cache: ResultCache,
+    statistics: CacheStatistics,
+    report: Report,
+    names: list[str],
+    run: Callable[[list[str]], int],
+) -> int:
+    """
+    Run the plugins whose results aren't cached for the current files
+    """
+    names = list(names)
+    cache_keys = _get_cache_keys(config, hook, names)
+    for name, keys in cache_keys.items():
+        if not _is_cached(cache, keys):
+            statistics.misses += 1
+            continue
+
+        statistics.hits += 1
+        with term.indent():
+            term.info(f"Running {name}")
+            with term.indent():
+                term.ok("Files have already been checked successfully.")
+        names.remove(name)
+        report.add_plugin(name, 0, 0.0)
+
+    retval = run(names) if names else 0
+
+    _store_results(
+        cache,
+        cache_keys,
+        hook,
+        [
+            plugin.name
+            for plugin in report.plugins
+            if plugin.name in names and not plugin.result
+        ],
+    )
+    return retval
+
+
+class CacheKeys(NamedTuple):
+    """
+    Keys of the cached results of a plugin
+
+    Attributes:
+        files: Key of the result for the set of checked files
+        per_file: Keys of the results for the single files by their paths.
+            Only used for plugins checking each file independently.
+        blob_ids: The object names of the checked files by their paths
+    """
+
+    files: str
+    per_file: dict[str, str]
+    blob_ids: dict[str, str]
+
+
+def _get_blob_ids(
+    hook: type[GitHook], status_list: list["StatusEntry"]
+) -> dict[str, str] | None:
+    # the results of pre-push plugins are stored for the pushed contents
+    # instead of the contents of the working tree
+    commit_range = get_repository_context().commit_range
+    if hook is PrePushHook and commit_range:
+        return get_tree_blob_ids(commit_range[1], status_list)
+    return get_blob_ids(status_list)
+
+
+def _store_results(
+    cache: ResultCache,
+    cache_keys: dict[str, CacheKeys],
+    hook: type[GitHook],
+    names: list[str],
+) -> None:
+    """
+    Store the successful results of the plugins for the files which haven't
+    changed while the plugins were running
+    """
+    names = [name for name in names if name in cache_keys]
+    if not names:
+        return
+
+    # avoid a circular import because the plugin API imports this module
+    from autohooks.api.git import get_staged_status
+
+    # results of files changed in the meantime would be stored for their old
+    # contents
+    blob_ids = _get_blob_ids(hook, get_staged_status()) or {}
+    for name in names:
+        keys = cache_keys[name]
+        changed = {
+            path
+            for path, blob_id in keys.blob_ids.items()
+            if blob_ids.get(path) != blob_id
+        }
+        if not changed:
+            cache.set(keys.files, {"plugin": name})
+        for path, key in keys.per_file.items():
+            if path not in changed:
+                cache.set(key, {"plugin": name})
+
+
+def _get_skipped_plugins(hook: type[GitHook], names: list[str]) -> list[str]:
+    """
+    Returns the plugins which don't check any of the files according to the
+    file patterns of their metadata
+    """
+    if hook is CommitMsgHook:
+        return []
+
+    patterns = {}
+    with autohooks_module_path():
+        for name in names:
+            metadata = _get_plugin_metadata(name)
+            if metadata is not None and metadata.patterns:
+                patterns[name] = metadata
+
+    if not patterns:
+        return []
+
+    # avoid a circular import because the plugin API imports this module
+    from autohooks.api.git import get_staged_status
+
+    status_list = get_staged_status()
+    return [
+        name
+        for name, metadata in patterns.items()
+        if not any(metadata.matches(entry.path) for entry in status_list)
+    ]
+
+
+def _is_cached(cache: ResultCache, keys: CacheKeys) -> bool:
+    if cache.get(keys.files):
+        return True
+    return bool(keys.per_file) and all(
+        cache.get(key) for key in keys.per_file.values()
+    )
+
+
+def _get_cache_keys(
+    config: AutohooksConfig, hook: type[GitHook], names: list[str]
+) -> dict[str, CacheKeys]:
+    """
+    Returns the keys of the cached results of the plugins whose results may
+    be cached
+    """
+    cache_names = [
+        name for name in names if name in config.get_cache_plugin_names()
+    ]
+    # the commit message isn't part of the cache key
+    if not cache_names or hook is CommitMsgHook:
+        return {}
+
+    # avoid a circular import because the plugin API imports this module
+    from autohooks.api.git import get_staged_status, is_partially_staged_status
+
+    status_list = get_staged_status()
+    # plugins may check the staged or the unstaged changes of these files
+    if any(is_partially_staged_status(entry) for entry in status_list):
+        return {}
+
+    blob_ids = _get_blob_ids(hook, status_list)
+    if blob_ids is None:
+        return {}
+
+    # plugins which can be sharded check each file independently
+    shard_names = config.get_shard_plugin_names()
+    keys = {}
+    with autohooks_module_path():
+        for name in cache_names:
+            try:
+                plugin = load_plugin(name)
+            except ImportError:
+                # the error is reported when running the plugin
+                continue
+
+            function = get_plugin_function(plugin, hook.function_names)
+            if function is None:
+                continue
+
+            metadata = get_plugin_metadata(plugin)
+            if metadata is not None and metadata.mutates_files:
+                continue
+
+            # the plugin registers its inputs when it is imported. a plugin
+            # providing metadata without inputs hasn't declared its inputs.
+            config_hash = get_plugin_inputs_hash(
+                name,
+                config,
+                files=metadata.inputs if metadata and metadata.inputs else None,
+            )
+            # only the files matching the patterns of the plugin are checked
+            plugin_blob_ids = (
+                {
+                    path: blob_id
+                    for path, blob_id in blob_ids.items()
+                    if metadata.matches(path)
+                }
+                if metadata
+                else blob_ids
+            )
+            keys[name] = CacheKeys(
+                files=get_cache_key(
+                    name,
+                    plugin,
+                    config_hash,
+                    plugin_blob_ids,
+                    function_name=function.__name__,
+                ),
+                per_file=get_file_cache_keys(
+                    name,
+                    plugin,
+                    config_hash,
+                    plugin_blob_ids,
+                    function_name=function.__name__,
+                )
+                if name in shard_names
+                or (metadata is not None and metadata.parallel_safe)
+                else {},
+                blob_ids=plugin_blob_ids,
+            )
+    return keys
+
+
+def _setup_hook(hook: GitHook) -> tuple[Terminal, AutohooksConfig]:
+    term = Terminal()
+
+    _set_terminal(term)
+
+    config = load_config_from_pyproject_toml()
+
+    get_repository_context().fsmonitor = config.has_fsmonitor_enabled()
+
+    check_hook_is_current(term, hook)
+    check_settings(term, config)
+
+    if config.has_autohooks_config():
+        check_hook_mode(term, config.get_mode(), hook.read_mode(), hook.name)
+
+    return term, config
+
+
+def run() -> int:
+    pre_commit_hook = PreCommitHook()
+    term, config = _setup_hook(pre_commit_hook)
+
+    retval = run_plugins(term, config)
+    if retval:
+        return retval
+
+    if config.has_submodules_enabled():
+        with term.indent():
+            return run_submodules(term)
+
+    return 0
+
+
+def get_push_ranges(remote: str, lines: Iterable[str]) -> list[tuple[str, str]]:
+    """
+    Determine the commit ranges to check from the input of the pre-push hook
+
+    Args:
+        remote: Name of the remote the commits are pushed to
+        lines: Lines passed to the pre-push hook via stdin. Each line contains
+            the local ref, the local commit, the remote ref and the remote
+            commit.
+
+    Returns:
+        A list of tuples of the base commit and the pushed commit
+    """
+    ranges = []
+    for line in lines:
+        if not line.strip():
+            continue
+
+        _local_ref, local_sha, _remote_ref, remote_sha = line.split()
+        if local_sha == NULL_SHA:
+            # a remote ref is deleted
+            continue
+
+        if remote_sha != NULL_SHA:
+            ranges.append((remote_sha, local_sha))
+            continue
+
+        # a new ref is pushed. check the commits not known by the remote yet.
+        commits = exec_git(
+            "rev-list",
+            "--topo-order",
+            "--reverse",
+            local_sha,
+            "--not",
+            f"--remotes={remote}",
+        ).split()
+        if not commits:
+            continue
+
+        parents = exec_git("rev-list", "--parents", "-n", "1", commits[0])
+        base = parents.split()[1:]
+        if base:
+            ranges.append((base[0], local_sha))
+        else:
+            # the pushed history starts with a root commit
+            ranges.append((get_repository_context().empty_tree, local_sha))
+
+    return ranges
+
+
+def get_warm_up_refs(hook: GitHook, args: list[str]) -> tuple[str, str] | None:
+    """
+    Determine the commits to warm up the result cache for from the arguments
+    of the post-checkout or post-merge hook
+
+    Returns:
+        A tuple of the previous and the new HEAD commit or None if HEAD
+        hasn't changed
+    """
+    if isinstance(hook, PostCheckoutHook):
+        # the arguments are the previous HEAD, the new HEAD and a flag
+        # whether branches or files have been checked out
+        if len(args) < 3 or args[2] != "1":
+            return None
+        from_ref, to_ref = args[0], args[1]
+    else:
+        try:
+            from_ref = exec_git("rev-parse", "--verify", "ORIG_HEAD").strip()
+            to_ref = exec_git("rev-parse", "--verify", "HEAD").strip()
+        except GitError:
+            return None
+
+    if from_ref == to_ref:
+        return None
+    if from_ref == NULL_SHA:
+        # a repository has been cloned
+        from_ref = get_repository_context().empty_tree
+    return from_ref, to_ref
+
+
+def _uses_precommit_fallback(config: AutohooksConfig) -> bool:
+    """
+    Returns True if a pre-push plugin has no prepush function and its
+    precommit function is called instead
+    """
+    with autohooks_module_path():
+        for name in config.get_script_names(PrePushHook.name):
+            try:
+                plugin = load_plugin(name)
+            except ImportError:
+                # the error is reported when running the plugin
+                continue
+            if get_plugin_function(plugin, ("prepush",)) is None:
+                return True
+    return False
+
+
+@contextmanager
+def _pushed_tree(commit: str) -> Generator[Path, None, None]:
+    """
+    Check out a pushed commit into a temporary working tree and change into
+    it
+
+    precommit functions read the files from the working tree and formatters
+    change and stage them. Running them in a temporary working tree lets them
+    check the pushed files and keeps the working tree and the index of the
+    developer untouched.
+
+    Args:
+        commit: The pushed commit
+    """
+    temp_dir = Path(tempfile.mkdtemp(prefix="autohooks-push-"))
+    path = temp_dir / "tree"
+    cwd = Path.cwd()
+    # the hooks are disabled to not warm up the cache for the temporary tree
+    exec_git(
+        "-c",
+        f"core.hooksPath={os.devnull}",
+        "worktree",
+        "add",
+        "--detach",
+        "--quiet",
+        str(path),
+        commit,
+    )
+    try:
+        os.chdir(path)
+        yield path
+    finally:
+        os.chdir(cwd)
+        exec_git("worktree", "remove", "--force", str(path), ignore_errors=True)
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def run_hook(name: str, args: list[str] | None = None) -> int:
+    """
+    Run the plugins of a git hook
+
+    Called by all git hooks installed by autohooks except the pre-commit hook.
+
+    Args:
+        name: Name of the git hook, e.g. "pre-push"
+        args: Arguments passed to the git hook
+    """
+    if name == PreCommitHook.name:
+        return run()
+
+    args = args or []
+    hook = HOOKS[name]()
+    term, config = _setup_hook(hook)
+
+    if isinstance(hook, PrePushHook):
+        remote = args[0] if args else "origin"
+        ranges = get_push_ranges(remote, sys.stdin)
+        fallback = bool(ranges) and _uses_precommit_fallback(config)
+        for from_ref, to_ref in ranges:
+            # precommit functions check the pushed files in a temporary tree
+            with _pushed_tree(to_ref) if fallback else nullcontext():
+                get_repository_context().commit_range = (from_ref, to_ref)
+                retval = run_plugins(
+                    term,
+                    config,
+                    title=f"{hook.name} {from_ref[:12]}...{to_ref[:12]}",
+                    hook=PrePushHook,
+                    remote=remote,
+                )
+            if retval:
+                return retval
+        return 0
+
+    if isinstance(hook, BackgroundHook):
+        refs = get_warm_up_refs(hook, args)
+        if refs and config.get_script_names(hook.name):
+            start_warm_up(*refs)
+        return 0
+
+    kwargs: dict[str, Any] = {}
+    if args:
+        kwargs["commit_msg_file"] = Path(args[0])
+
+    return run_plugins(term, config, hook=type(hook), **kwargs)
@@ -0,0 +1,162 @@
+# SPDX-FileCopyrightText: 2026 Greenbone AG
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+
+"""
+Split the files checked by a plugin into shards run in parallel
+"""
+
+import heapq
+import zlib
+from collections.abc import Iterable
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from autohooks.api.git import StatusEntry
+
+# minimum number of files per shard. smaller shards don't pay off the
+# additional run of the plugin.
+MIN_FILES_PER_SHARD = 10
+
+
+def get_shard_count(files: int, workers: int) -> int:
+    """
+    Returns the number of shards to split a number of files into
+
+    Args:
+        files: Number of files to check
+        workers: Number of available worker processes
+    """
+    return max(1, min(workers, files // MIN_FILES_PER_SHARD))
+
+
+def _get_file_size(entry: "StatusEntry") -> int:
+    try:
+        return entry.absolute_path().stat().st_size
+    except OSError:
+        return 0
+
+
+def _get_weights(
+    entries: list["StatusEntry"], durations: dict[str, float]
+) -> list[float]:
+    sizes = [_get_file_size(entry) for entry in entries]
+    known = [
+        (durations[entry.path.as_posix()], size)
+        for entry, size in zip(entries, sizes, strict=True)
+        if entry.path.as_posix() in durations
+    ]
+    known_size = sum(size for _, size in known)
+    if not known_size:
+        return [float(size) for size in sizes]
+
+    # estimate the durations of the other files from their size
+    seconds_per_byte = sum(duration for duration, _ in known) / known_size
+    return [
+        durations.get(entry.path.as_posix(), size * seconds_per_byte)
+        for entry, size in zip(entries, sizes, strict=True)
+    ]
+
+
+def distribute_duration(
+    status_list: Iterable["StatusEntry"], duration: float
+) -> dict[str, float]:
+    """
+    Distribute the duration of checking files to the files by their size
+
+    Returns:
+        A dict of the estimated durations in seconds by the paths of the files
+        relative to the root of the repository
+    """
+    entries = list(status_list)
+    # every file has a base cost independent of its size
+    sizes = [_get_file_size(entry) + 1 for entry in entries]
+    total = sum(sizes)
+    return {
+        entry.path.as_posix(): duration * size / total
+        for entry, size in zip(entries, sizes, strict=True)
+    }
+
+
+def shard_by_size(
+    status_list: Iterable["StatusEntry"],
+    count: int,
+    *,
+    durations: dict[str, float] | None = None,
+) -> list[list["StatusEntry"]]:
+    """
+    Split status entries into shards of about the same total file size
+
+    The largest files are assigned first, each to the shard with the smallest
+    total size so far. Shards of the same size are balanced by the number of
+    files. The entries of each shard keep their original order.
+
+    If durations of checking the files are known from previous runs the
+    shards are balanced by the durations instead. The durations of files
+    without a known duration are estimated from their size.
+
+    Args:
+        status_list: The status entries to split
+        count: Number of shards
+        durations: Optional known durations of checking the files in seconds
+            by their path relative to the root of the repository
+
+    Returns:
+        A list of count shards. Shards may be empty if there are fewer
+        entries than shards.
+    """
+    entries = list(status_list)
+    sizes = _get_weights(entries, durations or {})
+
+    # total size, number of files and index of each shard
+    heap = [(0.0, 0, index) for index in range(count)]
+    assigned: list[list[int]] = [[] for _ in range(count)]
+    for position in sorted(
+        range(len(entries)), key=lambda i: sizes[i], reverse=True
+    ):
+        total, files, index = heapq.heappop(heap)
+        assigned[index].append(position)
+        heapq.heappush(heap, (total + sizes[position], files + 1, index))
+
+    return [
+        [entries[position] for position in sorted(positions)]
+        for positions in assigned
+    ]
+
+
+def get_shard_number(path: str, count: int) -> int:
+    """
+    Returns the shard a file belongs to if the files are split into count
+    shards
+
+    The shard is determined by a hash of the path only. Therefore all
+    processes determine the same shard for a file, for example on different
+    CI nodes.
+
+    Args:
+        path: Path of the file relative to the root of the repository
+        count: Number of shards
+
+    Returns:
+        The number of the shard starting at 1
+    """
+    return zlib.crc32(path.encode("utf8")) % count + 1
+
+
+def shard_by_hash(
+    status_list: Iterable["StatusEntry"], number: int, count: int
+) -> list["StatusEntry"]:
+    """
+    Returns the status entries belonging to a shard
+
+    Args:
+        status_list: The status entries to split
+        number: Number of the shard starting at 1
+        count: Number of shards
+    """
+    return [
+        entry
+        for entry in status_list
+        if get_shard_number(entry.path.as_posix(), count) == number
+    ]
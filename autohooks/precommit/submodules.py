@@ -0,0 +1,132 @@
+# SPDX-FileCopyrightText: 2026 Greenbone AG
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+
+"""
+Run the pre-commit hooks of git submodules
+"""
+
+import os
+import subprocess
+from pathlib import Path
+
+from autohooks.hooks import PreCommitHook
+from autohooks.terminal import Terminal
+from autohooks.utils import exec_git, get_repository_context
+
+
+def _get_submodule_env() -> dict[str, str]:
+    # git exports variables like GIT_DIR and GIT_INDEX_FILE to its hooks. They
+    # must not be passed to the git commands of the submodules.
+    local_env_vars = set(exec_git("rev-parse", "--local-env-vars").split())
+    return {
+        key: value
+        for key, value in os.environ.items()
+        if key not in local_env_vars
+    }
+
+
+def _git(path: Path, env: dict[str, str], *args: str) -> int:
+    return subprocess.run(
+        ["git", "-C", str(path), *args],
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        check=False,
+    ).returncode
+
+
+def _get_pre_commit_hook(path: Path, env: dict[str, str]) -> PreCommitHook:
+    hook = subprocess.run(
+        ["git", "-C", str(path), "rev-parse", "--git-path", "hooks/pre-commit"],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout.strip()
+    return PreCommitHook(path / hook)
+
+
+def run_submodule_pre_commit_hook(
+    path: Path, env: dict[str, str]
+) -> tuple[int, str] | None:
+    """
+    Run the autohooks pre-commit hook of a submodule if the submodule has
+    staged changes
+
+    Args:
+        path: Path to the submodule
+        env: Environment for running the hook
+
+    Returns:
+        None if the hook hasn't been run. Otherwise a tuple containing the
+        exit code and the output of the hook.
+    """
+    if not _git(path, env, "diff", "--cached", "--quiet"):
+        # no staged changes
+        return None
+
+    pre_commit_hook = _get_pre_commit_hook(path, env)
+    if (
+        not pre_commit_hook.exists()
+        or not pre_commit_hook.is_autohooks_pre_commit_hook()
+    ):
+        return None
+
+    process = subprocess.run(
+        [str(pre_commit_hook.pre_commit_hook_path)],
+        cwd=path,
+        env=env,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+        check=False,
+    )
+    return process.returncode, process.stdout
+
+
+def run_submodules(term: Terminal) -> int:
+    """
+    Run the autohooks pre-commit hooks of all initialized submodules with
+    staged changes in parallel
+
+    Returns:
+        0 if all hooks succeeded. Otherwise the exit code of the first failed
+        hook.
+    """
+    context = get_repository_context()
+    paths = context.submodule_paths
+    if not paths:
+        return 0
+
+    # imported only if there are submodules to keep the hooks starting fast
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+
+    env = _get_submodule_env()
+    retval = 0
+
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        futures = {
+            executor.submit(run_submodule_pre_commit_hook, path, env): path
+            for path in paths
+        }
+        for future in as_completed(futures):
+            result = future.result()
+            if result is None:
+                continue
+
+            returncode, output = result
+            path = futures[future].relative_to(context.toplevel_path)
+            term.info(f"Running pre-commit hook of submodule {path}")
+            with term.indent():
+                if output.strip():
+                    term.out(output.rstrip())
+                if returncode:
+                    term.fail(
+                        f"pre-commit hook of submodule {path} failed with "
+                        f"exit code {returncode}."
+                    )
+                    retval = retval or returncode
+
+    return retval
@@ -0,0 +1,180 @@
+# SPDX-FileCopyrightText: 2026 Greenbone AG
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+
+"""
+Store the durations of previous plugin runs for scheduling the next runs
+"""
+
+from collections.abc import Iterable
+from pathlib import Path
+from types import TracebackType
+from typing import TYPE_CHECKING
+
+from typing_extensions import Self
+
+from autohooks.utils import GitError, get_autohooks_git_directory_path
+
+if TYPE_CHECKING:
+    import sqlite3
+
+# weight of a new duration compared to the previously stored duration
+_SMOOTHING = 0.5
+
+# seconds to wait for a lock of the database held by another hook process
+_TIMEOUT = 1.0
+
+# maximum number of variables per SQL statement supported by old SQLite
+# versions
+_MAX_VARIABLES = 999
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS plugin_durations (
+    plugin TEXT PRIMARY KEY,
+    duration REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS file_durations (
+    path TEXT PRIMARY KEY,
+    duration REAL NOT NULL
+);
+"""
+
+
+def get_timings_path() -> Path:
+    """
+    Returns the path of the timing store database of the repository
+    """
+    return get_autohooks_git_directory_path() / "timings.sqlite"
+
+
+class TimingStore:
+    """
+    A store of the durations of previous plugin runs
+
+    The durations are stored per plugin and per file in a SQLite database.
+    New durations are averaged with the stored durations to smooth outliers.
+    The store is best effort. If the database can't be accessed no durations
+    are returned and new durations are dropped.
+
+    Example: ::
+
+        with TimingStore() as store:
+            store.get_plugin_durations(["foo"])
+            store.add_plugin_durations({"foo": 1.5})
+    """
+
+    def __init__(self, path: Path | None = None) -> None:
+        """
+        Args:
+            path: Path of the database. By default the timings.sqlite file
+                in the autohooks directory within the git directory.
+        """
+        self.path = path
+        self._connection: sqlite3.Connection | None = None
+
+    def _connect(self) -> "sqlite3.Connection | None":
+        if self._connection is None:
+            # sqlite3 is imported only if durations are read or written to
+            # keep the hooks starting fast
+            import sqlite3
+
+            try:
+                if self.path is None:
+                    self.path = get_timings_path()
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                connection = sqlite3.connect(self.path, timeout=_TIMEOUT)
+                connection.executescript(_SCHEMA)
+                self._connection = connection
+            except (OSError, sqlite3.Error, GitError):
+                return None
+        return self._connection
+
+    def _get(self, table: str, keys: Iterable[str]) -> dict[str, float]:
+        keys = list(keys)
+        connection = self._connect() if keys else None
+        if connection is None:
+            return {}
+
+        import sqlite3
+
+        column = "plugin" if table == "plugin_durations" else "path"
+        durations: dict[str, float] = {}
+        try:
+            for start in range(0, len(keys), _MAX_VARIABLES):
+                chunk = keys[start : start + _MAX_VARIABLES]
+                placeholders = ", ".join("?" * len(chunk))
+                rows = connection.execute(
+                    f"SELECT {column}, duration FROM {table} "
+                    f"WHERE {column} IN ({placeholders})",
+                    chunk,
+                )
+                durations.update(rows)
+        except sqlite3.Error:
+            return {}
+        return durations
+
+    def _add(self, table: str, durations: dict[str, float]) -> None:
+        connection = self._connect() if durations else None
+        if connection is None:
+            return
+
+        import sqlite3
+
+        column = "plugin" if table == "plugin_durations" else "path"
+        try:
+            with connection:
+                connection.executemany(
+                    f"INSERT INTO {table} ({column}, duration) "
+                    f"VALUES (?, ?) ON CONFLICT({column}) DO UPDATE SET "
+                    f"duration = {1 - _SMOOTHING} * duration + "
+                    f"{_SMOOTHING} * excluded.duration",
+                    durations.items(),
+                )
+        except sqlite3.Error:
+            pass
+
+    def get_plugin_durations(self, names: Iterable[str]) -> dict[str, float]:
+        """
+        Returns the expected durations of plugins in seconds
+
+        Plugins without stored durations are not contained in the result.
+        """
+        return self._get("plugin_durations", names)
+
+    def add_plugin_durations(self, durations: dict[str, float]) -> None:
+        """
+        Store the durations of plugin runs in seconds
+        """
+        self._add("plugin_durations", durations)
+
+    def get_file_durations(self, paths: Iterable[str]) -> dict[str, float]:
+        """
+        Returns the expected durations of checking files in seconds
+
+        The paths are relative to the root of the repository. Files without
+        stored durations are not contained in the result.
+        """
+        return self._get("file_durations", paths)
+
+    def add_file_durations(self, durations: dict[str, float]) -> None:
+        """
+        Store the durations of checking files in seconds
+        """
+        self._add("file_durations", durations)
+
+    def close(self) -> None:
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
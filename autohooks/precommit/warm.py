@@ -0,0 +1,137 @@
+# SPDX-FileCopyrightText: 2026 Greenbone AG
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+
+"""
+Warm up the result cache in the background after switching branches or
+merging
+"""
+
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+from typing import Any
+
+from autohooks.config import AutohooksConfig, load_config_from_pyproject_toml
+from autohooks.hooks import PostCheckoutHook
+from autohooks.terminal import Terminal, _set_terminal
+from autohooks.utils import (
+    get_autohooks_git_directory_path,
+    get_repository_context,
+)
+
+
+def get_warm_up_log_path() -> Path:
+    """
+    Returns the path of the file containing the output of the last warm up
+    """
+    return get_autohooks_git_directory_path() / "warm-up.log"
+
+
+def get_warm_up_command(from_ref: str, to_ref: str) -> list[str]:
+    """
+    Returns the command for warming up the result cache in a separate process
+
+    The process is run with the lowest CPU and I/O priority if nice and ionice
+    are available.
+    """
+    command = [sys.executable, "-m", __name__, from_ref, to_ref]
+    if shutil.which("ionice"):
+        command = ["ionice", "-c", "3", *command]
+    if shutil.which("nice"):
+        command = ["nice", "-n", "19", *command]
+    return command
+
+
+def start_warm_up(from_ref: str, to_ref: str) -> subprocess.Popen:
+    """
+    Start warming up the result cache for the files changed between two
+    commits in a detached background process
+
+    The output of the process is written to the warm up log file.
+    """
+    kwargs: dict[str, Any] = {}
+    if sys.platform == "win32":
+        kwargs["creationflags"] = (
+            subprocess.IDLE_PRIORITY_CLASS | subprocess.CREATE_NEW_PROCESS_GROUP
+        )
+    else:
+        # don't get killed together with the git command
+        kwargs["start_new_session"] = True
+
+    log_path = get_warm_up_log_path()
+    log_path.parent.mkdir(parents=True, exist_ok=True)
+    with log_path.open("wb") as log:
+        return subprocess.Popen(
+            get_warm_up_command(from_ref, to_ref),
+            cwd=get_repository_context().toplevel_path,
+            stdin=subprocess.DEVNULL,
+            stdout=log,
+            stderr=subprocess.STDOUT,
+            **kwargs,
+        )
+
+
+def warm_up(
+    term: Terminal, config: AutohooksConfig, from_ref: str, to_ref: str
+) -> int:
+    """
+    Run the cached pre-commit plugins on the files changed between two
+    commits to store their results in the result cache
+
+    Args:
+        term: Terminal for the output
+        config: Config containing the plugins. The pre-commit plugins are
+            replaced by the plugins to run.
+        from_ref: The previous commit or the empty tree
+        to_ref: The commit checked out in the working tree
+
+    Returns:
+        0 if all plugins succeeded. Otherwise the result of the first failed
+        plugin.
+    """
+    # avoid a circular import because the runner starts the warm up and the
+    # plugin API imports the runner
+    from autohooks.api.git import get_changed_status
+    from autohooks.precommit.run import run_plugins
+
+    names = config.get_script_names(PostCheckoutHook.name)
+    if not names:
+        return 0
+
+    context = get_repository_context()
+    # only the files in the working tree can be checked
+    status_list = [
+        entry
+        for entry in get_changed_status(from_ref, to_ref)
+        if entry.absolute_path().is_file()
+    ]
+    if not status_list:
+        return 0
+
+    config.settings.pre_commit = names  # type: ignore[union-attr]
+    context.status_list = status_list
+    try:
+        return run_plugins(
+            term, config, title=f"warm up {from_ref[:12]}...{to_ref[:12]}"
+        )
+    finally:
+        context.status_list = None
+
+
+def main(args: list[str] | None = None) -> int:
+    from_ref, to_ref = sys.argv[1:] if args is None else args
+
+    term = Terminal()
+    _set_terminal(term)
+
+    config = load_config_from_pyproject_toml()
+    get_repository_context().fsmonitor = config.has_fsmonitor_enabled()
+
+    return warm_up(term, config, from_ref, to_ref)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,337 @@
+# SPDX-FileCopyrightText: 2026 Greenbone AG
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+
+"""
+Watch the working tree and check the changed files in the background
+"""
+
+import ctypes
+import ctypes.util
+import errno
+import os
+import select
+import struct
+import subprocess
+import sys
+import time
+from abc import ABC, abstractmethod
+from pathlib import Path
+from types import TracebackType
+
+from typing_extensions import Self
+
+from autohooks.config import AutohooksConfig
+from autohooks.precommit.run import run_plugins
+from autohooks.terminal import Terminal
+from autohooks.utils import get_repository_context
+
+# inotify flags and events. see inotify(7)
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+IN_MODIFY = 0x00000002
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ONLYDIR = 0x01000000
+IN_ISDIR = 0x40000000
+
+_WATCH_MASK = (
+    IN_MODIFY
+    | IN_ATTRIB
+    | IN_CLOSE_WRITE
+    | IN_MOVED_FROM
+    | IN_MOVED_TO
+    | IN_CREATE
+    | IN_DELETE
+    | IN_ONLYDIR
+)
+
+# struct inotify_event without the variable length name
+_EVENT = struct.Struct("iIII")
+
+# directories which are never watched
+_EXCLUDED_DIRECTORIES = {".git"}
+
+
+def _walk_directories(path: Path) -> list[Path]:
+    directories = []
+    for root, dirs, _ in os.walk(path):
+        dirs[:] = [d for d in dirs if d not in _EXCLUDED_DIRECTORIES]
+        directories.append(Path(root))
+    return directories
+
+
+class Watcher(ABC):
+    """
+    Base class for watching a directory tree for changes
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+
+    @abstractmethod
+    def wait(self, timeout: float | None = None) -> set[Path]:
+        """
+        Wait for changes in the directory tree
+
+        Args:
+            timeout: Maximum time to wait in seconds. None waits until a
+                change occurs.
+
+        Returns:
+            The changed paths. Empty if no change occurred until the timeout.
+        """
+
+    def close(self) -> None:
+        pass
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+
+class InotifyWatcher(Watcher):
+    """
+    Watch a directory tree with the inotify API of Linux
+
+    Raises:
+        OSError: If inotify is not available or the directories can't be
+            watched, for example because the limit of watches is exceeded.
+    """
+
+    def __init__(self, path: Path) -> None:
+        super().__init__(path)
+        self._watches: dict[int, Path] = {}
+
+        library = ctypes.util.find_library("c") or "libc.so.6"
+        self._libc = ctypes.CDLL(library, use_errno=True)
+        self._fd = self._libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self._fd < 0:
+            self._raise_error()
+
+        try:
+            self._add_tree(path)
+        except OSError:
+            self.close()
+            raise
+
+    def _raise_error(self) -> None:
+        error = ctypes.get_errno()
+        raise OSError(error, os.strerror(error))
+
+    def _add_tree(self, path: Path) -> None:
+        for directory in _walk_directories(path):
+            wd = self._libc.inotify_add_watch(
+                self._fd, os.fsencode(directory), _WATCH_MASK
+            )
+            if wd < 0:
+                if ctypes.get_errno() in (errno.ENOENT, errno.ENOTDIR):
+                    # the directory has been removed in the meantime
+                    continue
+                self._raise_error()
+            self._watches[wd] = directory
+
+    def _read(self) -> bytes:
+        data = b""
+        while True:
+            try:
+                chunk = os.read(self._fd, 65536)
+            except BlockingIOError:
+                return data
+            if not chunk:
+                return data
+            data += chunk
+
+    def wait(self, timeout: float | None = None) -> set[Path]:
+        readable, _, _ = select.select([self._fd], [], [], timeout)
+        if not readable:
+            return set()
+
+        data = self._read()
+        changed = set()
+        offset = 0
+        while offset < len(data):
+            wd, mask, _cookie, length = _EVENT.unpack_from(data, offset)
+            offset += _EVENT.size
+            name = data[offset : offset + length].rstrip(b"\0")
+            offset += length
+
+            if mask & IN_Q_OVERFLOW:
+                # events have been lost
+                changed.add(self.path)
+                continue
+
+            if mask & IN_IGNORED:
+                self._watches.pop(wd, None)
+                continue
+
+            directory = self._watches.get(wd)
+            if directory is None:
+                continue
+
+            path = directory / os.fsdecode(name) if name else directory
+            if path.name in _EXCLUDED_DIRECTORIES:
+                continue
+
+            changed.add(path)
+            if mask & IN_ISDIR and mask & (IN_CREATE | IN_MOVED_TO):
+                self._add_tree(path)
+
+        return changed
+
+    def close(self) -> None:
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+
+class PollingWatcher(Watcher):
+    """
+    Watch a directory tree by comparing the modification times of the files
+
+    Args:
+        path: Directory to watch
+        interval: Seconds between two scans of the directory tree
+    """
+
+    def __init__(self, path: Path, *, interval: float = 1.0) -> None:
+        super().__init__(path)
+        self.interval = interval
+        self._snapshot = self._scan()
+
+    def _scan(self) -> dict[Path, tuple[int, int]]:
+        snapshot = {}
+        for directory in _walk_directories(self.path):
+            try:
+                entries = list(os.scandir(directory))
+            except OSError:
+                continue
+            for entry in entries:
+                try:
+                    if entry.is_file(follow_symlinks=False):
+                        stat = entry.stat(follow_symlinks=False)
+                        snapshot[Path(entry.path)] = (
+                            stat.st_mtime_ns,
+                            stat.st_size,
+                        )
+                except OSError:
+                    continue
+        return snapshot
+
+    def wait(self, timeout: float | None = None) -> set[Path]:
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            snapshot = self._scan()
+            changed = {
+                path
+                for path in snapshot.keys() | self._snapshot.keys()
+                if snapshot.get(path) != self._snapshot.get(path)
+            }
+            self._snapshot = snapshot
+            if changed:
+                return changed
+
+            if deadline is None:
+                time.sleep(self.interval)
+                continue
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return set()
+            time.sleep(min(self.interval, remaining))
+
+
+def get_watcher(path: Path, *, polling: bool = False) -> Watcher:
+    """
+    Returns a watcher for a directory tree
+
+    inotify is used on Linux. If it isn't available or polling is requested
+    the directory tree is polled for changes.
+    """
+    if not polling and sys.platform.startswith("linux"):
+        try:
+            return InotifyWatcher(path)
+        except (OSError, AttributeError):
+            pass
+    return PollingWatcher(path)
+
+
+def _filter_ignored(paths: set[Path]) -> set[Path]:
+    # remove the paths ignored by git, e.g. caches written by the plugins
+    if not paths:
+        return paths
+
+    process = subprocess.run(
+        ["git", "check-ignore", "-z", "--stdin"],
+        input=b"\0".join(os.fsencode(path) for path in paths),
+        capture_output=True,
+        check=False,
+    )
+    ignored = {
+        Path(os.fsdecode(path)) for path in process.stdout.split(b"\0") if path
+    }
+    return paths - ignored
+
+
+def watch(
+    term: Terminal,
+    config: AutohooksConfig,
+    watcher: Watcher,
+    *,
+    debounce: float = 0.5,
+    max_runs: int | None = None,
+) -> None:
+    """
+    Check the files changed in the working tree whenever files change
+
+    The pre-commit plugins are run for all files which would be committed if
+    all changes were staged. The successful results of the plugins configured
+    for caching are stored. Therefore these plugins don't need to run again
+    when committing the same file contents.
+
+    Args:
+        term: Terminal for the output
+        config: Config containing the plugins to run
+        watcher: Watcher of the working tree
+        debounce: Seconds without further changes before running the plugins
+        max_runs: Return after running the plugins max_runs times. By default
+            the files are watched forever.
+    """
+    # avoid a circular import because the plugin API imports the runner
+    from autohooks.api.git import get_uncommitted_status
+
+    context = get_repository_context()
+    runs = 0
+    while max_runs is None or runs < max_runs:
+        if runs:
+            changed = _filter_ignored(watcher.wait())
+            # wait until the files don't change anymore
+            while more := watcher.wait(debounce):
+                changed |= _filter_ignored(more)
+            if not changed:
+                continue
+
+        status_list = get_uncommitted_status()
+        runs += 1
+        if not status_list:
+            continue
+
+        context.status_list = status_list
+        try:
+            run_plugins(term, config, title="changed files")
+        finally:
+            context.status_list = None
@@ -0,0 +1,230 @@
+# SPDX-FileCopyrightText: 2026 Greenbone AG
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+
+"""
+Run plugins isolated in a pool of pre-forked worker processes
+"""
+
+from collections.abc import Callable, Iterable, Iterator
+from queue import Empty
+from types import TracebackType
+from typing import TYPE_CHECKING, Any
+
+from typing_extensions import Self
+
+from autohooks.terminal import Terminal
+
+if TYPE_CHECKING:
+    from concurrent.futures import Future
+
+# queue for sending messages from a worker process to the parent process
+_queue: Any = None
+
+# time in seconds to wait for a new message before checking the workers
+_POLL_INTERVAL = 0.1
+
+Message = tuple[Any, ...]
+
+
+def is_worker_pool_supported() -> bool:
+    """
+    Returns True if worker processes can be forked on this platform
+    """
+    # multiprocessing is imported only if workers are configured to keep the
+    # hooks starting fast
+    import multiprocessing
+
+    return "fork" in multiprocessing.get_all_start_methods()
+
+
+def send_message(name: str, kind: str, *args: Any) -> None:
+    """
+    Send a message from a worker process to the parent process
+
+    Args:
+        name: Name of the plugin the message belongs to
+        kind: Kind of the message
+        *args: Payload of the message
+    """
+    _queue.put((name, kind, *args))
+
+
+def _run_isolated(fn: Callable[..., Any], *args: Any) -> None:
+    # each task runs in a fresh fork of the worker. therefore changes of the
+    # global state by a task, e.g. to sys.path or to the loaded modules, don't
+    # leak into the tasks run later by the same worker.
+    import multiprocessing
+
+    process = multiprocessing.get_context("fork").Process(target=fn, args=args)
+    process.start()
+    process.join()
+    if process.exitcode:
+        raise ChildProcessError(
+            f"Task exited unexpectedly with {process.exitcode}."
+        )
+
+
+def _init_worker(
+    queue: Any, initializer: Callable[..., None] | None, initargs: tuple
+) -> None:
+    global _queue  # pylint: disable=global-statement  # noqa: PLW0603
+    _queue = queue
+
+    if initializer:
+        initializer(*initargs)
+
+
+class QueueTerminal(Terminal):
+    """
+    A terminal that forwards all output of a plugin running in a worker process
+    to the parent process
+    """
+
+    def __init__(self, name: str) -> None:
+        super().__init__()
+        self._name = name
+
+    def _send(self, method: str, messages: Iterable[Any]) -> None:
+        send_message(
+            self._name, "terminal", method, " ".join(str(m) for m in messages)
+        )
+
+    def out(self, *messages: Any, **kwargs: Any) -> None:
+        self._send("out", messages)
+
+    def print(self, *messages: Any, **kwargs: Any) -> None:
+        self._send("print", messages)
+
+    def ok(self, *messages: Any, **kwargs: Any) -> None:
+        self._send("ok", messages)
+
+    def fail(self, *messages: Any, **kwargs: Any) -> None:
+        self._send("fail", messages)
+
+    def error(self, *messages: Any, **kwargs: Any) -> None:
+        self._send("error", messages)
+
+    def warning(self, *messages: Any, **kwargs: Any) -> None:
+        self._send("warning", messages)
+
+    def info(self, *messages: Any, **kwargs: Any) -> None:
+        self._send("info", messages)
+
+    def bold_info(self, *messages: Any, **kwargs: Any) -> None:
+        self._send("bold_info", messages)
+
+
+class QueueProgress:
+    """
+    A progress that forwards all updates of a plugin running in a worker
+    process to the parent process
+    """
+
+    def __init__(self, name: str) -> None:
+        self._name = name
+
+    def update(self, task_id: Any, *, total: float | None = None) -> None:
+        send_message(self._name, "total", total)
+
+    def advance(self, task_id: Any, advance: float = 1) -> None:
+        send_message(self._name, "advance", advance)
+
+
+class WorkerPool:
+    """
+    A pool of worker processes
+
+    All processes are forked when the first task is submitted. Therefore all
+    modules imported up to this point are already loaded in the workers and
+    don't need to be imported again. Each task is run in a fresh fork of a
+    worker process, so tasks are isolated from the global state changed by
+    the previous tasks of the same worker.
+
+    Example: ::
+
+        with WorkerPool(4) as pool:
+            future = pool.submit(do_something, "foo")
+            for name, kind, *args in pool.messages([future]):
+                handle_message(name, kind, args)
+    """
+
+    def __init__(
+        self,
+        workers: int,
+        *,
+        initializer: Callable[..., None] | None = None,
+        initargs: tuple = (),
+    ) -> None:
+        """
+        Args:
+            workers: Number of worker processes
+            initializer: Optional callable to run in each worker process after
+                it has been forked
+            initargs: Arguments for the initializer. The arguments are not
+                pickled because the workers are forked.
+        """
+        import multiprocessing
+        from concurrent.futures import ProcessPoolExecutor
+
+        context = multiprocessing.get_context("fork")
+        self._queue = context.Queue()
+        self._executor = ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=context,
+            initializer=_init_worker,
+            initargs=(self._queue, initializer, initargs),
+        )
+
+    def submit(self, fn: Callable[..., Any], *args: Any) -> "Future":
+        """
+        Run a callable in a fork of one of the worker processes
+
+        The return value of the callable is discarded. The callable has to
+        send its results via :py:func:`send_message`.
+        """
+        return self._executor.submit(_run_isolated, fn, *args)
+
+    def messages(
+        self, futures: Iterable["Future"], *, last: str = "result"
+    ) -> Iterator[Message]:
+        """
+        Iterate over the messages sent by the workers until all tasks have
+        sent their last message or a task has been terminated unexpectedly.
+
+        Args:
+            futures: The futures of the submitted tasks
+            last: Kind of the message each task sends last
+        """
+        futures = list(futures)
+        pending = len(futures)
+        while pending:
+            try:
+                message = self._queue.get(timeout=_POLL_INTERVAL)
+            except Empty:
+                if any(
+                    future.done() and future.exception() for future in futures
+                ):
+                    return
+                continue
+
+            if message[1] == last:
+                pending -= 1
+
+            yield message
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(cancel_futures=True)
+        self._queue.close()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.shutdown()
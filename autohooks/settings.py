@@ -55,6 +55,17 @@ class Mode(Enum):
 class AutohooksSettings:
     mode: Mode = Mode.UNDEFINED
     pre_commit: Iterable[str] = field(default_factory=list)
+    pre_push: Iterable[str] = field(default_factory=list)
+    commit_msg: Iterable[str] = field(default_factory=list)
+    workers: int = 0
+    shard_plugins: Iterable[str] = field(default_factory=list)
+    cache_plugins: Iterable[str] = field(default_factory=list)
+    warm_cache: bool = False
+    shared_cache: str | None = None
+    cache_max_size: int | None = None
+    cache_max_age: int | None = None
+    submodules: bool = False
+    fsmonitor: bool = False
 
     def write(self, filename: Path) -> None:
         """
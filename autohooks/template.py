@@ -32,6 +32,45 @@ def get_pre_commit_hook_template_path() -> Path:
     return setup_dir_path / "precommit" / "template"
 
 
+def get_hook_template_path() -> Path:
+    """
+    Returns the path to the template of all git hooks except the pre-commit
+    hook
+    """
+    setup_dir_path = get_autohooks_directory_path()
+    return setup_dir_path / "precommit" / "hook_template"
+
+
+def get_background_hook_template_path() -> Path:
+    """
+    Returns the path to the template of the git hooks running after a git
+    command has finished, like the post-checkout hook
+    """
+    setup_dir_path = get_autohooks_directory_path()
+    return setup_dir_path / "precommit" / "background_hook_template"
+
+
+def get_shebang(mode: Mode) -> str:
+    """
+    Returns the shebang for running a git hook in a mode
+    """
+    mode = mode.get_effective_mode()
+
+    if mode == Mode.PIPENV:
+        return PIPENV_SHEBANG
+    if mode == Mode.POETRY:
+        return POETRY_SHEBANG
+    if mode == Mode.UV:
+        return UV_SHEBANG
+    if mode == Mode.PIPENV_MULTILINE:
+        return PIPENV_MULTILINE_SHEBANG
+    if mode == Mode.POETRY_MULTILINE:
+        return POETRY_MULTILINE_SHEBANG
+    if mode == Mode.UV_MULTILINE:
+        return UV_MULTILINE_SHEBANG
+    return PYTHON3_SHEBANG
+
+
 class PreCommitTemplate:
     def __init__(self, template_path: Path | None = None) -> None:
         if template_path is None:
@@ -41,24 +80,37 @@ class PreCommitTemplate:
     def _load(self, template_path: Path) -> None:
         self._template = Template(template_path.read_text())
 
-    def render(self, *, mode: Mode) -> str:
-        mode = mode.get_effective_mode()
-
-        params: dict[str, str | int] = {"VERSION": TEMPLATE_VERSION}
-
-        if mode == Mode.PIPENV:
-            params["SHEBANG"] = PIPENV_SHEBANG
-        elif mode == Mode.POETRY:
-            params["SHEBANG"] = POETRY_SHEBANG
-        elif mode == Mode.UV:
-            params["SHEBANG"] = UV_SHEBANG
-        elif mode == Mode.PIPENV_MULTILINE:
-            params["SHEBANG"] = PIPENV_MULTILINE_SHEBANG
-        elif mode == Mode.POETRY_MULTILINE:
-            params["SHEBANG"] = POETRY_MULTILINE_SHEBANG
-        elif mode == Mode.UV_MULTILINE:
-            params["SHEBANG"] = UV_MULTILINE_SHEBANG
-        else:
-            params["SHEBANG"] = PYTHON3_SHEBANG
+    def _params(self) -> dict[str, str | int]:
+        return {}
 
+    def render(self, *, mode: Mode) -> str:
+        params: dict[str, str | int] = {
+            "VERSION": TEMPLATE_VERSION,
+            "SHEBANG": get_shebang(mode),
+            **self._params(),
+        }
         return self._template.safe_substitute(params)
+
+
+class HookTemplate(PreCommitTemplate):
+    """
+    Template of a git hook other than the pre-commit hook
+
+    Args:
+        hook_name: Name of the git hook, for example "pre-push"
+        git_command: The git command running the hook, for example "push"
+        template_path: Optional path to the template file
+    """
+
+    def __init__(
+        self,
+        hook_name: str,
+        git_command: str,
+        template_path: Path | None = None,
+    ) -> None:
+        self.hook_name = hook_name
+        self.git_command = git_command
+        super().__init__(template_path or get_hook_template_path())
+
+    def _params(self) -> dict[str, str | int]:
+        return {"HOOK": self.hook_name, "GIT_COMMAND": self.git_command}
@@ -3,20 +3,26 @@
 # SPDX-License-Identifier: GPL-3.0-or-later
 #
 
+import threading
+from typing import Any
 
 from pontos.helper import deprecated
 from pontos.terminal.rich import RichTerminal as Terminal
 from pontos.terminal.terminal import Signs
 from rich.progress import (
     BarColumn,
+    ProgressColumn,
     SpinnerColumn,
+    Task,
     TaskProgressColumn,
     TextColumn,
 )
 from rich.progress import Progress as RichProgress
+from rich.text import Text
 from typing_extensions import Self
 
 __all__ = (
+    "BufferedTerminal",
     "Progress",
     "Signs",
     "Terminal",
@@ -31,6 +37,9 @@ __all__ = (
 
 __term = Terminal()
 
+# ensures that buffered output is written at once
+_output_lock = threading.RLock()
+
 
 def ok(message: str) -> None:
     """
@@ -116,6 +125,96 @@ def _set_terminal(term: Terminal | None = None) -> Terminal:
     return __term
 
 
+class BufferedTerminal(Terminal):
+    """
+    A terminal that buffers all output until it is flushed
+
+    It allows to collect the output of plugins running concurrently and to
+    print the output of each plugin at once.
+
+    Example: ::
+
+        buffer = BufferedTerminal()
+        buffer.info("Running foo")
+        with buffer.indent():
+            buffer.ok("foo succeeded")
+
+        buffer.flush(term)
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._lock = threading.Lock()
+        self._messages: list[tuple[int, str, tuple[Any, ...], dict]] = []
+
+    def _add(
+        self, method: str, messages: tuple[Any, ...], kwargs: dict
+    ) -> None:
+        with self._lock:
+            self._messages.append((self._indent, method, messages, kwargs))
+
+    def out(self, *messages: Any, **kwargs: Any) -> None:
+        self._add("out", messages, kwargs)
+
+    def print(self, *messages: Any, **kwargs: Any) -> None:
+        self._add("print", messages, kwargs)
+
+    def ok(self, *messages: Any, **kwargs: Any) -> None:
+        self._add("ok", messages, kwargs)
+
+    def fail(self, *messages: Any, **kwargs: Any) -> None:
+        self._add("fail", messages, kwargs)
+
+    def error(self, *messages: Any, **kwargs: Any) -> None:
+        self._add("error", messages, kwargs)
+
+    def warning(self, *messages: Any, **kwargs: Any) -> None:
+        self._add("warning", messages, kwargs)
+
+    def info(self, *messages: Any, **kwargs: Any) -> None:
+        self._add("info", messages, kwargs)
+
+    def bold_info(self, *messages: Any, **kwargs: Any) -> None:
+        self._add("bold_info", messages, kwargs)
+
+    def flush(self, term: Terminal) -> None:
+        """
+        Write all buffered output to a terminal at once
+
+        Output of other buffered terminals is not interleaved.
+
+        Args:
+            term: Terminal to write the output to
+        """
+        with self._lock:
+            messages = self._messages
+            self._messages = []
+
+        with _output_lock:
+            for indent, method, args, kwargs in messages:
+                with term.indent(indent):
+                    getattr(term, method)(*args, **kwargs)
+
+
+class ExpectedRemainingColumn(ProgressColumn):
+    """
+    Renders the expected remaining time of a task
+
+    The time is calculated from the expected duration of the task passed as
+    expected field in seconds, for example from the duration of the previous
+    run. Nothing is rendered if the expected duration is unknown.
+    """
+
+    def render(self, task: Task) -> Text:
+        expected = task.fields.get("expected")
+        if expected is None or task.finished or task.elapsed is None:
+            return Text("")
+
+        remaining = int(max(expected - task.elapsed, 0))
+        minutes, seconds = divmod(remaining, 60)
+        return Text(f"~{minutes}:{seconds:02} left", style="progress.remaining")
+
+
 class Progress(RichProgress):
     def __init__(self, terminal: Terminal) -> None:
         super().__init__(
@@ -123,6 +222,7 @@ class Progress(RichProgress):
             TextColumn("[progress.description]{task.description}"),
             BarColumn(),
             TaskProgressColumn(),
+            ExpectedRemainingColumn(),
             console=terminal._console,
             transient=True,
         )
@@ -5,7 +5,12 @@
 
 import shlex
 import subprocess
+from functools import cache, cached_property
 from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from autohooks.api.git import StatusEntry
 
 
 class GitError(subprocess.CalledProcessError):
@@ -56,16 +61,7 @@ def get_git_directory_path() -> Path:
     Returns:
         Absolute path to .git dir.
     """
-    pwd = Path.cwd()
-
-    git_dir = exec_git("-C", str(pwd), "rev-parse", "--git-dir").rstrip()
-
-    if pwd and str(pwd) not in git_dir:
-        git_dir_path = Path(pwd) / git_dir
-    else:
-        git_dir_path = Path(git_dir)
-
-    return git_dir_path.resolve()
+    return get_repository_context().git_directory_path
 
 
 def get_autohooks_directory_path() -> Path:
@@ -91,10 +87,21 @@ def get_git_hook_directory_path(git_dir_path: Path | None = None) -> Path:
     """
 
     if git_dir_path is None:
-        git_dir_path = get_git_directory_path()
+        return get_repository_context().hook_directory_path
     return git_dir_path / "hooks"
 
 
+def get_autohooks_git_directory_path() -> Path:
+    """
+    Returns the absolute path to the directory for the data of autohooks
+    within the git dir.
+
+    The directory is shared by all working trees of the repository. It may
+    not exist yet.
+    """
+    return get_repository_context().git_common_directory_path / "autohooks"
+
+
 def is_project_root(path: Path) -> bool:
     """
     Checks if the given dir is the project root dir.
@@ -119,6 +126,17 @@ def is_project_root(path: Path) -> bool:
     )
 
 
+def _find_project_root_path(path: Path) -> Path:
+    if is_project_root(path):
+        return path
+
+    for parent in path.parents:
+        if is_project_root(parent):
+            return parent
+
+    return path
+
+
 def get_project_root_path(path: Path | None = None) -> Path:
     """
     Returns the path to the project root dir.
@@ -131,18 +149,9 @@ def get_project_root_path(path: Path | None = None) -> Path:
     """
 
     if path is None:
-        path = Path.cwd()
+        return get_repository_context().project_root_path
 
-    path.resolve()
-
-    if is_project_root(path):
-        return path
-
-    for parent in path.parents:
-        if is_project_root(parent):
-            return parent
-
-    return path
+    return _find_project_root_path(path)
 
 
 def get_project_autohooks_plugins_path(path: Path | None = None) -> Path:
@@ -175,6 +184,172 @@ def get_pyproject_toml_path(path: Path | None = None) -> Path:
     return root / "pyproject.toml"
 
 
+# file mode of submodules in the git index
+GITLINK_MODE = "160000"
+
+
+class RepositoryContext:
+    """
+    Paths of a project and its git repository
+
+    All paths are determined only once when they are accessed for the first
+    time. The git paths are determined with a single git call.
+
+    Attributes:
+        path: The directory the paths are determined from
+        fsmonitor: Use the builtin file system monitor of git when querying
+            the status of the working tree
+        commit_range: An optional tuple of two commits. If set the files
+            changed between the commits are considered as staged instead of
+            the files changed in the index.
+        tracked_files: An optional list of pathspecs. If set the tracked
+            files matching the pathspecs are considered as staged instead of
+            the files changed in the index. An empty list matches all tracked
+            files.
+        status_list: An optional list of status entries. If set the entries
+            are considered as staged instead of querying git. It is used for
+            passing a shard of the files to a plugin.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.fsmonitor = False
+        self.commit_range: tuple[str, str] | None = None
+        self.tracked_files: list[Path] | None = None
+        self.status_list: list[StatusEntry] | None = None
+
+    @cached_property
+    def project_root_path(self) -> Path:
+        """
+        Path to the project root dir. See :py:func:`is_project_root`.
+        """
+        return _find_project_root_path(self.path)
+
+    @cached_property
+    def _git_paths(self) -> tuple[Path, Path, Path, Path]:
+        output = exec_git(
+            "-C",
+            str(self.path),
+            "rev-parse",
+            "--show-toplevel",
+            "--git-dir",
+            "--git-common-dir",
+            "--git-path",
+            "hooks",
+        )
+        toplevel, git_dir, git_common_dir, hooks_dir = output.splitlines()[:4]
+        # the git dirs may be relative to the current directory
+        return (
+            Path(toplevel).resolve(),
+            (self.path / git_dir).resolve(),
+            (self.path / git_common_dir).resolve(),
+            (self.path / hooks_dir).resolve(),
+        )
+
+    @cached_property
+    def has_fsmonitor_configured(self) -> bool:
+        """
+        True if core.fsmonitor is set in the git config of the repository
+        """
+        return bool(
+            exec_git(
+                "-C",
+                str(self.path),
+                "config",
+                "--get",
+                "core.fsmonitor",
+                ignore_errors=True,
+            ).strip()
+        )
+
+    @property
+    def toplevel_path(self) -> Path:
+        """
+        Absolute path to the top-level directory of the working tree
+        """
+        return self._git_paths[0]
+
+    @property
+    def git_directory_path(self) -> Path:
+        """
+        Absolute path to the .git dir. For a linked working tree this is the
+        private git dir of the working tree.
+        """
+        return self._git_paths[1]
+
+    @property
+    def git_common_directory_path(self) -> Path:
+        """
+        Absolute path to the .git dir shared by all working trees
+        """
+        return self._git_paths[2]
+
+    @property
+    def hook_directory_path(self) -> Path:
+        """
+        Absolute path to the git hooks dir
+
+        The hooks dir is shared by all working trees and can be changed via
+        the core.hooksPath git setting.
+        """
+        return self._git_paths[3]
+
+    @cached_property
+    def empty_tree(self) -> str:
+        """
+        Object name of the empty tree in the object format of the repository
+        """
+        return exec_git(
+            "-C", str(self.path), "hash-object", "-t", "tree", "/dev/null"
+        ).strip()
+
+    @cached_property
+    def submodule_paths(self) -> list[Path]:
+        """
+        Absolute paths of all initialized submodules
+        """
+        output = exec_git(
+            "-C", str(self.toplevel_path), "ls-files", "--stage", "-z"
+        )
+        paths = []
+        for line in output.split("\0"):
+            if not line.startswith(f"{GITLINK_MODE} "):
+                continue
+
+            path = self.toplevel_path / line.split("\t", 1)[1]
+            if (path / ".git").exists():
+                paths.append(path)
+
+        return paths
+
+
+@cache
+def _get_repository_context(path: Path) -> RepositoryContext:
+    return RepositoryContext(path)
+
+
+def get_repository_context(path: Path | None = None) -> RepositoryContext:
+    """
+    Returns the repository context for a directory
+
+    The context is created only once per process and directory.
+
+    Args:
+        path: Path to the directory. By default the current working dir.
+    """
+    if path is None:
+        path = Path.cwd()
+    return _get_repository_context(path)
+
+
+def clear_repository_context() -> None:
+    """
+    Drop all repository contexts, for example if a git repository has been
+    moved
+    """
+    _get_repository_context.cache_clear()
+
+
 def is_split_env():
     """
     Checks that environment supports -S option (separate arguments).
@@ -0,0 +1,28 @@
+# SPDX-FileCopyrightText: 2026 Greenbone AG
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+
+"""
+Benchmarks for autohooks
+
+The benchmarks create a synthetic git repository in a temporary directory and
+measure the plugin API and the pre-commit runner against it. Run all
+benchmarks with ``python -m benchmarks``. The size of the repository can be
+configured, for example: ::
+
+    python -m benchmarks --files 200000 --staged 50 --partially-staged 10
+
+To detect regressions store the results of a baseline and compare later runs
+with it: ::
+
+    python -m benchmarks --save baseline.json
+    python -m benchmarks --compare baseline.json
+
+The startup time of the rendered pre-commit hook is measured separately for
+each mode with ``python -m benchmarks.startup``. Pass ``--budget`` and
+``--import-budget`` to fail if the hook gets too slow to start.
+
+New benchmarks are registered with the :py:func:`benchmarks.suite.benchmark`
+decorator.
+"""
@@ -0,0 +1,169 @@
+# SPDX-FileCopyrightText: 2026 Greenbone AG
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+
+"""
+Run the benchmarks against a synthetic git repository
+"""
+
+import os
+import sys
+from argparse import ArgumentParser, Namespace
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from autohooks.utils import exec_git
+
+from . import git, path, precommit  # noqa: F401 register the benchmarks
+from .repository import create_repository
+from .suite import (
+    Result,
+    compare_results,
+    get_benchmarks,
+    load_results,
+    measure,
+    save_results,
+)
+
+
+def parse_args(args: list[str] | None = None) -> Namespace:
+    parser = ArgumentParser(
+        prog="python -m benchmarks", description=__doc__.strip()
+    )
+    parser.add_argument(
+        "-k",
+        dest="patterns",
+        action="append",
+        metavar="PATTERN",
+        help="Only run the benchmarks whose name contains PATTERN.",
+    )
+    parser.add_argument(
+        "--list", action="store_true", help="List the benchmarks and exit."
+    )
+    parser.add_argument(
+        "--files", type=int, default=10000, help="Number of tracked files."
+    )
+    parser.add_argument(
+        "--staged",
+        type=int,
+        default=10,
+        help="Number of files with staged changes.",
+    )
+    parser.add_argument(
+        "--partially-staged",
+        type=int,
+        default=5,
+        help="Number of files with staged and unstaged changes.",
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=5,
+        help="Number of measurements per benchmark.",
+    )
+    parser.add_argument(
+        "--save", type=Path, metavar="FILE", help="Store the results as JSON."
+    )
+    parser.add_argument(
+        "--compare",
+        type=Path,
+        metavar="FILE",
+        help="Compare the results with previously stored results.",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="Relative slowdown of the median reported as a regression. "
+        "Default: %(default)s",
+    )
+    return parser.parse_args(args)
+
+
+def _format_duration(seconds: float) -> str:
+    return f"{seconds * 1000:10.2f} ms"
+
+
+def run_benchmarks(args: Namespace) -> dict[str, Result]:
+    benchmarks = get_benchmarks(args.patterns)
+    results = {}
+    cwd = Path.cwd()
+
+    with TemporaryDirectory() as tempdir:
+        repository = create_repository(
+            Path(tempdir),
+            files=args.files,
+            staged=args.staged,
+            partially_staged=args.partially_staged,
+        )
+
+        os.chdir(tempdir)
+        try:
+            for bench in benchmarks:
+                result = measure(bench, repository, repeat=args.repeat)
+                results[bench.name] = result
+                print(
+                    f"{bench.name:36} min {_format_duration(result.min)}  "
+                    f"median {_format_duration(result.median)}"
+                )
+        finally:
+            exec_git(
+                "-C", tempdir, "fsmonitor--daemon", "stop", ignore_errors=True
+            )
+            os.chdir(cwd)
+
+    return results
+
+
+def main(args: list[str] | None = None) -> int:
+    parsed_args = parse_args(args)
+
+    if parsed_args.list:
+        for bench in get_benchmarks(parsed_args.patterns):
+            print(bench.name)
+        return 0
+
+    parameters = {
+        "files": parsed_args.files,
+        "staged": parsed_args.staged,
+        "partially_staged": parsed_args.partially_staged,
+    }
+    print(
+        ", ".join(f"{key}={value}" for key, value in parameters.items()),
+        end="\n\n",
+    )
+
+    results = run_benchmarks(parsed_args)
+
+    if parsed_args.save:
+        save_results(parsed_args.save, results, parameters=parameters)
+
+    if not parsed_args.compare:
+        return 0
+
+    baseline_parameters, baseline = load_results(parsed_args.compare)
+    print()
+    if baseline_parameters != parameters:
+        print(
+            f"Warning: The baseline has been created with different "
+            f"parameters {baseline_parameters}."
+        )
+
+    regressions = 0
+    for comparison in compare_results(baseline, results):
+        regression = comparison.is_regression(parsed_args.threshold)
+        regressions += regression
+        print(
+            f"{comparison.name:36} "
+            f"{_format_duration(comparison.baseline)} -> "
+            f"{_format_duration(comparison.current)} "
+            f"{comparison.change:+8.1%}"
+            f"{'  REGRESSION' if regression else ''}"
+        )
+
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
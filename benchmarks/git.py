@@ -0,0 +1,61 @@
+# SPDX-FileCopyrightText: 2026 Greenbone AG
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+
+"""
+Benchmarks for the git plugin API
+"""
+
+from autohooks.api.git import (
+    get_staged_status,
+    get_status,
+    stage_files,
+    stash_unstaged_changes,
+)
+from autohooks.utils import exec_git, get_repository_context
+
+from .repository import Repository
+from .suite import benchmark
+
+
+@benchmark("git.get_status")
+def status(_repository: Repository) -> None:
+    get_repository_context().fsmonitor = False
+    get_status()
+
+
+@benchmark("git.get_status[fsmonitor]")
+def status_fsmonitor(_repository: Repository) -> None:
+    get_repository_context().fsmonitor = True
+    get_status()
+    get_repository_context().fsmonitor = False
+
+
+@benchmark("git.diff_cached")
+def diff_cached(_repository: Repository) -> None:
+    # lower bound for querying the staged files
+    exec_git("diff", "--cached", "--name-status", "-z")
+
+
+@benchmark("git.get_staged_status")
+def staged_status(_repository: Repository) -> None:
+    get_staged_status()
+
+
+@benchmark("git.stash_unstaged_changes")
+def stash(repository: Repository) -> None:
+    files = repository.staged_files + repository.partially_staged_files
+    with stash_unstaged_changes(files):
+        pass
+
+
+def _change_staged_files(repository: Repository) -> None:
+    for file_path in repository.staged_files:
+        with file_path.open("a", encoding="utf8") as f:
+            f.write("formatted = True\n")
+
+
+@benchmark("git.stage_files", setup=_change_staged_files)
+def stage(repository: Repository) -> None:
+    stage_files(repository.staged_files)
@@ -0,0 +1,21 @@
+# SPDX-FileCopyrightText: 2026 Greenbone AG
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+
+"""
+Benchmarks for the path plugin API
+"""
+
+from autohooks.api.path import match
+
+from .repository import Repository
+from .suite import benchmark
+
+PATTERNS = ("*.pyi", "*.py")
+
+
+@benchmark("path.match")
+def match_files(repository: Repository) -> None:
+    for file_path in repository.files:
+        match(file_path, PATTERNS)
@@ -0,0 +1,95 @@
+# SPDX-FileCopyrightText: 2026 Greenbone AG
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+
+"""
+Benchmarks for running the pre-commit hook with dummy plugins
+"""
+
+import io
+from contextlib import redirect_stdout
+
+from autohooks.hooks import PreCommitHook
+from autohooks.precommit import run
+from autohooks.settings import Mode
+
+from .repository import Repository
+from .suite import benchmark
+
+# number of dummy plugins
+PLUGINS = 4
+
+PLUGIN = """
+from autohooks.api.git import get_staged_status
+from autohooks.api.path import match
+
+
+def precommit(report_progress=None, **kwargs):
+    files = [f for f in get_staged_status() if match(f.path, ("*.py",))]
+    if report_progress:
+        report_progress.init(len(files))
+
+    for f in files:
+        f.absolute_path().read_bytes()
+        if report_progress:
+            report_progress.update()
+
+    return 0
+"""
+
+
+def _plugin_name(index: int) -> str:
+    return f"autohooks_benchmark_plugin_{index}"
+
+
+def _write_plugins(repository: Repository) -> None:
+    plugins_path = repository.path / ".autohooks"
+    plugins_path.mkdir(exist_ok=True)
+    for index in range(PLUGINS):
+        plugin_path = plugins_path / f"{_plugin_name(index)}.py"
+        plugin_path.write_text(PLUGIN, encoding="utf8")
+
+
+def _write_config(repository: Repository, workers: int) -> None:
+    pre_commit_hook = PreCommitHook()
+    if not pre_commit_hook.exists():
+        pre_commit_hook.write(mode=Mode.PYTHONPATH)
+
+    names = ", ".join(f'"{_plugin_name(index)}"' for index in range(PLUGINS))
+    pyproject_toml = repository.path / "pyproject.toml"
+    pyproject_toml.write_text(
+        "[tool.autohooks]\n"
+        'mode = "pythonpath"\n'
+        f"pre-commit = [{names}]\n"
+        f"workers = {workers}\n",
+        encoding="utf8",
+    )
+
+
+def _setup(repository: Repository) -> None:
+    _write_plugins(repository)
+    _write_config(repository, workers=0)
+
+
+def _setup_workers(repository: Repository) -> None:
+    _write_plugins(repository)
+    _write_config(repository, workers=PLUGINS)
+
+
+def _run() -> None:
+    with redirect_stdout(io.StringIO()):
+        retval = run()
+
+    if retval:
+        raise RuntimeError(f"pre-commit hook failed with {retval}")
+
+
+@benchmark("precommit.run", setup=_setup)
+def run_plugins(_repository: Repository) -> None:
+    _run()
+
+
+@benchmark("precommit.run[workers]", setup=_setup_workers)
+def run_plugins_in_workers(_repository: Repository) -> None:
+    _run()
@@ -0,0 +1,122 @@
+# SPDX-FileCopyrightText: 2026 Greenbone AG
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+
+"""
+Create synthetic git repositories for the benchmarks
+"""
+
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from autohooks.utils import exec_git
+
+# number of files per directory of a synthetic repository
+FILES_PER_DIRECTORY = 100
+
+
+@dataclass
+class Repository:
+    """
+    A synthetic git repository
+
+    Attributes:
+        path: Path to the working tree of the repository
+        files: Paths of all tracked files
+        staged_files: Paths of the files with staged changes only
+        partially_staged_files: Paths of the files with staged and unstaged
+            changes
+    """
+
+    path: Path
+    files: list[Path] = field(default_factory=list)
+    staged_files: list[Path] = field(default_factory=list)
+    partially_staged_files: list[Path] = field(default_factory=list)
+
+
+def get_file_path(path: Path, index: int) -> Path:
+    """
+    Returns the path of the file with the given index of a synthetic
+    repository
+    """
+    directory = path / f"dir{index // FILES_PER_DIRECTORY:05}"
+    return directory / f"file{index:07}.py"
+
+
+def _append(file_path: Path, line: str) -> None:
+    with file_path.open("a", encoding="utf8") as f:
+        f.write(f"{line}\n")
+
+
+def _git_add(path: Path, files: list[Path]) -> None:
+    if files:
+        exec_git("-C", str(path), "add", *[os.fspath(f) for f in files])
+
+
+def create_repository(
+    path: Path, *, files: int, staged: int, partially_staged: int = 0
+) -> Repository:
+    """
+    Create a git repository containing a commit with the given number of files
+    and stage changes for the first files
+
+    Args:
+        path: Directory to create the repository in
+        files: Number of tracked files
+        staged: Number of files with staged changes only
+        partially_staged: Number of files with staged and unstaged changes
+
+    Returns:
+        The created repository
+    """
+    if staged + partially_staged > files:
+        raise ValueError(
+            "The number of staged and partially staged files must not exceed "
+            "the number of files."
+        )
+
+    exec_git("init", "-q", "-b", "main", str(path))
+    # avoid background garbage collection while the benchmarks are running
+    exec_git("-C", str(path), "config", "gc.auto", "0")
+    exec_git("-C", str(path), "config", "maintenance.auto", "false")
+
+    repository = Repository(path)
+
+    for index in range(files):
+        file_path = get_file_path(path, index)
+        file_path.parent.mkdir(exist_ok=True)
+        file_path.write_text(f"value = {index}\n", encoding="utf8")
+        repository.files.append(file_path)
+
+    exec_git("-C", str(path), "add", ".")
+    exec_git(
+        "-C",
+        str(path),
+        "-c",
+        "user.name=Benchmark",
+        "-c",
+        "user.email=benchmark@example.com",
+        "commit",
+        "-q",
+        "--no-gpg-sign",
+        "-m",
+        "Add files",
+    )
+
+    repository.staged_files = repository.files[:staged]
+    repository.partially_staged_files = repository.files[
+        staged : staged + partially_staged
+    ]
+
+    changed_files = repository.staged_files + repository.partially_staged_files
+    for file_path in changed_files:
+        _append(file_path, "staged = True")
+
+    _git_add(path, changed_files)
+
+    for file_path in repository.partially_staged_files:
+        _append(file_path, "unstaged = True")
+
+    return repository
@@ -0,0 +1,337 @@
+# SPDX-FileCopyrightText: 2026 Greenbone AG
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+
+"""
+Measure the startup time of the rendered pre-commit hook
+
+The hook is rendered for each mode and executed directly in a synthetic
+repository without any plugins. poetry, pipenv and uv are replaced by local
+stand-in scripts which execute the current Python interpreter. Therefore only
+the overhead of the hook itself is measured and not the overhead of the
+tools.
+
+Usage: ::
+
+    python -m benchmarks.startup --budget 300 --import-budget 150
+"""
+
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from argparse import ArgumentParser, Namespace
+from dataclasses import dataclass
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from autohooks.settings import Mode
+from autohooks.template import PreCommitTemplate
+from autohooks.utils import get_autohooks_directory_path
+
+from .repository import create_repository
+
+MODES = [
+    Mode.PYTHONPATH,
+    Mode.POETRY,
+    Mode.PIPENV,
+    Mode.UV,
+    Mode.POETRY_MULTILINE,
+    Mode.PIPENV_MULTILINE,
+    Mode.UV_MULTILINE,
+]
+
+# the stand-in scripts drop the "run python" arguments and execute the current
+# interpreter with the remaining arguments
+STAND_IN_SCRIPT = """#!/bin/sh
+shift 2
+exec "{executable}" "$@"
+"""
+
+STAND_IN_TOOLS = ("poetry", "pipenv", "uv")
+
+# module imported by the hook
+HOOK_MODULE = "autohooks.precommit"
+
+# runs the hook like the template does and reports the durations of the phases
+# within the process
+PHASES_SCRIPT = f"""
+import json, sys, time
+start = time.perf_counter()
+from {HOOK_MODULE} import run
+imported = time.perf_counter()
+retval = run()
+end = time.perf_counter()
+print(json.dumps({{"import": imported - start, "run": end - imported}}),
+      file=sys.stderr)
+sys.exit(retval)
+"""
+
+
+@dataclass
+class StartupResult:
+    """
+    Durations of running the hook in seconds
+    """
+
+    mode: Mode
+    cold: float
+    warm: float
+
+
+class Environment:
+    """
+    A fixture repository and the environment for running the hook in it
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.repository_path = path / "repository"
+        self.bin_path = path / "bin"
+        self.pycache_path = path / "pycache"
+
+        self.repository_path.mkdir()
+        create_repository(self.repository_path, files=100, staged=5)
+
+        self.bin_path.mkdir()
+        for tool in STAND_IN_TOOLS:
+            script = self.bin_path / tool
+            script.write_text(
+                STAND_IN_SCRIPT.format(executable=sys.executable),
+                encoding="utf8",
+            )
+            script.chmod(0o755)
+
+        (self.bin_path / "python3").symlink_to(sys.executable)
+        (self.bin_path / "python").symlink_to(sys.executable)
+
+        self.hook_path = self.repository_path / ".git" / "hooks" / "pre-commit"
+
+    def env(self, *, pycache_prefix: Path | None = None) -> dict[str, str]:
+        env = os.environ.copy()
+        env["PATH"] = f"{self.bin_path}{os.pathsep}{env.get('PATH', '')}"
+        # make the autohooks package of this checkout importable
+        pythonpath = str(get_autohooks_directory_path().parent)
+        if env.get("PYTHONPATH"):
+            pythonpath = f"{pythonpath}{os.pathsep}{env['PYTHONPATH']}"
+        env["PYTHONPATH"] = pythonpath
+        # warm runs require the bytecode to be cached
+        env.pop("PYTHONDONTWRITEBYTECODE", None)
+        env["PYTHONPYCACHEPREFIX"] = str(pycache_prefix or self.pycache_path)
+        return env
+
+    def install(self, mode: Mode) -> None:
+        template = PreCommitTemplate()
+        self.hook_path.write_text(template.render(mode=mode), encoding="utf8")
+        self.hook_path.chmod(0o755)
+
+        (self.repository_path / "pyproject.toml").write_text(
+            f'[tool.autohooks]\nmode = "{mode}"\npre-commit = []\n',
+            encoding="utf8",
+        )
+
+    def run(
+        self, args: list[str], env: dict[str, str]
+    ) -> subprocess.CompletedProcess:
+        return subprocess.run(
+            args,
+            cwd=self.repository_path,
+            env=env,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+
+    def time(self, args: list[str], env: dict[str, str]) -> float:
+        start = time.perf_counter()
+        self.run(args, env)
+        return time.perf_counter() - start
+
+
+def measure_mode(
+    environment: Environment, mode: Mode, *, repeat: int
+) -> StartupResult:
+    """
+    Measure the startup time of the hook rendered for a mode
+
+    Cold runs start without any cached bytecode. Warm runs use the bytecode
+    cached by a previous run.
+    """
+    environment.install(mode)
+    hook = [str(environment.hook_path)]
+
+    cold = []
+    for _ in range(repeat):
+        with TemporaryDirectory() as pycache_prefix:
+            env = environment.env(pycache_prefix=Path(pycache_prefix))
+            cold.append(environment.time(hook, env))
+
+    env = environment.env()
+    environment.run(hook, env)
+    warm = [environment.time(hook, env) for _ in range(repeat)]
+
+    return StartupResult(mode, statistics.median(cold), statistics.median(warm))
+
+
+def measure_imports(environment: Environment) -> dict[str, float]:
+    """
+    Run the hook with -X importtime and return the cumulative import times of
+    all imported modules in seconds
+    """
+    environment.install(Mode.PYTHONPATH)
+    env = environment.env()
+    env["PYTHONPROFILEIMPORTTIME"] = "1"
+    process = environment.run([str(environment.hook_path)], env)
+
+    imports = {}
+    for line in process.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        _self, cumulative, name = line[len("import time:") :].split("|")
+        imports[name.strip()] = int(cumulative) / 1_000_000
+    return imports
+
+
+def measure_phases(
+    environment: Environment, *, repeat: int
+) -> dict[str, float]:
+    """
+    Measure the durations of the phases of a warm hook run in seconds
+
+    The phases are the startup and shutdown of the interpreter, the import of
+    autohooks and the execution of the hook.
+    """
+    environment.install(Mode.PYTHONPATH)
+    env = environment.env()
+    phases: dict[str, list[float]] = {
+        "interpreter": [],
+        "import": [],
+        "run": [],
+    }
+
+    environment.run([sys.executable, "-c", PHASES_SCRIPT], env)
+    for _ in range(repeat):
+        start = time.perf_counter()
+        process = environment.run([sys.executable, "-c", PHASES_SCRIPT], env)
+        total = time.perf_counter() - start
+
+        durations = json.loads(process.stderr.splitlines()[-1])
+        phases["import"].append(durations["import"])
+        phases["run"].append(durations["run"])
+        phases["interpreter"].append(
+            total - durations["import"] - durations["run"]
+        )
+
+    return {
+        phase: statistics.median(durations)
+        for phase, durations in phases.items()
+    }
+
+
+def parse_args(args: list[str] | None = None) -> Namespace:
+    parser = ArgumentParser(
+        prog="python -m benchmarks.startup",
+        description=__doc__.strip().splitlines()[0],
+    )
+    parser.add_argument(
+        "--mode",
+        dest="modes",
+        action="append",
+        choices=[str(mode) for mode in MODES],
+        help="Only measure the hook for MODE. Can be passed multiple times.",
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=5,
+        help="Number of runs per measurement. Default: %(default)s",
+    )
+    parser.add_argument(
+        "--budget",
+        type=float,
+        metavar="MS",
+        help="Fail if the warm startup time of a hook exceeds MS milliseconds.",
+    )
+    parser.add_argument(
+        "--import-budget",
+        type=float,
+        metavar="MS",
+        help=f"Fail if importing {HOOK_MODULE} takes longer than MS "
+        "milliseconds.",
+    )
+    parser.add_argument(
+        "--top",
+        type=int,
+        default=10,
+        help="Number of imports shown in the import time breakdown. "
+        "Default: %(default)s",
+    )
+    return parser.parse_args(args)
+
+
+def _ms(seconds: float) -> str:
+    return f"{seconds * 1000:9.2f} ms"
+
+
+def main(args: list[str] | None = None) -> int:
+    parsed_args = parse_args(args)
+    modes = [
+        mode
+        for mode in MODES
+        if not parsed_args.modes or str(mode) in parsed_args.modes
+    ]
+    failed = False
+
+    with TemporaryDirectory() as tempdir:
+        environment = Environment(Path(tempdir))
+
+        print(f"{'mode':20} {'cold':>12} {'warm':>12}")
+        results = []
+        for mode in modes:
+            result = measure_mode(environment, mode, repeat=parsed_args.repeat)
+            results.append(result)
+            exceeded = (
+                parsed_args.budget is not None
+                and result.warm * 1000 > parsed_args.budget
+            )
+            failed = failed or exceeded
+            print(
+                f"{mode!s:20} {_ms(result.cold)} {_ms(result.warm)}"
+                f"{'  BUDGET EXCEEDED' if exceeded else ''}"
+            )
+
+        phases = measure_phases(environment, repeat=parsed_args.repeat)
+        print("\nphases of a warm run")
+        print(
+            f"  {'interpreter startup and exit':32} {_ms(phases['interpreter'])}"
+        )
+        print(f"  {'import ' + HOOK_MODULE:32} {_ms(phases['import'])}")
+        print(f"  {'run()':32} {_ms(phases['run'])}")
+
+        imports = measure_imports(environment)
+
+        print("\nslowest imports (cumulative)")
+        for name, duration in sorted(
+            imports.items(), key=lambda item: item[1], reverse=True
+        )[: parsed_args.top]:
+            print(f"  {name:32} {_ms(duration)}")
+
+        if (
+            parsed_args.import_budget is not None
+            and phases["import"] * 1000 > parsed_args.import_budget
+        ):
+            print(
+                f"\nImporting {HOOK_MODULE} exceeds the budget of "
+                f"{parsed_args.import_budget} ms."
+            )
+            failed = True
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
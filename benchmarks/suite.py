@@ -0,0 +1,202 @@
+# SPDX-FileCopyrightText: 2026 Greenbone AG
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+
+"""
+Registry, measurement and result handling of the benchmarks
+"""
+
+import json
+import platform
+import statistics
+import time
+from collections.abc import Callable, Iterable
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any
+
+from autohooks.utils import exec_git
+
+from .repository import Repository
+
+BenchmarkFunction = Callable[[Repository], object]
+
+
+@dataclass
+class Benchmark:
+    """
+    A registered benchmark
+
+    Attributes:
+        name: Unique name of the benchmark
+        func: The function to measure
+        setup: An optional function called before each call of func. Its
+            duration is not measured.
+    """
+
+    name: str
+    func: BenchmarkFunction
+    setup: BenchmarkFunction | None = None
+
+
+@dataclass
+class Result:
+    """
+    Durations of a benchmark in seconds
+    """
+
+    min: float
+    median: float
+    mean: float
+    repeat: int
+
+    @staticmethod
+    def from_durations(durations: list[float]) -> "Result":
+        return Result(
+            min=min(durations),
+            median=statistics.median(durations),
+            mean=statistics.mean(durations),
+            repeat=len(durations),
+        )
+
+
+_benchmarks: dict[str, Benchmark] = {}
+
+
+def benchmark(
+    name: str, *, setup: BenchmarkFunction | None = None
+) -> Callable[[BenchmarkFunction], BenchmarkFunction]:
+    """
+    Decorator for registering a benchmark function
+
+    The function is called with the synthetic repository. The current working
+    directory is the working tree of the repository.
+
+    Example: ::
+
+        @benchmark("get_status")
+        def status(repository):
+            get_status()
+    """
+
+    def decorator(func: BenchmarkFunction) -> BenchmarkFunction:
+        if name in _benchmarks:
+            raise ValueError(f"Benchmark {name} is already registered.")
+        _benchmarks[name] = Benchmark(name, func, setup)
+        return func
+
+    return decorator
+
+
+def get_benchmarks(patterns: Iterable[str] | None = None) -> list[Benchmark]:
+    """
+    Returns the registered benchmarks
+
+    Args:
+        patterns: Only return the benchmarks whose name contains one of the
+            patterns
+    """
+    patterns = list(patterns or [])
+    return [
+        b
+        for b in _benchmarks.values()
+        if not patterns or any(pattern in b.name for pattern in patterns)
+    ]
+
+
+def measure(bench: Benchmark, repository: Repository, *, repeat: int) -> Result:
+    """
+    Call a benchmark function repeatedly and measure its durations
+
+    The function is called once more before the measurement to warm up caches.
+    """
+    durations = []
+    for iteration in range(repeat + 1):
+        if bench.setup:
+            bench.setup(repository)
+
+        start = time.perf_counter()
+        bench.func(repository)
+        duration = time.perf_counter() - start
+
+        if iteration:
+            durations.append(duration)
+
+    return Result.from_durations(durations)
+
+
+def get_environment() -> dict[str, str]:
+    """
+    Returns information about the environment the benchmarks are run in
+    """
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "git": exec_git("--version").strip(),
+    }
+
+
+def save_results(
+    path: Path,
+    results: dict[str, Result],
+    *,
+    parameters: dict[str, Any],
+) -> None:
+    """
+    Store benchmark results in a JSON file
+    """
+    data = {
+        "parameters": parameters,
+        "environment": get_environment(),
+        "results": {name: asdict(result) for name, result in results.items()},
+    }
+    path.write_text(json.dumps(data, indent=2) + "\n", encoding="utf8")
+
+
+def load_results(path: Path) -> tuple[dict[str, Any], dict[str, Result]]:
+    """
+    Load benchmark results from a JSON file
+
+    Returns:
+        A tuple of the parameters and the results
+    """
+    data = json.loads(path.read_text(encoding="utf8"))
+    results = {
+        name: Result(**result) for name, result in data["results"].items()
+    }
+    return data["parameters"], results
+
+
+@dataclass
+class Comparison:
+    """
+    Comparison of the median durations of a benchmark with a baseline
+    """
+
+    name: str
+    baseline: float
+    current: float
+
+    @property
+    def change(self) -> float:
+        """
+        Relative change of the duration. Positive values mean slower.
+        """
+        return (self.current - self.baseline) / self.baseline
+
+    def is_regression(self, threshold: float) -> bool:
+        return self.change > threshold
+
+
+def compare_results(
+    baseline: dict[str, Result], current: dict[str, Result]
+) -> list[Comparison]:
+    """
+    Compare the results of the benchmarks contained in both result sets
+    """
+    return [
+        Comparison(name, baseline[name].median, result.median)
+        for name, result in current.items()
+        if name in baseline and baseline[name].median > 0
+    ]
@@ -0,0 +1,136 @@
+# SPDX-FileCopyrightText: 2026 Greenbone AG
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+from autohooks.api.git import get_staged_contents
+from autohooks.utils import exec_git
+from tests import tempgitdir
+
+from . import GitTestCase, git_add, git_commit, randbytes
+
+
+class GetStagedContentsTestCase(GitTestCase):
+    def test_staged_contents(self):
+        with tempgitdir() as tmpdir:
+            unchanged_file = tmpdir / "foo.txt"
+            unchanged_file.write_text("Lorem", encoding="utf8")
+
+            git_add(unchanged_file)
+            git_commit()
+
+            staged_file = tmpdir / "bar.txt"
+            staged_file.write_text("Ipsum", encoding="utf8")
+            binary_file = tmpdir / "baz.bin"
+            content = randbytes(1024)
+            binary_file.write_bytes(content)
+
+            git_add(staged_file, binary_file)
+
+            staged_file.write_text("Dolor", encoding="utf8")
+
+            contents = dict(get_staged_contents())
+
+            self.assertEqual(
+                contents,
+                {Path("bar.txt"): b"Ipsum", Path("baz.bin"): content},
+            )
+
+            # the working tree is untouched
+            self.assertEqual(
+                staged_file.read_text(encoding="utf8"),
+                "Dolor",
+            )
+
+    def test_staged_contents_for_files(self):
+        with tempgitdir() as tmpdir:
+            foo_file = tmpdir / "foo.txt"
+            foo_file.write_text("Lorem", encoding="utf8")
+            bar_file = tmpdir / "bar.txt"
+            bar_file.write_text("Ipsum", encoding="utf8")
+
+            git_add(foo_file, bar_file)
+
+            contents = list(get_staged_contents([foo_file]))
+
+            self.assertEqual(contents, [(Path("foo.txt"), b"Lorem")])
+
+    def test_staged_contents_for_relative_paths(self):
+        with tempgitdir() as tmpdir:
+            sub_dir = tmpdir / "sub"
+            sub_dir.mkdir()
+            foo_file = sub_dir / "foo.txt"
+            foo_file.write_text("Lorem", encoding="utf8")
+            bar_file = tmpdir / "bar.txt"
+            bar_file.write_text("Ipsum", encoding="utf8")
+
+            git_add(foo_file, bar_file)
+
+            os.chdir(sub_dir)
+
+            self.assertEqual(
+                list(get_staged_contents([Path("foo.txt")])),
+                [(Path("sub/foo.txt"), b"Lorem")],
+            )
+            self.assertEqual(
+                list(get_staged_contents([Path("..")])),
+                [(Path("bar.txt"), b"Ipsum"), (Path("sub/foo.txt"), b"Lorem")],
+            )
+
+    def test_staged_contents_for_many_files(self):
+        with tempgitdir() as tmpdir:
+            files = []
+            for i in range(100):
+                path = tmpdir / f"{i}.txt"
+                path.write_text(str(i), encoding="utf8")
+                files.append(path)
+
+            git_add(*files)
+
+            with patch("autohooks.api.git.exec_git", wraps=exec_git) as mock:
+                contents = dict(get_staged_contents(files[:50]))
+
+            self.assertEqual(len(contents), 50)
+            self.assertEqual(contents[Path("42.txt")], b"42")
+            # the paths aren't passed to git as pathspecs
+            mock.assert_called_once()
+            self.assertNotIn("42.txt", mock.call_args.args)
+
+    def test_staged_contents_as_memoryview(self):
+        with tempgitdir() as tmpdir:
+            foo_file = tmpdir / "foo.txt"
+            foo_file.write_text("Lorem", encoding="utf8")
+
+            git_add(foo_file)
+
+            contents = list(get_staged_contents(as_memoryview=True))
+
+            self.assertEqual(len(contents), 1)
+            path, content = contents[0]
+            self.assertEqual(path, Path("foo.txt"))
+            self.assertIsInstance(content, memoryview)
+            self.assertEqual(content.tobytes(), b"Lorem")
+
+    def test_no_staged_files(self):
+        with tempgitdir():
+            self.assertEqual(list(get_staged_contents()), [])
+
+    def test_abort_reading(self):
+        with tempgitdir() as tmpdir:
+            files = []
+            for i in range(10):
+                path = tmpdir / f"{i}.txt"
+                path.write_bytes(randbytes(64 * 1024))
+                files.append(path)
+
+            git_add(*files)
+
+            contents = get_staged_contents()
+            path, _ = next(contents)
+            contents.close()
+
+            self.assertEqual(path, Path("0.txt"))
@@ -3,9 +3,13 @@
 # SPDX-License-Identifier: GPL-3.0-or-later
 #
 
-from autohooks.api.git import StatusEntry, get_diff
+import os
+from pathlib import Path
+
+from autohooks.api.git import StatusEntry, get_diff, get_staged_changed_lines
+from autohooks.utils import exec_git
 from tests import tempgitdir
-from tests.api.git import GitTestCase, git_add, git_commit
+from tests.api.git import GitTestCase, git_add, git_commit, git_mv
 
 
 class DiffTestCase(GitTestCase):
@@ -53,3 +57,137 @@ class DiffTestCase(GitTestCase):
  dolor
  sit"""
             self.assertIn(expected_diff, diff)
+
+
+class GetStagedChangedLinesTestCase(GitTestCase):
+    def test_changed_lines(self):
+        with tempgitdir() as tmpdir:
+            test_file = tmpdir / "foo.txt"
+            test_file.write_text("a\nb\nc\nd\ne\nf\n", encoding="utf8")
+            removed_file = tmpdir / "bar.txt"
+            removed_file.write_text("a\n", encoding="utf8")
+
+            git_add(test_file, removed_file)
+            git_commit()
+
+            test_file.write_text("a\nB\nC\nd\nf\ng\n", encoding="utf8")
+            removed_file.unlink()
+            new_file = tmpdir / "lorem ipsum.txt"
+            new_file.write_text("lorem\nipsum\n", encoding="utf8")
+
+            git_add(test_file, removed_file, new_file)
+
+            # unstaged changes are not taken into account
+            test_file.write_text("X\n", encoding="utf8")
+
+            changed_lines = get_staged_changed_lines()
+
+            self.assertEqual(
+                changed_lines,
+                {
+                    Path("foo.txt"): [range(2, 4), range(6, 7)],
+                    Path("lorem ipsum.txt"): [range(1, 3)],
+                },
+            )
+
+    def test_changed_lines_for_files(self):
+        with tempgitdir() as tmpdir:
+            test_file = tmpdir / "foo.txt"
+            test_file.write_text("a\nb\n", encoding="utf8")
+            other_file = tmpdir / "bar.txt"
+            other_file.write_text("a\nb\n", encoding="utf8")
+
+            git_add(test_file, other_file)
+            git_commit()
+
+            test_file.write_text("a\nc\n", encoding="utf8")
+            other_file.write_text("c\nb\n", encoding="utf8")
+
+            git_add(test_file, other_file)
+
+            changed_lines = get_staged_changed_lines([test_file])
+
+            self.assertEqual(changed_lines, {Path("foo.txt"): [range(2, 3)]})
+
+    def test_changed_lines_with_relative_diff(self):
+        with tempgitdir() as tmpdir:
+            exec_git("config", "diff.relative", "true")
+            sub_dir = tmpdir / "sub"
+            sub_dir.mkdir()
+            a_file = sub_dir / "a.py"
+            a_file.write_text("a\n", encoding="utf8")
+            b_file = tmpdir / "b.py"
+            b_file.write_text("b\n", encoding="utf8")
+            git_add(a_file, b_file)
+
+            os.chdir(sub_dir)
+
+            changed_lines = get_staged_changed_lines()
+
+            self.assertEqual(
+                changed_lines,
+                {Path("b.py"): [range(1, 2)], Path("sub/a.py"): [range(1, 2)]},
+            )
+
+    def test_only_removed_lines(self):
+        with tempgitdir() as tmpdir:
+            test_file = tmpdir / "foo.txt"
+            test_file.write_text("a\nb\n", encoding="utf8")
+
+            git_add(test_file)
+            git_commit()
+
+            test_file.write_text("a\n", encoding="utf8")
+
+            git_add(test_file)
+
+            self.assertEqual(get_staged_changed_lines(), {Path("foo.txt"): []})
+
+    def test_added_lines_looking_like_headers(self):
+        with tempgitdir() as tmpdir:
+            test_file = tmpdir / "foo.txt"
+            test_file.write_text("a\n", encoding="utf8")
+            other_file = tmpdir / "bar.txt"
+            other_file.write_text("a\n", encoding="utf8")
+
+            git_add(test_file, other_file)
+            git_commit()
+
+            test_file.write_text(
+                "a\n++ x\n-- y\n@@ -1 +1 @@\ndiff --git a/b b/b\n",
+                encoding="utf8",
+            )
+            other_file.write_text("a\nb\n", encoding="utf8")
+
+            git_add(test_file, other_file)
+
+            self.assertEqual(
+                get_staged_changed_lines(),
+                {
+                    Path("bar.txt"): [range(2, 3)],
+                    Path("foo.txt"): [range(2, 6)],
+                },
+            )
+
+    def test_binary_file(self):
+        with tempgitdir() as tmpdir:
+            test_file = tmpdir / "foo.bin"
+            test_file.write_bytes(b"\0\1\2")
+
+            git_add(test_file)
+
+            self.assertEqual(get_staged_changed_lines(), {Path("foo.bin"): []})
+
+    def test_renamed_file(self):
+        with tempgitdir() as tmpdir:
+            test_file = tmpdir / "foo.txt"
+            test_file.write_text("a\nb\nc\n", encoding="utf8")
+
+            git_add(test_file)
+            git_commit()
+
+            git_mv(test_file, tmpdir / "bar baz.txt")
+
+            self.assertEqual(
+                get_staged_changed_lines(), {Path("bar baz.txt"): []}
+            )
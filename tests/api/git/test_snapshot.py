@@ -0,0 +1,163 @@
+# SPDX-FileCopyrightText: 2026 Greenbone AG
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+
+import os
+import sys
+import threading
+import unittest
+from unittest.mock import patch
+
+from autohooks.api.git import staged_snapshot
+from autohooks.utils import exec_git, get_git_directory_path
+from tests import tempgitdir
+
+from . import GitTestCase, git_add, git_commit
+
+
+def get_staged_content(path: str) -> str:
+    return exec_git("show", f":{path}")
+
+
+class StagedSnapshotTestCase(GitTestCase):
+    def test_export_staged_content(self):
+        with tempgitdir() as tmpdir:
+            foo_file = tmpdir / "foo.txt"
+            foo_file.write_text("Lorem\n", encoding="utf8")
+
+            git_add(foo_file)
+
+            foo_file.write_text("Ipsum\n", encoding="utf8")
+
+            with staged_snapshot() as snapshot:
+                self.assertNotEqual(snapshot.path, tmpdir)
+                self.assertEqual(snapshot.files, [snapshot.path / "foo.txt"])
+                self.assertEqual(
+                    snapshot.files[0].read_text(encoding="utf8"), "Lorem\n"
+                )
+
+            self.assertFalse(snapshot.path.exists())
+            self.assertEqual(foo_file.read_text(encoding="utf8"), "Ipsum\n")
+
+    def test_write_back_changes(self):
+        with tempgitdir() as tmpdir:
+            foo_file = tmpdir / "foo.txt"
+            foo_file.write_text("Lorem\n", encoding="utf8")
+            bar_file = tmpdir / "bar.txt"
+            bar_file.write_text("Ipsum\n", encoding="utf8")
+
+            git_add(foo_file, bar_file)
+
+            with staged_snapshot([foo_file, bar_file]) as snapshot:
+                (snapshot.path / "foo.txt").write_text(
+                    "Dolor\n", encoding="utf8"
+                )
+
+            self.assertEqual(get_staged_content("foo.txt"), "Dolor\n")
+            self.assertEqual(foo_file.read_text(encoding="utf8"), "Dolor\n")
+            self.assertEqual(get_staged_content("bar.txt"), "Ipsum\n")
+            self.assertEqual(bar_file.read_text(encoding="utf8"), "Ipsum\n")
+
+    def test_write_back_racily_clean(self):
+        with tempgitdir() as tmpdir:
+            foo_file = tmpdir / "foo.txt"
+            foo_file.write_text("Lorem\n", encoding="utf8")
+            git_add(foo_file)
+
+            # like on file systems with coarse timestamps the files are
+            # exported within the current timestamp tick
+            with (
+                patch(
+                    "autohooks.api.git._get_file_system_time", return_value=0
+                ),
+                staged_snapshot([foo_file]) as snapshot,
+            ):
+                st = snapshot.files[0].stat()
+                snapshot.files[0].write_text("Dolor\n", encoding="utf8")
+                os.utime(snapshot.files[0], ns=(st.st_atime_ns, st.st_mtime_ns))
+
+            self.assertEqual(get_staged_content("foo.txt"), "Dolor\n")
+            self.assertEqual(foo_file.read_text(encoding="utf8"), "Dolor\n")
+
+    def test_write_back_partially_staged(self):
+        with tempgitdir() as tmpdir:
+            foo_file = tmpdir / "foo.txt"
+            foo_file.write_text("a\nb\nc\nd\n", encoding="utf8")
+
+            git_add(foo_file)
+            git_commit()
+
+            foo_file.write_text("A\nb\nc\nd\n", encoding="utf8")
+            git_add(foo_file)
+            foo_file.write_text("A\nb\nc\nd\ne\n", encoding="utf8")
+
+            with staged_snapshot() as snapshot:
+                snapshot.files[0].write_text("A\nB\nc\nd\n", encoding="utf8")
+
+            self.assertEqual(get_staged_content("foo.txt"), "A\nB\nc\nd\n")
+            self.assertEqual(
+                foo_file.read_text(encoding="utf8"), "A\nB\nc\nd\ne\n"
+            )
+
+    def test_write_back_conflict(self):
+        with tempgitdir() as tmpdir:
+            foo_file = tmpdir / "foo.txt"
+            foo_file.write_text("a\n", encoding="utf8")
+
+            git_add(foo_file)
+            git_commit()
+
+            foo_file.write_text("b\n", encoding="utf8")
+            git_add(foo_file)
+            foo_file.write_text("c\n", encoding="utf8")
+
+            with staged_snapshot() as snapshot:
+                snapshot.files[0].write_text("B\n", encoding="utf8")
+
+            self.assertEqual(get_staged_content("foo.txt"), "B\n")
+            self.assertEqual(foo_file.read_text(encoding="utf8"), "c\n")
+            self.assertEqual(list(tmpdir.glob("*.rej")), [])
+
+    @unittest.skipUnless(sys.platform != "win32", "requires fcntl")
+    def test_write_back_locked_by_other_process(self):
+        import fcntl
+
+        with tempgitdir() as tmpdir:
+            foo_file = tmpdir / "foo.txt"
+            foo_file.write_text("Lorem\n", encoding="utf8")
+            git_add(foo_file)
+
+            def write_back() -> None:
+                with staged_snapshot([foo_file]) as snapshot:
+                    snapshot.files[0].write_text("Ipsum\n", encoding="utf8")
+
+            # a lock of a separate file description behaves like a lock of
+            # another process
+            lock_path = get_git_directory_path() / "autohooks-snapshot.lock"
+            with lock_path.open("ab") as f:
+                fcntl.flock(f, fcntl.LOCK_EX)
+                thread = threading.Thread(target=write_back)
+                thread.start()
+                thread.join(0.5)
+                locked = thread.is_alive()
+                fcntl.flock(f, fcntl.LOCK_UN)
+
+            thread.join()
+
+            self.assertTrue(locked)
+            self.assertEqual(get_staged_content("foo.txt"), "Ipsum\n")
+
+    def test_error(self):
+        with tempgitdir() as tmpdir:
+            foo_file = tmpdir / "foo.txt"
+            foo_file.write_text("Lorem\n", encoding="utf8")
+
+            git_add(foo_file)
+
+            with self.assertRaises(ValueError), staged_snapshot() as snapshot:
+                snapshot.files[0].write_text("Ipsum\n", encoding="utf8")
+                raise ValueError()
+
+            self.assertEqual(get_staged_content("foo.txt"), "Lorem\n")
+            self.assertEqual(foo_file.read_text(encoding="utf8"), "Lorem\n")
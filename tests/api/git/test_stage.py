@@ -0,0 +1,134 @@
+# SPDX-FileCopyrightText: 2026 Greenbone AG
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+
+import os
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+from autohooks.api.git import _run_git_with_input, stage_changed_files
+from autohooks.utils import exec_git
+from tests import tempgitdir
+
+from . import GitTestCase, git_add
+
+
+def get_staged_content(path: str) -> str:
+    return exec_git("show", f":{path}")
+
+
+class StageChangedFilesTestCase(GitTestCase):
+    def test_stage_changed_files(self):
+        with tempgitdir() as tmpdir:
+            foo_file = tmpdir / "foo.txt"
+            foo_file.write_text("Lorem\n", encoding="utf8")
+            bar_file = tmpdir / "bar.txt"
+            bar_file.write_text("Ipsum\n", encoding="utf8")
+            git_add(foo_file, bar_file)
+
+            with stage_changed_files() as staged:
+                foo_file.write_text("Dolor\n", encoding="utf8")
+
+            self.assertEqual(staged.changed, [Path("foo.txt")])
+            self.assertEqual(get_staged_content("foo.txt"), "Dolor\n")
+            self.assertEqual(get_staged_content("bar.txt"), "Ipsum\n")
+
+    def test_rewritten_file_is_not_staged(self):
+        with tempgitdir() as tmpdir:
+            foo_file = tmpdir / "foo.txt"
+            foo_file.write_text("Lorem\n", encoding="utf8")
+            git_add(foo_file)
+            os.utime(foo_file, ns=(0, 0))
+
+            with (
+                patch(
+                    "autohooks.api.git._run_git_with_input",
+                    wraps=_run_git_with_input,
+                ) as run_mock,
+                stage_changed_files([foo_file]) as staged,
+            ):
+                # same content but new modification time
+                foo_file.write_text("Lorem\n", encoding="utf8")
+
+            self.assertEqual(staged.changed, [])
+            # only the changed file has been hashed and nothing was staged
+            run_mock.assert_called_once()
+            self.assertIn("hash-object", run_mock.call_args.args[0])
+
+    def test_nothing_changed(self):
+        with tempgitdir() as tmpdir:
+            foo_file = tmpdir / "foo.txt"
+            foo_file.write_text("Lorem\n", encoding="utf8")
+            git_add(foo_file)
+            os.utime(foo_file, ns=(0, 0))
+
+            with (
+                patch("autohooks.api.git._run_git_with_input") as run_mock,
+                stage_changed_files([foo_file]) as staged,
+            ):
+                pass
+
+            self.assertEqual(staged.changed, [])
+            run_mock.assert_not_called()
+
+    def test_racily_clean_file(self):
+        with tempgitdir() as tmpdir:
+            foo_file = tmpdir / "foo.txt"
+            foo_file.write_text("Lorem\n", encoding="utf8")
+            git_add(foo_file)
+            # modified not before the context is entered like on file systems
+            # with coarse timestamps
+            mtime = time.time_ns() + 10**9
+            os.utime(foo_file, ns=(mtime, mtime))
+
+            with stage_changed_files([foo_file]) as staged:
+                # rewritten within the same timestamp tick
+                foo_file.write_text("Dolor\n", encoding="utf8")
+                os.utime(foo_file, ns=(mtime, mtime))
+
+            self.assertEqual(staged.changed, [Path("foo.txt")])
+            self.assertEqual(get_staged_content("foo.txt"), "Dolor\n")
+
+    def test_stage_removed_file(self):
+        with tempgitdir() as tmpdir:
+            foo_file = tmpdir / "foo.txt"
+            foo_file.write_text("Lorem\n", encoding="utf8")
+            git_add(foo_file)
+
+            with stage_changed_files([foo_file]) as staged:
+                foo_file.unlink()
+
+            self.assertEqual(staged.changed, [Path("foo.txt")])
+            self.assertEqual(exec_git("ls-files", "--cached"), "")
+
+    def test_stage_files_in_subdirectory(self):
+        with tempgitdir() as tmpdir:
+            sub_dir = tmpdir / "foo"
+            sub_dir.mkdir()
+            foo_file = sub_dir / "foo bar.txt"
+            foo_file.write_text("Lorem\n", encoding="utf8")
+            git_add(foo_file)
+
+            with stage_changed_files([foo_file]) as staged:
+                foo_file.write_text("Ipsum\n", encoding="utf8")
+
+            self.assertEqual(staged.changed, [Path("foo/foo bar.txt")])
+            self.assertEqual(get_staged_content("foo/foo bar.txt"), "Ipsum\n")
+
+    def test_error_does_not_stage(self):
+        with tempgitdir() as tmpdir:
+            foo_file = tmpdir / "foo.txt"
+            foo_file.write_text("Lorem\n", encoding="utf8")
+            git_add(foo_file)
+
+            with (
+                self.assertRaises(RuntimeError),
+                stage_changed_files([foo_file]) as staged,
+            ):
+                foo_file.write_text("Ipsum\n", encoding="utf8")
+                raise RuntimeError()
+
+            self.assertEqual(staged.changed, [])
+            self.assertEqual(get_staged_content("foo.txt"), "Lorem\n")
@@ -6,15 +6,24 @@
 import os
 import unittest
 from pathlib import Path
+from unittest.mock import patch
 
 from autohooks.api.git import (
     Status,
     StatusEntry,
+    get_changed_status,
     get_staged_status,
     get_status,
+    get_tracked_status,
+    get_uncommitted_status,
     is_partially_staged_status,
     is_staged_status,
 )
+from autohooks.utils import (
+    clear_repository_context,
+    exec_git,
+    get_repository_context,
+)
 from tests import tempgitdir
 
 from . import GitTestCase, git_add, git_commit, git_mv, git_rm
@@ -118,6 +127,29 @@ class StatusEntryTestCase(unittest.TestCase):
         self.assertEqual(status.working_tree, Status.UNTRACKED)
         self.assertEqual(status.path, Path("foo.txt"))
 
+    def test_parse_renamed(self):
+        status = StatusEntry("RM foo.txt\0bar.txt")
+
+        self.assertEqual(status.index, Status.RENAMED)
+        self.assertEqual(status.working_tree, Status.MODIFIED)
+        self.assertEqual(status.path, Path("foo.txt"))
+        self.assertEqual(status.old_path, Path("bar.txt"))
+
+    def test_parse_copied(self):
+        status = StatusEntry("C  foo.txt\0bar.txt")
+
+        self.assertEqual(status.index, Status.COPIED)
+        self.assertEqual(status.working_tree, Status.UNMODIFIED)
+        self.assertEqual(status.path, Path("foo.txt"))
+        self.assertEqual(status.old_path, Path("bar.txt"))
+
+    def test_parse_type_changed(self):
+        status = StatusEntry("T  foo.txt")
+
+        self.assertEqual(status.index, Status.TYPE_CHANGED)
+        self.assertEqual(status.working_tree, Status.UNMODIFIED)
+        self.assertEqual(status.path, Path("foo.txt"))
+
     def test_pathlike(self):
         status = StatusEntry("MM foo.txt")
         self.assertEqual(os.fspath(status), "foo.txt")
@@ -217,6 +249,38 @@ class GetStatusTestCase(GitTestCase):
                 renamed_file_status.working_tree, Status.UNMODIFIED
             )
 
+    def test_get_status_with_fsmonitor(self):
+        with tempgitdir() as tmpdir:
+            init_test_repo(tmpdir)
+
+            expected = [str(entry) for entry in get_status()]
+
+            get_repository_context().fsmonitor = True
+            self.addCleanup(clear_repository_context)
+
+            with patch("autohooks.api.git.exec_git", wraps=exec_git) as mock:
+                status = get_status()
+
+            self.assertEqual([str(entry) for entry in status], expected)
+            args = mock.call_args.args
+            self.assertEqual(args[:2], ("-c", "core.fsmonitor=true"))
+
+    def test_get_status_with_configured_fsmonitor(self):
+        with tempgitdir() as tmpdir:
+            init_test_repo(tmpdir)
+            exec_git("config", "core.fsmonitor", "false")
+
+            expected = [str(entry) for entry in get_status()]
+
+            get_repository_context().fsmonitor = True
+            self.addCleanup(clear_repository_context)
+
+            with patch("autohooks.api.git.exec_git", wraps=exec_git) as mock:
+                status = get_status()
+
+            self.assertEqual([str(entry) for entry in status], expected)
+            self.assertEqual(mock.call_args.args[0], "status")
+
 
 class GetStagedStatusTestCase(GitTestCase):
     def test_get_staged_status(self):
@@ -291,6 +355,295 @@ class GetStagedStatusTestCase(GitTestCase):
             self.assertEqual(added_file_status.index, Status.ADDED)
             self.assertEqual(added_file_status.working_tree, Status.UNMODIFIED)
 
+    def test_get_staged_status_without_status(self):
+        with tempgitdir() as tmpdir:
+            init_test_repo(tmpdir)
+
+            expected = [
+                str(entry) for entry in get_status() if is_staged_status(entry)
+            ]
+
+            with patch("autohooks.api.git.exec_git", wraps=exec_git) as mock:
+                status = get_staged_status()
+
+            self.assertEqual([str(entry) for entry in status], expected)
+            for args in mock.call_args_list:
+                self.assertNotIn("status", args.args)
+
+    def test_get_staged_status_many_files(self):
+        with tempgitdir() as tmpdir:
+            init_test_repo(tmpdir)
+
+            expected = [str(entry) for entry in get_staged_status()]
+
+            with patch("autohooks.api.git._MAX_PATHSPECS", 1):
+                status = get_staged_status()
+
+            self.assertEqual([str(entry) for entry in status], expected)
+
+    def test_get_staged_status_from_subdirectory(self):
+        with tempgitdir() as tmpdir:
+            sub_dir = tmpdir / "sub"
+            sub_dir.mkdir()
+            foo_file = sub_dir / "foo.txt"
+            foo_file.write_text("Lorem", encoding="utf8")
+            git_add(foo_file)
+            foo_file.write_text("Ipsum", encoding="utf8")
+
+            os.chdir(sub_dir)
+
+            status = get_staged_status()
+
+            self.assertEqual(len(status), 1)
+            self.assertEqual(status[0].absolute_path(), foo_file.resolve())
+            self.assertEqual(status[0].index, Status.ADDED)
+            self.assertEqual(status[0].working_tree, Status.MODIFIED)
+
+    def test_get_staged_status_with_relative_diff(self):
+        with tempgitdir() as tmpdir:
+            exec_git("config", "diff.relative", "true")
+            sub_dir = tmpdir / "sub"
+            sub_dir.mkdir()
+            a_file = sub_dir / "a.py"
+            a_file.write_text("Lorem", encoding="utf8")
+            b_file = tmpdir / "b.py"
+            b_file.write_text("Lorem", encoding="utf8")
+            git_add(a_file, b_file)
+            a_file.write_text("Ipsum", encoding="utf8")
+
+            os.chdir(sub_dir)
+
+            status = get_staged_status()
+
+            self.assertEqual(
+                [entry.absolute_path() for entry in status],
+                [b_file.resolve(), a_file.resolve()],
+            )
+            self.assertEqual(status[1].working_tree, Status.MODIFIED)
+
+    def test_get_staged_status_renamed_and_modified(self):
+        with tempgitdir() as tmpdir:
+            foo_file = tmpdir / "foo.txt"
+            foo_file.write_text("Lorem Ipsum Dolor", encoding="utf8")
+            git_add(foo_file)
+            git_commit()
+
+            bar_file = tmpdir / "bar.txt"
+            git_mv(foo_file, bar_file)
+            bar_file.write_text("Sit amet", encoding="utf8")
+
+            status = get_staged_status()
+
+            self.assertEqual(len(status), 1)
+            self.assertEqual(status[0].index, Status.RENAMED)
+            self.assertEqual(status[0].working_tree, Status.MODIFIED)
+            self.assertEqual(status[0].path, Path("bar.txt"))
+            self.assertEqual(status[0].old_path, Path("foo.txt"))
+            self.assertTrue(is_partially_staged_status(status[0]))
+
+    def test_get_staged_status_type_changed(self):
+        with tempgitdir() as tmpdir:
+            foo_file = tmpdir / "foo.txt"
+            foo_file.write_text("Lorem", encoding="utf8")
+            git_add(foo_file)
+            git_commit()
+
+            foo_file.unlink()
+            foo_file.symlink_to("bar.txt")
+            git_add(foo_file)
+
+            status = get_staged_status()
+
+            self.assertEqual(len(status), 1)
+            self.assertEqual(status[0].index, Status.TYPE_CHANGED)
+            self.assertEqual(status[0].working_tree, Status.UNMODIFIED)
+
+
+def init_commit_range_repo(tmpdir: Path) -> None:
+    foo_file = tmpdir / "foo.txt"
+    foo_file.write_text("Lorem Ipsum Dolor Sit", encoding="utf8")
+    bar_file = tmpdir / "bar.txt"
+    bar_file.write_text("Consetetur", encoding="utf8")
+    baz_file = tmpdir / "baz.txt"
+    baz_file.write_text("Sadipscing", encoding="utf8")
+    git_add(foo_file, bar_file, baz_file)
+    git_commit()
+
+    exec_git("checkout", "-q", "-b", "feature")
+    git_mv(foo_file, tmpdir / "foo.rst")
+    bar_file.write_text("Elitr", encoding="utf8")
+    git_add(bar_file)
+    git_rm(baz_file)
+    added_file = tmpdir / "added.txt"
+    added_file.write_text("Sed diam", encoding="utf8")
+    git_add(added_file)
+    git_commit()
+
+    # changes in the working tree and the index are ignored
+    bar_file.write_text("Nonumy", encoding="utf8")
+    unstaged_file = tmpdir / "unstaged.txt"
+    unstaged_file.touch()
+    git_add(unstaged_file)
+
+
+class GetChangedStatusTestCase(GitTestCase):
+    def test_get_changed_status(self):
+        with tempgitdir() as tmpdir:
+            init_commit_range_repo(tmpdir)
+
+            status = get_changed_status("main")
+
+            self.assertEqual(
+                [str(entry) for entry in status],
+                ["A  added.txt", "M  bar.txt", "R  foo.rst"],
+            )
+            self.assertEqual(status[2].old_path, Path("foo.txt"))
+            self.assertEqual(status[0].absolute_path(), tmpdir / "added.txt")
+
+    def test_get_changed_status_for_files(self):
+        with tempgitdir() as tmpdir:
+            init_commit_range_repo(tmpdir)
+
+            status = get_changed_status("main", "HEAD", [tmpdir / "bar.txt"])
+
+            self.assertEqual([str(entry) for entry in status], ["M  bar.txt"])
+
+    def test_get_changed_status_since_merge_base(self):
+        with tempgitdir() as tmpdir:
+            init_commit_range_repo(tmpdir)
+
+            exec_git("checkout", "-q", "-f", "main")
+            other_file = tmpdir / "other.txt"
+            other_file.write_text("Tempor", encoding="utf8")
+            git_add(other_file)
+            git_commit()
+
+            status = get_changed_status("main", "feature")
+
+            self.assertEqual(
+                [str(entry) for entry in status],
+                ["A  added.txt", "M  bar.txt", "R  foo.rst"],
+            )
+
+    def test_get_staged_status_for_commit_range(self):
+        with tempgitdir() as tmpdir:
+            init_commit_range_repo(tmpdir)
+
+            get_repository_context().commit_range = ("main", "HEAD")
+            self.addCleanup(clear_repository_context)
+
+            status = get_staged_status()
+
+            self.assertEqual(
+                [str(entry) for entry in status],
+                ["A  added.txt", "M  bar.txt", "R  foo.rst"],
+            )
+
+
+def init_tracked_files_repo(tmpdir: Path) -> None:
+    sub_dir = tmpdir / "sub"
+    sub_dir.mkdir()
+    for path in (tmpdir / "foo.txt", tmpdir / "bar.txt", sub_dir / "baz.txt"):
+        path.write_text("Lorem", encoding="utf8")
+        git_add(path)
+    git_commit()
+
+    # staged, unstaged and untracked changes
+    (tmpdir / "bar.txt").write_text("Ipsum", encoding="utf8")
+    (sub_dir / "baz.txt").write_text("Ipsum", encoding="utf8")
+    git_add(sub_dir / "baz.txt")
+    (tmpdir / "untracked.txt").write_text("Lorem", encoding="utf8")
+    git_rm(tmpdir / "foo.txt")
+
+
+class GetTrackedStatusTestCase(GitTestCase):
+    def test_get_tracked_status(self):
+        with tempgitdir() as tmpdir:
+            init_tracked_files_repo(tmpdir)
+
+            status = get_tracked_status()
+
+            self.assertEqual(
+                [str(entry) for entry in status],
+                ["AM bar.txt", "A  sub/baz.txt"],
+            )
+            self.assertEqual(status[0].absolute_path(), tmpdir / "bar.txt")
+
+    def test_get_tracked_status_for_files(self):
+        with tempgitdir() as tmpdir:
+            init_tracked_files_repo(tmpdir)
+
+            status = get_tracked_status([tmpdir / "sub"])
+
+            self.assertEqual(
+                [str(entry) for entry in status], ["A  sub/baz.txt"]
+            )
+
+    def test_get_staged_status_for_tracked_files(self):
+        with tempgitdir() as tmpdir:
+            init_tracked_files_repo(tmpdir)
+
+            get_repository_context().tracked_files = []
+            self.addCleanup(clear_repository_context)
+
+            self.assertEqual(
+                [str(entry) for entry in get_staged_status()],
+                ["AM bar.txt", "A  sub/baz.txt"],
+            )
+            self.assertEqual(
+                [str(entry) for entry in get_staged_status([tmpdir / "sub"])],
+                ["A  sub/baz.txt"],
+            )
+
+            get_repository_context().tracked_files = [Path("sub")]
+
+            self.assertEqual(
+                [str(entry) for entry in get_staged_status()],
+                ["A  sub/baz.txt"],
+            )
+            self.assertEqual(
+                get_staged_status([tmpdir / "bar.txt"]),
+                [],
+            )
+
+
+class GetUncommittedStatusTestCase(GitTestCase):
+    def test_get_uncommitted_status(self):
+        with tempgitdir() as tmpdir:
+            init_tracked_files_repo(tmpdir)
+
+            status = get_uncommitted_status()
+
+            self.assertEqual(
+                [str(entry) for entry in status],
+                ["M  bar.txt", "M  sub/baz.txt", "A  untracked.txt"],
+            )
+            self.assertEqual(
+                status[-1].absolute_path(), tmpdir / "untracked.txt"
+            )
+
+    def test_get_uncommitted_status_for_files(self):
+        with tempgitdir() as tmpdir:
+            init_tracked_files_repo(tmpdir)
+
+            status = get_uncommitted_status([tmpdir / "sub"])
+
+            self.assertEqual(
+                [str(entry) for entry in status], ["M  sub/baz.txt"]
+            )
+
+    def test_get_uncommitted_status_without_commit(self):
+        with tempgitdir() as tmpdir:
+            (tmpdir / "foo.txt").write_text("Lorem", encoding="utf8")
+            git_add(tmpdir / "foo.txt")
+            (tmpdir / "bar.txt").write_text("Ipsum", encoding="utf8")
+
+            status = get_uncommitted_status()
+
+            self.assertEqual(
+                [str(entry) for entry in status], ["A  foo.txt", "A  bar.txt"]
+            )
+
 
 class IsStagedStatusTestCase(unittest.TestCase):
     def test_is_staged_status(self):
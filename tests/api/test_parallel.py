@@ -0,0 +1,88 @@
+# SPDX-FileCopyrightText: 2026 Greenbone AG
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+
+import os
+import unittest
+from unittest.mock import MagicMock, call
+
+from autohooks.api import ReportProgress
+from autohooks.api.parallel import get_worker_count, parallel_map
+
+
+def square(value: int) -> int:
+    return value * value
+
+
+def pid(_value: int) -> int:
+    return os.getpid()
+
+
+def fail_on_three(value: int) -> int:
+    if value == 3:
+        raise ValueError("three")
+    return value
+
+
+class ParallelMapTestCase(unittest.TestCase):
+    def test_empty(self):
+        report_progress = MagicMock(spec=ReportProgress)
+
+        self.assertEqual(
+            parallel_map(square, [], report_progress=report_progress), []
+        )
+
+        report_progress.init.assert_called_once_with(0)
+        report_progress.update.assert_not_called()
+
+    def test_ordered_results_processes(self):
+        items = list(range(20))
+
+        results = parallel_map(square, items, workers=2, chunksize=3)
+
+        self.assertEqual(results, [i * i for i in items])
+
+    def test_ordered_results_threads(self):
+        items = list(range(20))
+
+        results = parallel_map(
+            square, items, workers=4, chunksize=1, threads=True
+        )
+
+        self.assertEqual(results, [i * i for i in items])
+
+    def test_use_processes(self):
+        results = parallel_map(pid, range(4), workers=2, chunksize=1)
+
+        self.assertNotIn(os.getpid(), results)
+
+    def test_single_worker_in_process(self):
+        results = parallel_map(pid, range(4), workers=1)
+
+        self.assertEqual(results, [os.getpid()] * 4)
+
+    def test_report_progress(self):
+        report_progress = MagicMock(spec=ReportProgress)
+
+        parallel_map(
+            square,
+            range(5),
+            report_progress=report_progress,
+            workers=2,
+            chunksize=2,
+            threads=True,
+        )
+
+        report_progress.init.assert_called_once_with(5)
+        self.assertEqual(
+            sorted(report_progress.update.mock_calls),
+            sorted([call(2), call(2), call(1)]),
+        )
+
+    def test_raise_error(self):
+        with self.assertRaisesRegex(ValueError, "three"):
+            parallel_map(fail_on_three, range(10), workers=2, chunksize=1)
+
+    def test_get_worker_count(self):
+        self.assertGreaterEqual(get_worker_count(), 1)
@@ -123,3 +123,86 @@ class ActivateCliTestCase(unittest.TestCase):
                 f"autohooks pre-commit hook installed at {tmpdir}/"
                 ".git/hooks/pre-commit using pythonpath mode."
             )
+
+    def test_install_additional_hooks(self):
+        with tempgitdir() as tmpdir:
+            pyproject_toml = tmpdir / "pyproject.toml"
+            pyproject_toml.write_text(
+                CONFIG + 'pre-push = ["foo"]\ncommit-msg = ["bar"]\n',
+                encoding="utf8",
+            )
+
+            term = MagicMock()
+            args = Namespace(force=False, mode=None)
+
+            install_hooks(term, args)
+
+            term.warning.assert_not_called()
+            term.ok.assert_has_calls(
+                (
+                    call(
+                        f"autohooks pre-commit hook installed at {tmpdir}/"
+                        ".git/hooks/pre-commit using poetry mode."
+                    ),
+                    call(
+                        f"autohooks pre-push hook installed at {tmpdir}/"
+                        ".git/hooks/pre-push using poetry mode."
+                    ),
+                    call(
+                        f"autohooks commit-msg hook installed at {tmpdir}/"
+                        ".git/hooks/commit-msg using poetry mode."
+                    ),
+                )
+            )
+
+    def test_install_warm_up_hooks(self):
+        with tempgitdir() as tmpdir:
+            pyproject_toml = tmpdir / "pyproject.toml"
+            pyproject_toml.write_text(
+                CONFIG + 'pre-commit = ["foo"]\n'
+                "[tool.autohooks.cache]\n"
+                'plugins = ["foo"]\n'
+                "warm = true\n",
+                encoding="utf8",
+            )
+
+            term = MagicMock()
+            args = Namespace(force=False, mode=None)
+
+            install_hooks(term, args)
+
+            term.warning.assert_not_called()
+            term.ok.assert_has_calls(
+                (
+                    call(
+                        f"autohooks post-checkout hook installed at {tmpdir}/"
+                        ".git/hooks/post-checkout using poetry mode."
+                    ),
+                    call(
+                        f"autohooks post-merge hook installed at {tmpdir}/"
+                        ".git/hooks/post-merge using poetry mode."
+                    ),
+                )
+            )
+            self.assertFalse((tmpdir / ".git" / "hooks" / "pre-push").exists())
+
+    def test_install_additional_hook_exists(self):
+        with tempgitdir() as tmpdir:
+            pyproject_toml = tmpdir / "pyproject.toml"
+            pyproject_toml.write_text(
+                CONFIG + 'pre-push = ["foo"]\n', encoding="utf8"
+            )
+            pre_push = tmpdir / ".git" / "hooks" / "pre-push"
+            pre_push.touch()
+
+            term = MagicMock()
+            args = Namespace(force=False, mode=None)
+
+            install_hooks(term, args)
+
+            term.warning.assert_called_once_with(
+                f"A different pre-push hook is already installed at {tmpdir}/"
+                ".git/hooks/pre-push. Run 'autohooks activate --force' to "
+                "override it."
+            )
+            self.assertEqual(pre_push.read_text(encoding="utf8"), "")
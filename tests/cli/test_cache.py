@@ -0,0 +1,103 @@
+# SPDX-FileCopyrightText: 2026 Greenbone AG
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+
+import unittest
+from argparse import Namespace
+from unittest.mock import MagicMock, call
+
+from autohooks.cli.cache import (
+    cache_stats,
+    clear_cache,
+    format_duration,
+    format_size,
+    prune_cache,
+)
+from autohooks.precommit.cache import CacheStatistics, ResultCache
+from autohooks.terminal import Terminal
+from autohooks.utils import clear_repository_context
+from tests import tempgitdir
+
+CONFIG = """
+[tool.autohooks]
+pre-commit = ["foo"]
+
+[tool.autohooks.cache]
+plugins = ["foo"]
+max-size = 10
+max-age = "30d"
+"""
+
+
+class FormatTestCase(unittest.TestCase):
+    def test_format_size(self):
+        self.assertEqual(format_size(10), "10 B")
+        self.assertEqual(format_size(1536), "1.5 KiB")
+        self.assertEqual(format_size(100 * 1024 * 1024), "100.0 MiB")
+        self.assertEqual(format_size(3 * 1024**3), "3.0 GiB")
+
+    def test_format_duration(self):
+        self.assertEqual(format_duration(30 * 86400), "30 days")
+        self.assertEqual(format_duration(3600), "1 hour")
+        self.assertEqual(format_duration(90), "90 seconds")
+
+
+class CacheCliTestCase(unittest.TestCase):
+    def setUp(self):
+        self.addCleanup(clear_repository_context)
+
+    def test_stats(self):
+        term = MagicMock(spec=Terminal)
+
+        with tempgitdir() as tmpdir:
+            (tmpdir / "pyproject.toml").write_text(CONFIG, encoding="utf8")
+            result_cache = ResultCache()
+            result_cache.local.set("abcdef", b"12345")
+            result_cache.add_statistics(CacheStatistics(hits=3, misses=1))
+
+            cache_stats(term, Namespace())
+
+        term.info.assert_has_calls(
+            (
+                call(f"Location: {tmpdir}/.git/autohooks/cache"),
+                call("Entries: 1"),
+                call("Size: 5 B of 10 B"),
+                call("Maximum age: 30 days"),
+                call("Hits: 3, misses: 1 (75% hit rate)"),
+            )
+        )
+
+    def test_prune(self):
+        term = MagicMock(spec=Terminal)
+
+        with tempgitdir() as tmpdir:
+            (tmpdir / "pyproject.toml").write_text(CONFIG, encoding="utf8")
+            result_cache = ResultCache()
+            result_cache.local.set("aa1", b"123456")
+            result_cache.local.set("bb2", b"123456")
+
+            prune_cache(term, Namespace())
+
+            count, _ = result_cache.usage()
+
+        term.ok.assert_called_once_with("Removed 1 cache entries (6 B).")
+        self.assertEqual(count, 1)
+
+    def test_clear(self):
+        term = MagicMock(spec=Terminal)
+
+        with tempgitdir():
+            result_cache = ResultCache()
+            result_cache.local.set("aa1", b"123")
+            result_cache.local.set("bb2", b"123")
+            result_cache.add_statistics(CacheStatistics(hits=1))
+
+            clear_cache(term, Namespace())
+
+            usage = result_cache.usage()
+            statistics = result_cache.get_statistics()
+
+        term.ok.assert_called_once_with("Removed 2 cache entries (6 B).")
+        self.assertEqual(usage, (0, 0))
+        self.assertEqual(statistics, CacheStatistics())
@@ -325,6 +325,26 @@ class CheckConfigTestCase(unittest.TestCase):
             'add a "pre-commit = [plugin1, plugin2]" setting.'
         )
 
+    def test_invalid_settings(self):
+        term = MagicMock()
+
+        with tempgitdir():
+            pre_commit_hook = PreCommitHook()
+            pre_commit_hook.write(mode=Mode.POETRY)
+            pyproject_toml = get_pyproject_toml_path()
+            pyproject_toml.write_text(
+                "[tool.autohooks]\nmode = 'poetry'\npre-commit = []\n"
+                "[tool.autohooks.cache]\nmax-size = 'lots'\n",
+                encoding="utf8",
+            )
+
+            check_config(term, pyproject_toml, pre_commit_hook)
+
+        term.warning.assert_called_once_with(
+            'Ignoring invalid "max-size" setting in [tool.autohooks.cache]. '
+            "Invalid size 'lots'. Expected e.g. 500MB."
+        )
+
     def test_different_mode(self):
         term = MagicMock()
 
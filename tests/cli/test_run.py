@@ -0,0 +1,590 @@
+# SPDX-FileCopyrightText: 2026 Greenbone AG
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+
+import os
+import subprocess
+import sys
+import unittest
+from argparse import ArgumentTypeError, Namespace
+from unittest.mock import MagicMock, patch
+
+from autohooks.cli.run import (
+    merge_run_reports,
+    parse_jobs,
+    parse_shard,
+    run_hooks,
+)
+from autohooks.precommit.report import Report
+from autohooks.precommit.timings import TimingStore
+from autohooks.terminal import Terminal
+from autohooks.utils import clear_repository_context, exec_git
+from tests import temp_python_module, tempdir, tempgitdir
+from tests.api.git import git_add, git_commit
+
+PLUGIN = """
+from autohooks.api.git import get_staged_status
+
+FILES = []
+
+def precommit(**kwargs):
+    FILES.extend(str(f.path) for f in get_staged_status())
+    return 0
+"""
+
+SHARD_PLUGIN = """
+import os
+from pathlib import Path
+
+from autohooks.api.git import get_staged_status
+
+def precommit(report_progress, **kwargs):
+    files = get_staged_status()
+    report_progress.init(len(files))
+    output = Path(os.environ["SHARD_OUTPUT"]) / str(os.getpid())
+    with output.open("a", encoding="utf8") as f:
+        for status in files:
+            f.write(f"{status.path}\\n")
+            report_progress.update()
+    return 0
+"""
+
+
+def run_args(**kwargs) -> Namespace:
+    args = {
+        "staged": False,
+        "all_files": False,
+        "files": None,
+        "from_ref": None,
+        "to_ref": "HEAD",
+        "jobs": None,
+        "plugins": None,
+        "shard": None,
+        "report": None,
+    }
+    args.update(kwargs)
+    return Namespace(**args)
+
+
+class RunCliTestCase(unittest.TestCase):
+    def setUp(self):
+        self.addCleanup(clear_repository_context)
+
+    def test_run_commit_range(self):
+        term = Terminal()
+        term.bold_info = MagicMock()
+        args = run_args(from_ref="main")
+
+        with tempgitdir() as tmpdir, temp_python_module(PLUGIN, name="foo"):
+            (tmpdir / "pyproject.toml").write_text(
+                '[tool.autohooks]\npre-commit = ["foo"]\n', encoding="utf8"
+            )
+            foo_file = tmpdir / "foo.py"
+            foo_file.write_text("foo = 1\n", encoding="utf8")
+            git_add(foo_file)
+            git_commit()
+
+            exec_git("checkout", "-q", "-b", "feature")
+            bar_file = tmpdir / "bar.py"
+            bar_file.write_text("bar = 1\n", encoding="utf8")
+            git_add(bar_file)
+            git_commit()
+
+            # staged changes are not part of the commit range
+            foo_file.write_text("foo = 2\n", encoding="utf8")
+            git_add(foo_file)
+
+            run_hooks(term, args)
+
+            self.assertEqual(sys.modules["foo"].FILES, ["bar.py"])
+
+        term.bold_info.assert_called_once_with("autohooks => main...HEAD")
+
+    def test_run_staged_files(self):
+        term = Terminal()
+        args = run_args()
+
+        with tempgitdir() as tmpdir, temp_python_module(PLUGIN, name="foo"):
+            (tmpdir / "pyproject.toml").write_text(
+                '[tool.autohooks]\npre-commit = ["foo"]\n', encoding="utf8"
+            )
+            foo_file = tmpdir / "foo.py"
+            foo_file.write_text("foo = 1\n", encoding="utf8")
+            git_add(foo_file)
+
+            run_hooks(term, args)
+
+            self.assertEqual(sys.modules["foo"].FILES, ["foo.py"])
+
+    def test_plugin_failure(self):
+        term = Terminal()
+        args = run_args()
+
+        with (
+            tempgitdir() as tmpdir,
+            temp_python_module(
+                "def precommit(**kwargs):\n    return 2\n", name="foo"
+            ),
+        ):
+            (tmpdir / "pyproject.toml").write_text(
+                '[tool.autohooks]\npre-commit = ["foo"]\n', encoding="utf8"
+            )
+
+            with self.assertRaises(SystemExit) as cm:
+                run_hooks(term, args)
+
+        self.assertEqual(cm.exception.code, 2)
+
+    def test_invalid_ref(self):
+        term = MagicMock(spec=Terminal)
+        args = run_args(from_ref="foo")
+
+        with tempgitdir() as tmpdir:
+            (tmpdir / "pyproject.toml").write_text(
+                '[tool.autohooks]\npre-commit = ["foo"]\n', encoding="utf8"
+            )
+
+            with self.assertRaises(SystemExit) as cm:
+                run_hooks(term, args)
+
+        self.assertEqual(cm.exception.code, 1)
+        term.error.assert_called_once_with("foo is not a valid commit.")
+
+    def test_missing_config(self):
+        term = MagicMock(spec=Terminal)
+        args = run_args()
+
+        with tempgitdir(), self.assertRaises(SystemExit) as cm:
+            run_hooks(term, args)
+
+        self.assertEqual(cm.exception.code, 1)
+        term.error.assert_called_once()
+
+    def test_run_all_files(self):
+        term = Terminal()
+        term.bold_info = MagicMock()
+        args = run_args(all_files=True)
+
+        with tempgitdir() as tmpdir, temp_python_module(PLUGIN, name="foo"):
+            (tmpdir / "pyproject.toml").write_text(
+                '[tool.autohooks]\npre-commit = ["foo"]\n', encoding="utf8"
+            )
+            foo_file = tmpdir / "foo.py"
+            foo_file.write_text("foo = 1\n", encoding="utf8")
+            git_add(foo_file)
+            git_commit()
+
+            bar_file = tmpdir / "bar.py"
+            bar_file.write_text("bar = 1\n", encoding="utf8")
+            git_add(bar_file)
+            # untracked files are not checked
+            (tmpdir / "baz.py").write_text("baz = 1\n", encoding="utf8")
+
+            run_hooks(term, args)
+
+            self.assertEqual(sys.modules["foo"].FILES, ["bar.py", "foo.py"])
+
+        term.bold_info.assert_called_once_with("autohooks => all files")
+
+    def test_run_files(self):
+        term = Terminal()
+        args = run_args(files=["sub", "foo.py"])
+
+        with tempgitdir() as tmpdir, temp_python_module(PLUGIN, name="foo"):
+            (tmpdir / "pyproject.toml").write_text(
+                '[tool.autohooks]\npre-commit = ["foo"]\n', encoding="utf8"
+            )
+            sub_dir = tmpdir / "sub"
+            sub_dir.mkdir()
+            for path in (
+                tmpdir / "foo.py",
+                tmpdir / "bar.py",
+                sub_dir / "baz.py",
+            ):
+                path.write_text("value = 1\n", encoding="utf8")
+                git_add(path)
+            git_commit()
+
+            run_hooks(term, args)
+
+            self.assertEqual(sys.modules["foo"].FILES, ["foo.py", "sub/baz.py"])
+
+    def test_run_plugin(self):
+        term = Terminal()
+        args = run_args(all_files=True, plugins=["bar"])
+
+        with (
+            tempgitdir() as tmpdir,
+            temp_python_module(
+                "def precommit(**kwargs):\n    return 2\n", name="foo"
+            ),
+            temp_python_module(PLUGIN, name="bar"),
+        ):
+            (tmpdir / "pyproject.toml").write_text(
+                '[tool.autohooks]\npre-commit = ["foo", "bar"]\n',
+                encoding="utf8",
+            )
+            foo_file = tmpdir / "foo.py"
+            foo_file.write_text("foo = 1\n", encoding="utf8")
+            git_add(foo_file)
+
+            run_hooks(term, args)
+
+            self.assertEqual(sys.modules["bar"].FILES, ["foo.py"])
+
+    def test_run_unknown_plugin(self):
+        term = MagicMock(spec=Terminal)
+        args = run_args(plugins=["bar"])
+
+        with tempgitdir() as tmpdir:
+            (tmpdir / "pyproject.toml").write_text(
+                '[tool.autohooks]\npre-commit = ["foo"]\n', encoding="utf8"
+            )
+
+            with self.assertRaises(SystemExit) as cm:
+                run_hooks(term, args)
+
+        self.assertEqual(cm.exception.code, 1)
+        term.error.assert_called_once_with("Plugin bar is not configured.")
+
+    @patch("autohooks.cli.run.run_plugins", return_value=0)
+    def test_run_jobs(self, run_plugins_mock: MagicMock):
+        term = MagicMock(spec=Terminal)
+        args = run_args(jobs=4)
+
+        with tempgitdir() as tmpdir:
+            (tmpdir / "pyproject.toml").write_text(
+                '[tool.autohooks]\nworkers = 1\npre-commit = ["foo"]\n',
+                encoding="utf8",
+            )
+
+            run_hooks(term, args)
+
+        config = run_plugins_mock.call_args.args[1]
+        self.assertEqual(config.get_workers(), 4)
+
+    def test_run_sharded(self):
+        term = Terminal()
+        args = run_args(all_files=True, jobs=2)
+
+        with (
+            tempgitdir() as tmpdir,
+            temp_python_module(SHARD_PLUGIN, name="foo"),
+            tempdir() as output_dir,
+            patch.dict("os.environ", {"SHARD_OUTPUT": str(output_dir)}),
+        ):
+            (tmpdir / "pyproject.toml").write_text(
+                '[tool.autohooks]\npre-commit = ["foo"]\n'
+                'shard-plugins = ["foo"]\n',
+                encoding="utf8",
+            )
+            files = [f"file{index:02}.py" for index in range(25)]
+            for name in files:
+                (tmpdir / name).write_text("value = 1\n", encoding="utf8")
+            git_add(*(tmpdir / name for name in files))
+
+            run_hooks(term, args)
+
+            outputs = [
+                path.read_text(encoding="utf8").splitlines()
+                for path in output_dir.iterdir()
+            ]
+
+        # each shard is checked by a single worker
+        self.assertEqual(sorted(len(output) for output in outputs), [12, 13])
+        self.assertEqual(
+            sorted(path for output in outputs for path in output), files
+        )
+
+    def test_run_shard(self):
+        term = Terminal()
+        term.bold_info = MagicMock()
+
+        with (
+            tempgitdir() as tmpdir,
+            temp_python_module(PLUGIN, name="foo"),
+        ):
+            (tmpdir / "pyproject.toml").write_text(
+                '[tool.autohooks]\npre-commit = ["foo"]\n', encoding="utf8"
+            )
+            for name in ("foo.py", "bar.py"):
+                (tmpdir / name).write_text("value = 1\n", encoding="utf8")
+                git_add(tmpdir / name)
+
+            report_path = tmpdir / "report.json"
+            args = run_args(all_files=True, shard=(2, 4), report=report_path)
+
+            run_hooks(term, args)
+
+            self.assertEqual(sys.modules["foo"].FILES, ["foo.py"])
+
+            report = Report.read(report_path)
+
+        term.bold_info.assert_called_once_with(
+            "autohooks => all files (shard 2/4)"
+        )
+        self.assertEqual(report.shards, [(2, 4)])
+        self.assertEqual(report.files, ["foo.py"])
+        self.assertEqual([plugin.name for plugin in report.plugins], ["foo"])
+        self.assertEqual(report.result, 0)
+
+    def test_run_report_failure(self):
+        term = Terminal()
+
+        with (
+            tempgitdir() as tmpdir,
+            temp_python_module(
+                "def precommit(**kwargs):\n    return 2\n", name="foo"
+            ),
+        ):
+            (tmpdir / "pyproject.toml").write_text(
+                '[tool.autohooks]\npre-commit = ["foo"]\n', encoding="utf8"
+            )
+            report_path = tmpdir / "report.json"
+
+            with self.assertRaises(SystemExit):
+                run_hooks(term, run_args(report=report_path))
+
+            report = Report.read(report_path)
+
+        self.assertEqual(report.shards, [])
+        self.assertEqual(report.result, 2)
+
+    def test_store_plugin_durations(self):
+        term = Terminal()
+
+        with tempgitdir() as tmpdir, temp_python_module(PLUGIN, name="foo"):
+            (tmpdir / "pyproject.toml").write_text(
+                '[tool.autohooks]\npre-commit = ["foo"]\n', encoding="utf8"
+            )
+
+            run_hooks(term, run_args())
+
+            with TimingStore() as store:
+                durations = store.get_plugin_durations(["foo"])
+
+        self.assertEqual(list(durations), ["foo"])
+
+    def test_run_longest_plugin_first(self):
+        term = Terminal()
+        plugin = """
+import os
+from pathlib import Path
+
+from autohooks.api import PluginMetadata
+
+AUTOHOOKS_METADATA = PluginMetadata(parallel_safe=True)
+
+def precommit(**kwargs):
+    with Path(os.environ["ORDER_OUTPUT"]).open("a") as f:
+        f.write(__name__ + "\\n")
+    return 0
+"""
+
+        with (
+            tempgitdir() as tmpdir,
+            temp_python_module(plugin, name="foo"),
+            temp_python_module(plugin, name="bar"),
+            temp_python_module(plugin, name="baz"),
+        ):
+            (tmpdir / "pyproject.toml").write_text(
+                '[tool.autohooks]\npre-commit = ["foo", "bar", "baz"]\n',
+                encoding="utf8",
+            )
+            with TimingStore() as store:
+                store.add_plugin_durations({"foo": 1.0, "bar": 10.0})
+
+            output = tmpdir / "order"
+            with patch.dict("os.environ", {"ORDER_OUTPUT": str(output)}):
+                run_hooks(term, run_args(jobs=1))
+
+            order = output.read_text(encoding="utf8").splitlines()
+
+        # plugins without known durations are started first
+        self.assertEqual(order, ["baz", "bar", "foo"])
+
+
+class ParseShardTestCase(unittest.TestCase):
+    def test_parse_shard(self):
+        self.assertEqual(parse_shard("1/4"), (1, 4))
+        self.assertEqual(parse_shard("4/4"), (4, 4))
+
+    def test_invalid_shard(self):
+        for value in ("0/4", "5/4", "1", "a/b", "1/2/3", "1/0"):
+            with (
+                self.subTest(value=value),
+                self.assertRaises(ArgumentTypeError),
+            ):
+                parse_shard(value)
+
+
+class ParseJobsTestCase(unittest.TestCase):
+    def test_parse_jobs(self):
+        self.assertEqual(parse_jobs("0"), 0)
+        self.assertEqual(parse_jobs("4"), 4)
+
+    def test_invalid_jobs(self):
+        for value in ("-1", "a", "1.5"):
+            with (
+                self.subTest(value=value),
+                self.assertRaises(ArgumentTypeError),
+            ):
+                parse_jobs(value)
+
+
+def write_report(path, shards, files, result):
+    report = Report(shards=shards, files=files)
+    report.add_plugin("foo", result, 1.0)
+    report.write(path)
+
+
+class MergeRunReportsTestCase(unittest.TestCase):
+    def test_merge(self):
+        term = MagicMock(spec=Terminal)
+
+        with tempdir() as tmpdir:
+            write_report(tmpdir / "1.json", [(1, 2)], ["foo.py"], 0)
+            write_report(tmpdir / "2.json", [(2, 2)], ["bar.py"], 0)
+            output = tmpdir / "merged.json"
+
+            merge_run_reports(
+                term,
+                Namespace(
+                    reports=[tmpdir / "1.json", tmpdir / "2.json"],
+                    output=output,
+                ),
+            )
+
+            merged = Report.read(output)
+
+        self.assertEqual(merged.files, ["bar.py", "foo.py"])
+        term.ok.assert_called_once_with("foo (2.00s)")
+        term.warning.assert_not_called()
+
+    def test_merge_failure(self):
+        term = MagicMock(spec=Terminal)
+
+        with tempdir() as tmpdir:
+            write_report(tmpdir / "1.json", [(1, 2)], ["foo.py"], 0)
+            write_report(tmpdir / "2.json", [(2, 2)], ["bar.py"], 3)
+
+            with self.assertRaises(SystemExit) as cm:
+                merge_run_reports(
+                    term,
+                    Namespace(
+                        reports=[tmpdir / "1.json", tmpdir / "2.json"],
+                        output=None,
+                    ),
+                )
+
+        self.assertEqual(cm.exception.code, 3)
+        term.fail.assert_called_once_with("foo (2.00s)")
+
+    def test_merge_missing_shard(self):
+        term = MagicMock(spec=Terminal)
+
+        with tempdir() as tmpdir:
+            write_report(tmpdir / "1.json", [(1, 3)], ["foo.py"], 0)
+
+            with self.assertRaises(SystemExit) as cm:
+                merge_run_reports(
+                    term, Namespace(reports=[tmpdir / "1.json"], output=None)
+                )
+
+        self.assertEqual(cm.exception.code, 1)
+        term.warning.assert_called_once_with(
+            "Missing reports of shard(s) 2/3, 3/3."
+        )
+
+    def test_invalid_report(self):
+        term = MagicMock(spec=Terminal)
+
+        with tempdir() as tmpdir, self.assertRaises(SystemExit) as cm:
+            merge_run_reports(
+                term, Namespace(reports=[tmpdir / "1.json"], output=None)
+            )
+
+        self.assertEqual(cm.exception.code, 1)
+        term.error.assert_called_once()
+
+
+CLI_SCRIPT = "import sys; from autohooks.cli import main; sys.exit(main())"
+
+FILES_PLUGIN = """
+from autohooks.api.git import get_staged_status
+
+def precommit(**kwargs):
+    return 0 if get_staged_status() else 1
+"""
+
+
+class ShardedRunTestCase(unittest.TestCase):
+    def test_shards_on_several_nodes(self):
+        env = os.environ.copy()
+        env["PYTHONPATH"] = os.pathsep.join(sys.path)
+
+        with tempgitdir() as tmpdir:
+            plugins_dir = tmpdir / ".autohooks"
+            plugins_dir.mkdir()
+            (plugins_dir / "files_plugin.py").write_text(
+                FILES_PLUGIN, encoding="utf8"
+            )
+            (tmpdir / "pyproject.toml").write_text(
+                '[tool.autohooks]\npre-commit = ["files_plugin"]\n',
+                encoding="utf8",
+            )
+            files = [f"file{index:02}.py" for index in range(30)]
+            for name in files:
+                (tmpdir / name).write_text("value = 1\n", encoding="utf8")
+            git_add(*(tmpdir / name for name in files))
+            git_commit()
+
+            # each process acts as a separate CI node
+            processes = [
+                subprocess.Popen(
+                    [
+                        sys.executable,
+                        "-c",
+                        CLI_SCRIPT,
+                        "run",
+                        "--all-files",
+                        "--shard",
+                        f"{number}/3",
+                        "--report",
+                        f"report{number}.json",
+                    ],
+                    cwd=tmpdir,
+                    env=env,
+                    stdout=subprocess.DEVNULL,
+                )
+                for number in (1, 2, 3)
+            ]
+            self.assertEqual([process.wait() for process in processes], [0] * 3)
+
+            reports = [
+                Report.read(tmpdir / f"report{number}.json")
+                for number in (1, 2, 3)
+            ]
+            merge = subprocess.run(
+                [
+                    sys.executable,
+                    "-c",
+                    CLI_SCRIPT,
+                    "merge-reports",
+                    "-o",
+                    "merged.json",
+                    *(f"report{number}.json" for number in (1, 2, 3)),
+                ],
+                cwd=tmpdir,
+                env=env,
+                stdout=subprocess.DEVNULL,
+                check=False,
+            )
+            merged = Report.read(tmpdir / "merged.json")
+
+        self.assertEqual(merge.returncode, 0)
+        self.assertEqual(merged.files, files)
+        # the shards are disjoint
+        self.assertEqual(sum(len(report.files) for report in reports), 30)
+        self.assertEqual(merged.shards, [(1, 3), (2, 3), (3, 3)])
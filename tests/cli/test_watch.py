@@ -0,0 +1,110 @@
+# SPDX-FileCopyrightText: 2026 Greenbone AG
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+
+import unittest
+from argparse import Namespace
+from unittest.mock import MagicMock, patch
+
+from autohooks.cli.watch import watch_files
+from autohooks.terminal import Terminal
+from autohooks.utils import clear_repository_context
+from tests import temp_python_module, tempgitdir
+
+
+def watch_args(**kwargs) -> Namespace:
+    args = {"debounce": 0.5, "poll": False}
+    args.update(kwargs)
+    return Namespace(**args)
+
+
+class WatchFilesTestCase(unittest.TestCase):
+    def setUp(self):
+        self.addCleanup(clear_repository_context)
+
+    def test_missing_config(self):
+        term = MagicMock(spec=Terminal)
+
+        with tempgitdir(), self.assertRaises(SystemExit) as cm:
+            watch_files(term, watch_args())
+
+        self.assertEqual(cm.exception.code, 1)
+        term.error.assert_called_once()
+
+    def test_no_cache_plugins(self):
+        term = MagicMock(spec=Terminal)
+
+        with tempgitdir() as tmpdir:
+            (tmpdir / "pyproject.toml").write_text(
+                '[tool.autohooks]\npre-commit = ["foo"]\n', encoding="utf8"
+            )
+
+            with self.assertRaises(SystemExit) as cm:
+                watch_files(term, watch_args())
+
+        self.assertEqual(cm.exception.code, 1)
+        term.error.assert_called_once()
+
+    @patch("autohooks.cli.watch.watch")
+    def test_watch_cache_plugins(self, watch_mock: MagicMock):
+        term = MagicMock(spec=Terminal)
+        watch_mock.side_effect = KeyboardInterrupt()
+
+        with (
+            tempgitdir() as tmpdir,
+            temp_python_module(
+                "from autohooks.precommit.metadata import PluginMetadata\n"
+                "AUTOHOOKS_METADATA = PluginMetadata()\n"
+                "def precommit(**kwargs):\n"
+                "    return 0\n",
+                name="bar",
+            ),
+        ):
+            (tmpdir / "pyproject.toml").write_text(
+                "[tool.autohooks]\n"
+                'pre-commit = ["foo", "bar"]\n'
+                "[tool.autohooks.cache]\n"
+                'plugins = ["bar"]\n',
+                encoding="utf8",
+            )
+
+            watch_files(term, watch_args(poll=True, debounce=1.0))
+
+        watch_mock.assert_called_once()
+        _, config, _ = watch_mock.call_args.args
+        self.assertEqual(config.get_pre_commit_script_names(), ["bar"])
+        self.assertEqual(watch_mock.call_args.kwargs, {"debounce": 1.0})
+
+    @patch("autohooks.cli.watch.watch")
+    def test_skip_plugins_changing_files(self, watch_mock: MagicMock):
+        term = MagicMock(spec=Terminal)
+
+        with (
+            tempgitdir() as tmpdir,
+            temp_python_module(
+                "from autohooks.precommit.metadata import PluginMetadata\n"
+                "AUTOHOOKS_METADATA = PluginMetadata(mutates_files=True)\n"
+                "def precommit(**kwargs):\n"
+                "    return 0\n",
+                name="foo",
+            ),
+            temp_python_module(
+                "def precommit(**kwargs):\n    return 0\n",
+                name="bar",
+            ),
+        ):
+            (tmpdir / "pyproject.toml").write_text(
+                "[tool.autohooks]\n"
+                'pre-commit = ["foo", "bar", "baz"]\n'
+                "[tool.autohooks.cache]\n"
+                'plugins = ["foo", "bar", "baz"]\n',
+                encoding="utf8",
+            )
+
+            with self.assertRaises(SystemExit) as cm:
+                watch_files(term, watch_args())
+
+        self.assertEqual(cm.exception.code, 1)
+        term.error.assert_called_once()
+        watch_mock.assert_not_called()
@@ -0,0 +1,820 @@
+# SPDX-FileCopyrightText: 2026 Greenbone AG
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+
+import os
+import shutil
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from types import ModuleType
+from unittest.mock import patch
+
+from autohooks.api.git import get_staged_status
+from autohooks.config import AutohooksConfig, Config
+from autohooks.hooks import PrePushHook
+from autohooks.precommit.cache import (
+    CacheBackend,
+    CacheStatistics,
+    DirectoryBackend,
+    HttpBackend,
+    ResultCache,
+    get_blob_ids,
+    get_cache_backend,
+    get_cache_key,
+    get_cache_path,
+    get_file_cache_keys,
+    get_tree_blob_ids,
+)
+from autohooks.precommit.run import run_plugins
+from autohooks.terminal import Terminal
+from autohooks.utils import (
+    clear_repository_context,
+    exec_git,
+    get_repository_context,
+)
+from tests import temp_python_module, tempdir, tempgitdir
+from tests.api.git import git_add, git_commit
+
+PLUGIN = """
+RUNS = []
+
+def precommit(**kwargs):
+    RUNS.append(1)
+    return 0
+"""
+
+
+class GetCacheKeyTestCase(unittest.TestCase):
+    def test_key_changes(self):
+        plugin = ModuleType("foo")
+        config = Config({"foo": {"bar": 1}}).hash()
+        key = get_cache_key("foo", plugin, config, {"foo.py": "1"})
+
+        self.assertEqual(
+            key, get_cache_key("foo", plugin, config, {"foo.py": "1"})
+        )
+        self.assertNotEqual(
+            key, get_cache_key("bar", plugin, config, {"foo.py": "1"})
+        )
+        self.assertNotEqual(
+            key, get_cache_key("foo", plugin, config, {"foo.py": "2"})
+        )
+        self.assertNotEqual(
+            key, get_cache_key("foo", plugin, config, {"bar.py": "1"})
+        )
+        self.assertNotEqual(
+            key,
+            get_cache_key(
+                "foo",
+                plugin,
+                Config({"foo": {"bar": 2}}).hash(),
+                {"foo.py": "1"},
+            ),
+        )
+
+    def test_key_changes_with_function(self):
+        plugin = ModuleType("foo")
+        config = Config().hash()
+
+        self.assertNotEqual(
+            get_cache_key("foo", plugin, config, {}),
+            get_cache_key("foo", plugin, config, {}, function_name="prepush"),
+        )
+
+    def test_file_keys(self):
+        plugin = ModuleType("foo")
+        config = Config().hash()
+
+        keys = get_file_cache_keys(
+            "foo", plugin, config, {"foo.py": "1", "bar.py": "2"}
+        )
+
+        self.assertEqual(list(keys), ["foo.py", "bar.py"])
+        self.assertEqual(
+            keys["foo.py"],
+            get_file_cache_keys("foo", plugin, config, {"foo.py": "1"})[
+                "foo.py"
+            ],
+        )
+        self.assertNotEqual(
+            keys["foo.py"],
+            get_file_cache_keys("foo", plugin, config, {"foo.py": "2"})[
+                "foo.py"
+            ],
+        )
+        self.assertNotEqual(
+            keys["foo.py"],
+            get_cache_key("foo", plugin, config, {"foo.py": "1"}),
+        )
+
+    def test_key_changes_with_plugin_source(self):
+        config = Config().hash()
+
+        with temp_python_module("A = 1", name="foo") as path:
+            plugin = __import__("foo")
+            key = get_cache_key("foo", plugin, config, {})
+
+            path.write_text("A = 2", encoding="utf8")
+
+            self.assertNotEqual(key, get_cache_key("foo", plugin, config, {}))
+
+
+class ResultCacheTestCase(unittest.TestCase):
+    def test_get_and_set(self):
+        with tempdir() as tmpdir:
+            cache = ResultCache(tmpdir / "cache")
+
+            self.assertIsNone(cache.get("abcdef"))
+
+            cache.set("abcdef", {"plugin": "foo"})
+
+            entry = cache.get("abcdef")
+            self.assertIsNotNone(entry)
+            self.assertEqual(entry["plugin"], "foo")  # type: ignore[index]
+            # no temporary files are left
+            self.assertEqual(
+                list((tmpdir / "cache" / "ab").iterdir()),
+                [tmpdir / "cache" / "ab" / "cdef"],
+            )
+
+    def test_invalid_entry(self):
+        with tempdir() as tmpdir:
+            cache = ResultCache(tmpdir)
+            (tmpdir / "ab").mkdir()
+            (tmpdir / "ab" / "cdef").write_text("{", encoding="utf8")
+            (tmpdir / "ab" / "cdeg").write_text(
+                '{"version": 0}', encoding="utf8"
+            )
+
+            self.assertIsNone(cache.get("abcdef"))
+            self.assertIsNone(cache.get("abcdeg"))
+
+    def test_default_path(self):
+        self.addCleanup(clear_repository_context)
+
+        with tempgitdir() as tmpdir:
+            self.assertEqual(
+                get_cache_path(), tmpdir / ".git" / "autohooks" / "cache"
+            )
+
+
+class CacheBackendTestCase(unittest.TestCase):
+    def test_abstract(self):
+        with self.assertRaises(TypeError):
+            CacheBackend()  # type: ignore[abstract]
+
+
+class DirectoryBackendTestCase(unittest.TestCase):
+    def test_get_and_set(self):
+        with tempdir() as tmpdir:
+            backend = DirectoryBackend(tmpdir)
+
+            self.assertIsNone(backend.get("abcdef"))
+
+            backend.set("abcdef", b"foo")
+
+            self.assertEqual(backend.get("abcdef"), b"foo")
+
+    def test_get_entry_of_other_user(self):
+        with tempdir() as tmpdir:
+            backend = DirectoryBackend(tmpdir)
+            backend.set("abcdef", b"foo")
+
+            # entries of other users can't be marked as recently used
+            with patch(
+                "autohooks.precommit.cache.os.utime",
+                side_effect=PermissionError(),
+            ):
+                self.assertEqual(backend.get("abcdef"), b"foo")
+
+    def test_evict_least_recently_used(self):
+        with tempdir() as tmpdir:
+            backend = DirectoryBackend(tmpdir, max_size=8)
+            for index, key in enumerate(("aa1", "bb2", "cc3")):
+                backend.set(key, b"1234")
+                path = tmpdir / key[:2] / key[2:]
+                os.utime(path, (index, index))
+
+            # reading an entry marks it as recently used
+            backend.get("aa1")
+            backend.evict()
+
+            self.assertEqual(backend.get("aa1"), b"1234")
+            self.assertIsNone(backend.get("bb2"))
+            self.assertEqual(backend.get("cc3"), b"1234")
+
+    def test_evict_expired(self):
+        with tempdir() as tmpdir:
+            backend = DirectoryBackend(tmpdir, max_age=60)
+            backend.set("aa1", b"1234")
+            backend.set("bb2", b"1234")
+            os.utime(tmpdir / "aa" / "1", (0, 0))
+
+            self.assertEqual(backend.evict(), (1, 4))
+
+            self.assertIsNone(backend.get("aa1"))
+            self.assertEqual(backend.get("bb2"), b"1234")
+
+    def test_usage_and_clear(self):
+        with tempdir() as tmpdir:
+            backend = DirectoryBackend(tmpdir)
+            backend.set("aa1", b"1234")
+            backend.set("bb2", b"12")
+            (tmpdir / "statistics.json").write_text("{}", encoding="utf8")
+
+            self.assertEqual(backend.usage(), (2, 6))
+            self.assertEqual(backend.clear(), (2, 6))
+            self.assertEqual(backend.usage(), (0, 0))
+            self.assertTrue((tmpdir / "statistics.json").exists())
+
+    def test_evict_unlimited(self):
+        with tempdir() as tmpdir:
+            backend = DirectoryBackend(tmpdir)
+            backend.set("abcdef", b"foo")
+
+            backend.evict()
+
+            self.assertEqual(backend.get("abcdef"), b"foo")
+
+
+class ContentStoreHandler(BaseHTTPRequestHandler):
+    """
+    A minimal HTTP content store keeping the entries in memory
+    """
+
+    def do_GET(self):
+        content = self.server.entries.get(self.path)
+        if content is None:
+            self.send_error(404)
+            return
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def do_PUT(self):
+        length = int(self.headers["Content-Length"])
+        self.server.entries[self.path] = self.rfile.read(length)
+        self.server.headers.append(self.headers)
+        self.send_response(201)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, *args):
+        pass
+
+
+class ContentStore:
+    def __enter__(self):
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), ContentStoreHandler)
+        self.server.entries = {}
+        self.server.headers = []
+        self.thread = threading.Thread(target=self.server.serve_forever)
+        self.thread.start()
+        host, port = self.server.server_address
+        self.url = f"http://{host}:{port}/cache"
+        return self
+
+    def __exit__(self, *args):
+        self.server.shutdown()
+        self.server.server_close()
+        self.thread.join()
+
+
+class HttpBackendTestCase(unittest.TestCase):
+    def test_get_and_set(self):
+        with ContentStore() as store:
+            backend = HttpBackend(store.url + "/")
+
+            self.assertIsNone(backend.get("abcdef"))
+
+            backend.set("abcdef", b"foo")
+
+            self.assertEqual(backend.get("abcdef"), b"foo")
+            self.assertEqual(store.server.entries, {"/cache/abcdef": b"foo"})
+
+    @patch.dict("os.environ", {"AUTOHOOKS_CACHE_TOKEN": "secret"})
+    def test_token(self):
+        with ContentStore() as store:
+            HttpBackend(store.url).set("abcdef", b"foo")
+
+            self.assertEqual(
+                store.server.headers[0]["Authorization"], "Bearer secret"
+            )
+
+    def test_unavailable(self):
+        with ContentStore() as store:
+            url = store.url
+
+        backend = HttpBackend(url, timeout=0.5)
+
+        self.assertIsNone(backend.get("abcdef"))
+        backend.set("abcdef", b"foo")
+        self.assertIsNone(backend.get("abcdef"))
+
+
+class GetCacheBackendTestCase(unittest.TestCase):
+    def test_get_cache_backend(self):
+        backend = get_cache_backend("https://example.com/cache")
+        self.assertIsInstance(backend, HttpBackend)
+
+        backend = get_cache_backend("/mnt/cache")
+        self.assertIsInstance(backend, DirectoryBackend)
+        self.assertEqual(str(backend.path), "/mnt/cache")  # type: ignore
+
+
+class ResultCacheEvictionTestCase(unittest.TestCase):
+    def test_evict_once_per_interval(self):
+        with tempdir() as tmpdir:
+            cache = ResultCache(tmpdir, max_size=4)
+            cache.local.set("aa1", b"1234")
+
+            self.assertEqual(cache.evict(), (0, 0))
+
+            cache.local.set("bb2", b"1234")
+            os.utime(tmpdir / "aa" / "1", (0, 0))
+
+            self.assertEqual(cache.evict(), (0, 0))
+            self.assertEqual(cache.evict(force=True), (1, 4))
+
+    def test_statistics(self):
+        with tempdir() as tmpdir:
+            cache = ResultCache(tmpdir)
+
+            self.assertEqual(cache.get_statistics(), CacheStatistics())
+
+            cache.add_statistics(CacheStatistics(hits=1, misses=3))
+            cache.add_statistics(CacheStatistics(hits=2))
+
+            statistics = cache.get_statistics()
+            self.assertEqual(statistics, CacheStatistics(hits=3, misses=3))
+            self.assertEqual(statistics.hit_rate, 0.5)
+
+            cache.reset_statistics()
+
+            self.assertEqual(cache.get_statistics(), CacheStatistics())
+
+
+class SharedResultCacheTestCase(unittest.TestCase):
+    def test_copy_shared_entries(self):
+        with tempdir() as tmpdir:
+            shared = DirectoryBackend(tmpdir / "shared")
+            ResultCache(tmpdir / "other", shared=shared).set(
+                "abcdef", {"plugin": "foo"}
+            )
+
+            cache = ResultCache(tmpdir / "local", shared=shared)
+            entry = cache.get("abcdef")
+
+            self.assertEqual(entry["plugin"], "foo")  # type: ignore[index]
+            self.assertIsNotNone(cache.local.get("abcdef"))
+
+    def test_http_store(self):
+        with tempdir() as tmpdir, ContentStore() as store:
+            ResultCache(tmpdir / "other", shared=HttpBackend(store.url)).set(
+                "abcdef", {"plugin": "foo"}
+            )
+
+            cache = ResultCache(tmpdir / "local", shared=HttpBackend(store.url))
+
+            self.assertIsNotNone(cache.get("abcdef"))
+            self.assertIsNone(cache.get("abcdeg"))
+
+
+class GetBlobIdsTestCase(unittest.TestCase):
+    def test_get_blob_ids(self):
+        with tempgitdir() as tmpdir:
+            (tmpdir / "foo.txt").write_text("Lorem", encoding="utf8")
+            git_add(tmpdir / "foo.txt")
+
+            blob_ids = get_blob_ids(get_staged_status())
+            index = exec_git("ls-files", "--stage", "foo.txt")
+
+        self.assertEqual(list(blob_ids), ["foo.txt"])  # type: ignore[arg-type]
+        self.assertIn(blob_ids["foo.txt"], index)  # type: ignore[index]
+
+    def test_get_tree_blob_ids(self):
+        with tempgitdir() as tmpdir:
+            (tmpdir / "foo.txt").write_text("Lorem", encoding="utf8")
+            (tmpdir / "bar.txt").write_text("Ipsum", encoding="utf8")
+            git_add(tmpdir / "foo.txt", tmpdir / "bar.txt")
+            git_commit()
+            # the working tree and the index differ from the tree
+            (tmpdir / "foo.txt").write_text("Dolor", encoding="utf8")
+            git_add(tmpdir / "foo.txt")
+
+            blob_ids = get_tree_blob_ids("HEAD", get_staged_status())
+            tree = exec_git("ls-tree", "HEAD", "foo.txt")
+
+            # files missing in the tree
+            (tmpdir / "baz.txt").write_text("Lorem", encoding="utf8")
+            git_add(tmpdir / "baz.txt")
+            missing = get_tree_blob_ids("HEAD", get_staged_status())
+
+        self.assertEqual(list(blob_ids), ["foo.txt"])  # type: ignore[arg-type]
+        self.assertIn(blob_ids["foo.txt"], tree)  # type: ignore[index]
+        self.assertIsNone(missing)
+
+
+class RunPluginsCacheTestCase(unittest.TestCase):
+    def setUp(self):
+        self.addCleanup(clear_repository_context)
+
+    def _config(self) -> AutohooksConfig:
+        return AutohooksConfig.from_dict(
+            {
+                "tool": {
+                    "autohooks": {
+                        "pre-commit": ["foo"],
+                        "cache": {"plugins": ["foo"]},
+                    }
+                }
+            }
+        )
+
+    def test_skip_cached_plugin(self):
+        term = Terminal()
+        config = self._config()
+
+        with tempgitdir() as tmpdir, temp_python_module(PLUGIN, name="foo"):
+            (tmpdir / "foo.txt").write_text("Lorem", encoding="utf8")
+            git_add(tmpdir / "foo.txt")
+
+            self.assertEqual(run_plugins(term, config), 0)
+            self.assertEqual(run_plugins(term, config), 0)
+            runs = len(__import__("foo").RUNS)
+            statistics = ResultCache().get_statistics()
+
+            # changed contents must be checked again
+            (tmpdir / "foo.txt").write_text("Ipsum", encoding="utf8")
+            git_add(tmpdir / "foo.txt")
+
+            self.assertEqual(run_plugins(term, config), 0)
+            changed_runs = len(__import__("foo").RUNS)
+
+        self.assertEqual(runs, 1)
+        self.assertEqual(changed_runs, 2)
+        self.assertEqual(statistics, CacheStatistics(hits=1, misses=1))
+
+    def test_failure_is_not_cached(self):
+        term = Terminal()
+        config = self._config()
+        plugin = PLUGIN.replace("return 0", "return 1")
+
+        with tempgitdir() as tmpdir, temp_python_module(plugin, name="foo"):
+            (tmpdir / "foo.txt").write_text("Lorem", encoding="utf8")
+            git_add(tmpdir / "foo.txt")
+
+            self.assertEqual(run_plugins(term, config), 1)
+            self.assertEqual(run_plugins(term, config), 1)
+            runs = len(__import__("foo").RUNS)
+
+        self.assertEqual(runs, 2)
+
+    def test_files_changed_while_running_are_not_cached(self):
+        term = Terminal()
+        config = self._config()
+        plugin = PLUGIN.replace(
+            "    RUNS.append(1)\n",
+            "    RUNS.append(1)\n"
+            "    if len(RUNS) == 1:\n"
+            "        import subprocess\n"
+            "        with open('foo.txt', 'w', encoding='utf8') as f:\n"
+            "            f.write('Ipsum')\n"
+            "        subprocess.run(['git', 'add', 'foo.txt'], check=True)\n",
+        )
+
+        with tempgitdir() as tmpdir, temp_python_module(plugin, name="foo"):
+            (tmpdir / "foo.txt").write_text("Lorem", encoding="utf8")
+            git_add(tmpdir / "foo.txt")
+
+            self.assertEqual(run_plugins(term, config), 0)
+
+            # the result must not be stored for the contents seen before the
+            # plugin was run
+            (tmpdir / "foo.txt").write_text("Lorem", encoding="utf8")
+            git_add(tmpdir / "foo.txt")
+
+            self.assertEqual(run_plugins(term, config), 0)
+            runs = len(__import__("foo").RUNS)
+
+        self.assertEqual(runs, 2)
+
+    def test_lookup_after_formatting(self):
+        term = Terminal()
+        config = AutohooksConfig.from_dict(
+            {
+                "tool": {
+                    "autohooks": {
+                        "pre-commit": ["bar", "foo"],
+                        "cache": {"plugins": ["foo"]},
+                    }
+                }
+            }
+        )
+        # a formatter changing the file on its second run
+        formatter = """
+import subprocess
+
+RUNS = []
+
+def precommit(**kwargs):
+    RUNS.append(1)
+    if len(RUNS) == 2:
+        with open("foo.txt", "w", encoding="utf8") as f:
+            f.write("Ipsum")
+        subprocess.run(["git", "add", "foo.txt"], check=True)
+    return 0
+"""
+
+        with (
+            tempgitdir() as tmpdir,
+            temp_python_module(PLUGIN, name="foo"),
+            temp_python_module(formatter, name="bar"),
+        ):
+            (tmpdir / "foo.txt").write_text("Lorem", encoding="utf8")
+            git_add(tmpdir / "foo.txt")
+
+            self.assertEqual(run_plugins(term, config), 0)
+            self.assertEqual(run_plugins(term, config), 0)
+            runs = len(__import__("foo").RUNS)
+
+        # the formatted contents must be checked
+        self.assertEqual(runs, 2)
+
+    def test_pre_push_keys_of_pushed_contents(self):
+        term = Terminal()
+        config = AutohooksConfig.from_dict(
+            {
+                "tool": {
+                    "autohooks": {
+                        "pre-push": ["foo"],
+                        "cache": {"plugins": ["foo"]},
+                    }
+                }
+            }
+        )
+        plugin = PLUGIN.replace("def precommit(", "def prepush(")
+
+        with tempgitdir() as tmpdir, temp_python_module(plugin, name="foo"):
+            (tmpdir / "foo.txt").write_text("Lorem", encoding="utf8")
+            git_add(tmpdir / "foo.txt")
+            git_commit()
+            context = get_repository_context()
+            context.commit_range = (context.empty_tree, "HEAD")
+            self.addCleanup(clear_repository_context)
+
+            run_plugins(term, config, hook=PrePushHook)
+            # local changes don't change the pushed contents
+            (tmpdir / "foo.txt").write_text("Ipsum", encoding="utf8")
+            run_plugins(term, config, hook=PrePushHook)
+            runs = len(__import__("foo").RUNS)
+
+        self.assertEqual(runs, 1)
+
+    def test_no_cache_for_partially_staged_files(self):
+        term = Terminal()
+        config = self._config()
+
+        with tempgitdir() as tmpdir, temp_python_module(PLUGIN, name="foo"):
+            (tmpdir / "foo.txt").write_text("Lorem", encoding="utf8")
+            git_add(tmpdir / "foo.txt")
+            (tmpdir / "foo.txt").write_text("Ipsum", encoding="utf8")
+
+            run_plugins(term, config)
+            run_plugins(term, config)
+            runs = len(__import__("foo").RUNS)
+            cached = get_cache_path().exists()
+
+        self.assertEqual(runs, 2)
+        self.assertFalse(cached)
+
+    def test_shared_cache(self):
+        term = Terminal()
+
+        with (
+            tempgitdir() as tmpdir,
+            tempdir() as shared_dir,
+            temp_python_module(PLUGIN, name="foo"),
+        ):
+            config = AutohooksConfig.from_dict(
+                {
+                    "tool": {
+                        "autohooks": {
+                            "pre-commit": ["foo"],
+                            "cache": {
+                                "plugins": ["foo"],
+                                "shared": str(shared_dir),
+                            },
+                        }
+                    }
+                }
+            )
+            (tmpdir / "foo.txt").write_text("Lorem", encoding="utf8")
+            git_add(tmpdir / "foo.txt")
+
+            run_plugins(term, config)
+            # the results are found in the shared cache on other machines
+            shutil.rmtree(get_cache_path())
+            run_plugins(term, config)
+            runs = len(__import__("foo").RUNS)
+
+        self.assertEqual(runs, 1)
+
+    def test_not_configured_for_caching(self):
+        term = Terminal()
+        config = AutohooksConfig.from_dict(
+            {"tool": {"autohooks": {"pre-commit": ["foo"]}}}
+        )
+
+        with tempgitdir() as tmpdir, temp_python_module(PLUGIN, name="foo"):
+            (tmpdir / "foo.txt").write_text("Lorem", encoding="utf8")
+            git_add(tmpdir / "foo.txt")
+
+            run_plugins(term, config)
+            run_plugins(term, config)
+            runs = len(__import__("foo").RUNS)
+
+        self.assertEqual(runs, 2)
+
+    def test_plugin_inputs(self):
+        term = Terminal()
+        plugin = (
+            "from autohooks.api import register_plugin_inputs\n"
+            "register_plugin_inputs(__name__, '.foorc')\n"
+        ) + PLUGIN
+
+        with (
+            patch.dict("autohooks.precommit.inputs._PLUGIN_INPUTS", clear=True),
+            tempgitdir() as tmpdir,
+            temp_python_module(plugin, name="foo"),
+        ):
+            (tmpdir / "foo.txt").write_text("Lorem", encoding="utf8")
+            git_add(tmpdir / "foo.txt")
+
+            run_plugins(term, self._config())
+            # unrelated settings don't invalidate the results
+            config = AutohooksConfig.from_dict(
+                {
+                    "tool": {
+                        "autohooks": {
+                            "pre-commit": ["foo"],
+                            "cache": {"plugins": ["foo"]},
+                        },
+                        "bar": {"lorem": "ipsum"},
+                    }
+                }
+            )
+            run_plugins(term, config)
+            runs = len(__import__("foo").RUNS)
+
+            # changed inputs invalidate the results
+            (tmpdir / ".foorc").write_text("Lorem", encoding="utf8")
+            run_plugins(term, config)
+            changed_runs = len(__import__("foo").RUNS)
+
+        self.assertEqual(runs, 1)
+        self.assertEqual(changed_runs, 2)
+
+    def test_config_without_plugin_inputs(self):
+        term = Terminal()
+
+        with (
+            patch.dict("autohooks.precommit.inputs._PLUGIN_INPUTS", clear=True),
+            tempgitdir() as tmpdir,
+            temp_python_module(PLUGIN, name="foo"),
+        ):
+            (tmpdir / "foo.txt").write_text("Lorem", encoding="utf8")
+            git_add(tmpdir / "foo.txt")
+
+            run_plugins(term, self._config())
+            config = AutohooksConfig.from_dict(
+                {
+                    "tool": {
+                        "autohooks": {
+                            "pre-commit": ["foo"],
+                            "cache": {"plugins": ["foo"]},
+                        },
+                        "bar": {"lorem": "ipsum"},
+                    }
+                }
+            )
+            run_plugins(term, config)
+            runs = len(__import__("foo").RUNS)
+
+        # the whole config may influence the results of the plugin
+        self.assertEqual(runs, 2)
+
+    def test_metadata_without_inputs(self):
+        term = Terminal()
+        plugin = (
+            "from autohooks.api import PluginMetadata\n"
+            "AUTOHOOKS_METADATA = PluginMetadata(version='1.0')\n"
+        ) + PLUGIN
+
+        with (
+            patch.dict("autohooks.precommit.inputs._PLUGIN_INPUTS", clear=True),
+            tempgitdir() as tmpdir,
+            temp_python_module(plugin, name="foo"),
+        ):
+            (tmpdir / "foo.txt").write_text("Lorem", encoding="utf8")
+            git_add(tmpdir / "foo.txt")
+
+            run_plugins(term, self._config())
+            config = AutohooksConfig.from_dict(
+                {
+                    "tool": {
+                        "autohooks": {
+                            "pre-commit": ["foo"],
+                            "cache": {"plugins": ["foo"]},
+                        },
+                        "pylint": {"lorem": "ipsum"},
+                    }
+                }
+            )
+            run_plugins(term, config)
+            runs = len(__import__("foo").RUNS)
+
+        # the whole config may influence the results of the plugin
+        self.assertEqual(runs, 2)
+
+    def test_mutating_plugin_is_not_cached(self):
+        term = Terminal()
+        plugin = (
+            "from autohooks.api import PluginMetadata\n"
+            "AUTOHOOKS_METADATA = PluginMetadata(mutates_files=True)\n"
+        ) + PLUGIN
+
+        with tempgitdir() as tmpdir, temp_python_module(plugin, name="foo"):
+            (tmpdir / "foo.txt").write_text("Lorem", encoding="utf8")
+            git_add(tmpdir / "foo.txt")
+
+            run_plugins(term, self._config())
+            run_plugins(term, self._config())
+            runs = len(__import__("foo").RUNS)
+
+        self.assertEqual(runs, 2)
+
+    def test_metadata_patterns(self):
+        term = Terminal()
+        plugin = (
+            "from autohooks.api import PluginMetadata\n"
+            "AUTOHOOKS_METADATA = PluginMetadata(patterns=('*.py',))\n"
+        ) + PLUGIN
+
+        with tempgitdir() as tmpdir, temp_python_module(plugin, name="foo"):
+            (tmpdir / "foo.py").write_text("Lorem", encoding="utf8")
+            (tmpdir / "foo.txt").write_text("Lorem", encoding="utf8")
+            git_add(tmpdir / "foo.py", tmpdir / "foo.txt")
+
+            run_plugins(term, self._config())
+            # files not checked by the plugin don't invalidate the results
+            (tmpdir / "foo.txt").write_text("Ipsum", encoding="utf8")
+            git_add(tmpdir / "foo.txt")
+            run_plugins(term, self._config())
+            runs = len(__import__("foo").RUNS)
+
+        self.assertEqual(runs, 1)
+
+    def test_metadata_version(self):
+        term = Terminal()
+        plugin = (
+            "from autohooks.api import PluginMetadata\n"
+            "AUTOHOOKS_METADATA = PluginMetadata(version='1.0')\n"
+        ) + PLUGIN
+
+        with tempgitdir() as tmpdir, temp_python_module(plugin, name="foo"):
+            (tmpdir / "foo.txt").write_text("Lorem", encoding="utf8")
+            git_add(tmpdir / "foo.txt")
+
+            run_plugins(term, self._config())
+            foo = __import__("foo")
+            foo.AUTOHOOKS_METADATA = foo.PluginMetadata(version="2.0")
+            run_plugins(term, self._config())
+            runs = len(foo.RUNS)
+
+        self.assertEqual(runs, 2)
+
+    def test_metadata_inputs(self):
+        term = Terminal()
+        plugin = (
+            "from autohooks.api import PluginMetadata\n"
+            "AUTOHOOKS_METADATA = PluginMetadata(inputs=('.foorc',))\n"
+        ) + PLUGIN
+
+        with tempgitdir() as tmpdir, temp_python_module(plugin, name="foo"):
+            (tmpdir / "foo.txt").write_text("Lorem", encoding="utf8")
+            git_add(tmpdir / "foo.txt")
+
+            run_plugins(term, self._config())
+            run_plugins(term, self._config())
+            runs = len(__import__("foo").RUNS)
+
+            (tmpdir / ".foorc").write_text("Lorem", encoding="utf8")
+            run_plugins(term, self._config())
+            changed_runs = len(__import__("foo").RUNS)
+
+        self.assertEqual(runs, 1)
+        self.assertEqual(changed_runs, 2)
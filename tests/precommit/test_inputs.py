@@ -0,0 +1,126 @@
+# SPDX-FileCopyrightText: 2026 Greenbone AG
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from autohooks.config import AutohooksConfig
+from autohooks.precommit.inputs import (
+    PluginInputs,
+    get_plugin_inputs,
+    get_plugin_inputs_hash,
+    register_plugin_inputs,
+)
+from autohooks.utils import clear_repository_context
+from tests import tempgitdir
+
+
+def _config(**tool) -> AutohooksConfig:
+    return AutohooksConfig.from_dict(
+        {"tool": {"autohooks": {"pre-commit": ["foo"]}, **tool}}
+    )
+
+
+@patch.dict("autohooks.precommit.inputs._PLUGIN_INPUTS", clear=True)
+class RegisterPluginInputsTestCase(unittest.TestCase):
+    def test_not_registered(self):
+        self.assertIsNone(get_plugin_inputs("foo"))
+
+    def test_register(self):
+        register_plugin_inputs("foo", ".foorc", sections=["tool.foo"])
+        register_plugin_inputs("foo", Path("setup.cfg"))
+
+        self.assertEqual(
+            get_plugin_inputs("foo"),
+            PluginInputs(
+                files=(Path(".foorc"), Path("setup.cfg")),
+                sections=("tool.foo",),
+            ),
+        )
+        self.assertIsNone(get_plugin_inputs("bar"))
+
+
+@patch.dict("autohooks.precommit.inputs._PLUGIN_INPUTS", clear=True)
+class GetPluginInputsHashTestCase(unittest.TestCase):
+    def setUp(self):
+        self.addCleanup(clear_repository_context)
+
+    def test_whole_config_without_inputs(self):
+        config = _config()
+
+        self.assertEqual(
+            get_plugin_inputs_hash("foo", config), config.get_config_hash()
+        )
+        self.assertNotEqual(
+            get_plugin_inputs_hash("foo", config),
+            get_plugin_inputs_hash("foo", _config(bar={"lorem": "ipsum"})),
+        )
+
+    def test_plugin_config(self):
+        register_plugin_inputs("foo")
+
+        with tempgitdir():
+            inputs_hash = get_plugin_inputs_hash("foo", _config())
+
+            self.assertEqual(
+                inputs_hash,
+                get_plugin_inputs_hash("foo", _config(bar={"lorem": "ipsum"})),
+            )
+            self.assertNotEqual(
+                inputs_hash,
+                get_plugin_inputs_hash(
+                    "foo",
+                    AutohooksConfig.from_dict(
+                        {
+                            "tool": {
+                                "autohooks": {
+                                    "plugins": {"foo": {"lorem": "ipsum"}}
+                                }
+                            }
+                        }
+                    ),
+                ),
+            )
+
+    def test_sections(self):
+        register_plugin_inputs("autohooks.plugins.foo", sections=["tool.foo"])
+
+        with tempgitdir():
+            inputs_hash = get_plugin_inputs_hash(
+                "autohooks.plugins.foo", _config(foo={"lorem": 1})
+            )
+
+            self.assertEqual(
+                inputs_hash,
+                get_plugin_inputs_hash(
+                    "autohooks.plugins.foo",
+                    _config(foo={"lorem": 1}, bar={"ipsum": 2}),
+                ),
+            )
+            self.assertNotEqual(
+                inputs_hash,
+                get_plugin_inputs_hash(
+                    "autohooks.plugins.foo", _config(foo={"lorem": 2})
+                ),
+            )
+
+    def test_files(self):
+        register_plugin_inputs("foo", ".foorc")
+        config = _config()
+
+        with tempgitdir() as tmpdir:
+            missing_hash = get_plugin_inputs_hash("foo", config)
+
+            (tmpdir / ".foorc").write_text("Lorem", encoding="utf8")
+            inputs_hash = get_plugin_inputs_hash("foo", config)
+            same_hash = get_plugin_inputs_hash("foo", config)
+
+            (tmpdir / ".foorc").write_text("Ipsum!", encoding="utf8")
+            changed_hash = get_plugin_inputs_hash("foo", config)
+
+        self.assertNotEqual(missing_hash, inputs_hash)
+        self.assertEqual(inputs_hash, same_hash)
+        self.assertNotEqual(inputs_hash, changed_hash)
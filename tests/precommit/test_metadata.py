@@ -0,0 +1,53 @@
+# SPDX-FileCopyrightText: 2026 Greenbone AG
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+
+import unittest
+from pathlib import Path
+from types import ModuleType
+
+from autohooks.precommit.metadata import PluginMetadata, get_plugin_metadata
+
+
+class PluginMetadataTestCase(unittest.TestCase):
+    def test_defaults(self):
+        metadata = PluginMetadata()
+
+        self.assertIsNone(metadata.version)
+        self.assertEqual(metadata.patterns, ())
+        self.assertFalse(metadata.mutates_files)
+        self.assertFalse(metadata.parallel_safe)
+        self.assertEqual(metadata.inputs, ())
+
+    def test_matches_all_files(self):
+        metadata = PluginMetadata()
+
+        self.assertTrue(metadata.matches("foo.py"))
+        self.assertTrue(metadata.matches(Path("foo") / "bar.md"))
+
+    def test_matches(self):
+        metadata = PluginMetadata(patterns=("*.py", "*.pyi"))
+
+        self.assertTrue(metadata.matches("foo.py"))
+        self.assertTrue(metadata.matches(Path("foo") / "bar.pyi"))
+        self.assertFalse(metadata.matches("foo.md"))
+
+
+class GetPluginMetadataTestCase(unittest.TestCase):
+    def test_metadata(self):
+        plugin = ModuleType("foo")
+        plugin.AUTOHOOKS_METADATA = PluginMetadata(version="1.0")  # type: ignore[attr-defined]
+
+        self.assertEqual(
+            get_plugin_metadata(plugin), PluginMetadata(version="1.0")
+        )
+
+    def test_no_metadata(self):
+        self.assertIsNone(get_plugin_metadata(ModuleType("foo")))
+
+    def test_invalid_metadata(self):
+        plugin = ModuleType("foo")
+        plugin.AUTOHOOKS_METADATA = {"version": "1.0"}  # type: ignore[attr-defined]
+
+        self.assertIsNone(get_plugin_metadata(plugin))
@@ -0,0 +1,94 @@
+# SPDX-FileCopyrightText: 2026 Greenbone AG
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+
+import unittest
+
+from autohooks.precommit.report import (
+    PluginReport,
+    Report,
+    get_missing_shards,
+    merge_reports,
+)
+from tests import tempdir
+
+
+class ReportTestCase(unittest.TestCase):
+    def test_result(self):
+        report = Report()
+        self.assertEqual(report.result, 0)
+
+        report.add_plugin("foo", 0, 1.0)
+        report.add_plugin("bar", 2, 1.0)
+        report.add_plugin("baz", 3, 1.0)
+
+        self.assertEqual(report.result, 2)
+
+    def test_write_and_read(self):
+        report = Report(shards=[(1, 2)], files=["foo.py"])
+        report.add_plugin("foo", 1, 0.5)
+
+        with tempdir() as tmpdir:
+            path = tmpdir / "report.json"
+            report.write(path)
+
+            self.assertEqual(Report.read(path), report)
+
+    def test_to_dict(self):
+        report = Report(shards=[(1, 2)], files=["foo.py"])
+        report.add_plugin("foo", 1, 0.5)
+
+        self.assertEqual(
+            report.to_dict(),
+            {
+                "version": 1,
+                "result": 1,
+                "shards": [[1, 2]],
+                "files": ["foo.py"],
+                "plugins": [{"name": "foo", "result": 1, "duration": 0.5}],
+            },
+        )
+
+    def test_read_invalid_report(self):
+        with tempdir() as tmpdir:
+            path = tmpdir / "report.json"
+
+            path.write_text("foo", encoding="utf8")
+            with self.assertRaises(ValueError):
+                Report.read(path)
+
+            path.write_text('{"version": 1}', encoding="utf8")
+            with self.assertRaises(ValueError):
+                Report.read(path)
+
+            path.write_text('{"version": 2}', encoding="utf8")
+            with self.assertRaisesRegex(ValueError, "Unsupported"):
+                Report.read(path)
+
+
+class MergeReportsTestCase(unittest.TestCase):
+    def test_merge_reports(self):
+        report1 = Report(shards=[(2, 2)], files=["foo.py", "baz.py"])
+        report1.add_plugin("foo", 0, 1.0)
+        report1.add_plugin("bar", 3, 2.0)
+        report2 = Report(shards=[(1, 2)], files=["bar.py"])
+        report2.add_plugin("foo", 1, 1.5)
+        report2.add_plugin("bar", 2, 0.5)
+
+        merged = merge_reports([report1, report2])
+
+        self.assertEqual(merged.shards, [(1, 2), (2, 2)])
+        self.assertEqual(merged.files, ["bar.py", "baz.py", "foo.py"])
+        self.assertEqual(
+            merged.plugins,
+            [PluginReport("foo", 1, 2.5), PluginReport("bar", 2, 2.5)],
+        )
+        self.assertEqual(merged.result, 1)
+
+    def test_get_missing_shards(self):
+        self.assertEqual(
+            get_missing_shards(Report(shards=[(1, 3), (3, 3)])), [(2, 3)]
+        )
+        self.assertEqual(get_missing_shards(Report(shards=[(1, 1)])), [])
+        self.assertEqual(get_missing_shards(Report()), [])
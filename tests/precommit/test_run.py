@@ -4,14 +4,42 @@
 #
 
 
+import io
+import sys
 import unittest
+from pathlib import Path
+from unittest.mock import MagicMock, patch
 
+from autohooks.config import AutohooksConfig, Config
+from autohooks.hooks import (
+    CommitMsgHook,
+    PostCheckoutHook,
+    PostMergeHook,
+    PrePushHook,
+)
+from autohooks.precommit.report import Report
 from autohooks.precommit.run import (
+    NULL_SHA,
     CheckPluginError,
     CheckPluginWarning,
+    ReportProgress,
+    _can_be_sharded,
     check_plugin,
+    get_push_ranges,
+    get_warm_up_refs,
+    run_hook,
+    run_plugin,
+    run_plugins,
+)
+from autohooks.settings import Mode
+from autohooks.terminal import Terminal
+from autohooks.utils import (
+    clear_repository_context,
+    exec_git,
+    get_repository_context,
 )
-from tests import temp_python_module, tempdir
+from tests import temp_python_module, tempdir, tempgitdir
+from tests.api.git import git_add, git_commit
 
 
 class CheckPluginTestCase(unittest.TestCase):
@@ -63,3 +91,522 @@ class CheckPluginTestCase(unittest.TestCase):
             name="foo",
         ):
             self.assertIsNone(check_plugin("foo"))
+
+    def test_invalid_metadata(self):
+        content = """AUTOHOOKS_METADATA = {"version": "1.0"}
+def precommit(**kwargs):
+  print()"""
+        with temp_python_module(
+            content,
+            name="foo",
+        ):
+            result = check_plugin("foo")
+
+            self.assertIsInstance(result, CheckPluginWarning)
+            self.assertEqual(
+                'Plugin "foo" has invalid metadata. AUTOHOOKS_METADATA must '
+                "be a PluginMetadata instance.",
+                result.message,
+            )
+
+    def test_metadata(self):
+        content = """from autohooks.api import PluginMetadata
+AUTOHOOKS_METADATA = PluginMetadata(version="1.0")
+def precommit(**kwargs):
+  print()"""
+        with temp_python_module(
+            content,
+            name="foo",
+        ):
+            self.assertIsNone(check_plugin("foo"))
+
+
+def rev_parse(ref: str) -> str:
+    return exec_git("rev-parse", ref).strip()
+
+
+def commit_file(name: str, content: str = "") -> str:
+    path = get_repository_context().toplevel_path / name
+    path.write_text(content, encoding="utf8")
+    git_add(path)
+    git_commit()
+    return rev_parse("HEAD")
+
+
+class GetPushRangesTestCase(unittest.TestCase):
+    def setUp(self):
+        self.addCleanup(clear_repository_context)
+
+    def test_update_ref(self):
+        with tempgitdir():
+            remote_sha = commit_file("foo.txt")
+            local_sha = commit_file("bar.txt")
+
+            ranges = get_push_ranges(
+                "origin",
+                [f"refs/heads/main {local_sha} refs/heads/main {remote_sha}\n"],
+            )
+
+            self.assertEqual(ranges, [(remote_sha, local_sha)])
+
+    def test_delete_ref(self):
+        with tempgitdir():
+            remote_sha = commit_file("foo.txt")
+
+            ranges = get_push_ranges(
+                "origin",
+                [f"(delete) {NULL_SHA} refs/heads/main {remote_sha}\n"],
+            )
+
+            self.assertEqual(ranges, [])
+
+    def test_new_ref(self):
+        with tempgitdir():
+            remote_sha = commit_file("foo.txt")
+            exec_git("update-ref", "refs/remotes/origin/main", remote_sha)
+            commit_file("bar.txt")
+            local_sha = commit_file("baz.txt")
+
+            ranges = get_push_ranges(
+                "origin",
+                [
+                    f"refs/heads/feature {local_sha} refs/heads/feature {NULL_SHA}"
+                ],
+            )
+
+            self.assertEqual(ranges, [(remote_sha, local_sha)])
+
+    def test_new_ref_without_new_commits(self):
+        with tempgitdir():
+            remote_sha = commit_file("foo.txt")
+            exec_git("update-ref", "refs/remotes/origin/main", remote_sha)
+
+            ranges = get_push_ranges(
+                "origin",
+                [
+                    f"refs/heads/feature {remote_sha} refs/heads/feature {NULL_SHA}"
+                ],
+            )
+
+            self.assertEqual(ranges, [])
+
+    def test_new_root_commit(self):
+        with tempgitdir():
+            local_sha = commit_file("foo.txt")
+
+            ranges = get_push_ranges(
+                "origin",
+                [f"refs/heads/main {local_sha} refs/heads/main {NULL_SHA}"],
+            )
+
+            self.assertEqual(
+                ranges, [(get_repository_context().empty_tree, local_sha)]
+            )
+
+
+class RunPluginTestCase(unittest.TestCase):
+    def test_fallback_function(self):
+        term = MagicMock(spec=Terminal)
+        report_progress = MagicMock(spec=ReportProgress)
+        content = """
+def precommit(**kwargs):
+    return 2
+"""
+        with temp_python_module(content, name="foo"):
+            plugin = __import__("foo")
+
+            retval = run_plugin(
+                term,
+                "foo",
+                plugin,
+                Config(),
+                report_progress,
+                function_names=("prepush", "precommit"),
+            )
+
+        self.assertEqual(retval, 2)
+
+    def test_kwargs(self):
+        term = MagicMock(spec=Terminal)
+        report_progress = MagicMock(spec=ReportProgress)
+        content = """
+def commitmsg(commit_msg_file, **kwargs):
+    return commit_msg_file
+"""
+        with temp_python_module(content, name="foo"):
+            plugin = __import__("foo")
+
+            retval = run_plugin(
+                term,
+                "foo",
+                plugin,
+                Config(),
+                report_progress,
+                function_names=("commitmsg",),
+                commit_msg_file="bar",
+            )
+
+        self.assertEqual(retval, "bar")
+
+    def test_missing_function(self):
+        term = MagicMock(spec=Terminal)
+        report_progress = MagicMock(spec=ReportProgress)
+        with temp_python_module("", name="foo"):
+            plugin = __import__("foo")
+
+            with self.assertRaises(ValueError):
+                run_plugin(
+                    term,
+                    "foo",
+                    plugin,
+                    Config(),
+                    report_progress,
+                    function_names=("commitmsg",),
+                )
+
+
+class GetWarmUpRefsTestCase(unittest.TestCase):
+    def setUp(self):
+        self.addCleanup(clear_repository_context)
+
+    def test_post_checkout(self):
+        hook = PostCheckoutHook(Path("post-checkout"))
+
+        self.assertEqual(
+            get_warm_up_refs(hook, ["foo", "bar", "1"]), ("foo", "bar")
+        )
+        # files have been checked out
+        self.assertIsNone(get_warm_up_refs(hook, ["foo", "bar", "0"]))
+        self.assertIsNone(get_warm_up_refs(hook, ["foo", "foo", "1"]))
+
+    def test_post_checkout_after_clone(self):
+        with tempgitdir():
+            hook = PostCheckoutHook()
+
+            self.assertEqual(
+                get_warm_up_refs(hook, [NULL_SHA, "bar", "1"]),
+                (get_repository_context().empty_tree, "bar"),
+            )
+
+    def test_post_merge(self):
+        with tempgitdir():
+            hook = PostMergeHook()
+            from_sha = commit_file("foo.txt")
+            to_sha = commit_file("bar.txt")
+            exec_git("update-ref", "ORIG_HEAD", from_sha)
+
+            self.assertEqual(get_warm_up_refs(hook, ["0"]), (from_sha, to_sha))
+
+    def test_post_merge_without_orig_head(self):
+        with tempgitdir():
+            commit_file("foo.txt")
+
+            self.assertIsNone(get_warm_up_refs(PostMergeHook(), ["0"]))
+
+
+PRE_PUSH_PLUGIN = """
+from autohooks.api.git import get_staged_status
+
+FILES = []
+
+def prepush(remote, **kwargs):
+    FILES.extend((remote, str(f.path)) for f in get_staged_status())
+    return 0
+"""
+
+COMMIT_MSG_PLUGIN = """
+def commitmsg(commit_msg_file, **kwargs):
+    return 1 if "WIP" in commit_msg_file.read_text() else 0
+"""
+
+
+class RunHookTestCase(unittest.TestCase):
+    def setUp(self):
+        self.addCleanup(clear_repository_context)
+
+    def test_pre_push(self):
+        with (
+            tempgitdir() as tmpdir,
+            temp_python_module(PRE_PUSH_PLUGIN, name="foo"),
+        ):
+            (tmpdir / "pyproject.toml").write_text(
+                '[tool.autohooks]\nmode = "pythonpath"\npre-push = ["foo"]\n',
+                encoding="utf8",
+            )
+            PrePushHook().write(mode=Mode.PYTHONPATH)
+            remote_sha = commit_file("foo.txt")
+            local_sha = commit_file("bar.txt")
+
+            stdin = io.StringIO(
+                f"refs/heads/main {local_sha} refs/heads/main {remote_sha}\n"
+            )
+            with patch("sys.stdin", stdin):
+                retval = run_hook("pre-push", ["upstream", "url"])
+
+            self.assertEqual(retval, 0)
+            self.assertEqual(
+                sys.modules["foo"].FILES, [("upstream", "bar.txt")]
+            )
+
+    def test_pre_push_precommit_fallback(self):
+        plugin = """
+from autohooks.api.git import get_staged_status, stage_files
+
+FILES = []
+
+def precommit(**kwargs):
+    files = get_staged_status()
+    for f in files:
+        FILES.append((str(f.path), f.absolute_path().read_text()))
+        f.absolute_path().write_text("formatted")
+    stage_files(files)
+    return 0
+"""
+        with (
+            tempgitdir() as tmpdir,
+            temp_python_module(plugin, name="foo"),
+        ):
+            (tmpdir / "pyproject.toml").write_text(
+                '[tool.autohooks]\nmode = "pythonpath"\npre-push = ["foo"]\n',
+                encoding="utf8",
+            )
+            PrePushHook().write(mode=Mode.PYTHONPATH)
+            remote_sha = commit_file("foo.txt")
+            exec_git("checkout", "-q", "-b", "feature")
+            local_sha = commit_file("bar.txt", "feature")
+            exec_git("checkout", "-q", "-")
+
+            # the pushed ref is not checked out
+            stdin = io.StringIO(
+                f"refs/heads/feature {local_sha} refs/heads/feature "
+                f"{remote_sha}\n"
+            )
+            with patch("sys.stdin", stdin):
+                retval = run_hook("pre-push", ["upstream", "url"])
+
+            self.assertEqual(retval, 0)
+            self.assertEqual(sys.modules["foo"].FILES, [("bar.txt", "feature")])
+            # the working tree and the index are untouched
+            self.assertFalse((tmpdir / "bar.txt").exists())
+            self.assertEqual(
+                exec_git("status", "--porcelain", "--untracked-files=no"), ""
+            )
+            self.assertEqual(len(exec_git("worktree", "list").splitlines()), 1)
+            self.assertEqual(Path.cwd().resolve(), tmpdir.resolve())
+
+    def test_invalid_settings(self):
+        with (
+            tempgitdir() as tmpdir,
+            temp_python_module(COMMIT_MSG_PLUGIN, name="foo"),
+            patch("autohooks.terminal.Terminal.warning") as warning_mock,
+        ):
+            (tmpdir / "pyproject.toml").write_text(
+                '[tool.autohooks]\nmode = "pythonpath"\ncommit-msg = ["foo"]\n'
+                '[tool.autohooks.cache]\nmax-size = "lots"\n',
+                encoding="utf8",
+            )
+            CommitMsgHook().write(mode=Mode.PYTHONPATH)
+            message_file = tmpdir / "COMMIT_EDITMSG"
+            message_file.write_text("Add foo", encoding="utf8")
+
+            retval = run_hook("commit-msg", [str(message_file)])
+
+        self.assertEqual(retval, 0)
+        warning_mock.assert_called_once_with(
+            'Ignoring invalid "max-size" setting in [tool.autohooks.cache]. '
+            "Invalid size 'lots'. Expected e.g. 500MB."
+        )
+
+    def test_commit_msg(self):
+        with (
+            tempgitdir() as tmpdir,
+            temp_python_module(COMMIT_MSG_PLUGIN, name="foo"),
+        ):
+            (tmpdir / "pyproject.toml").write_text(
+                '[tool.autohooks]\nmode = "pythonpath"\ncommit-msg = ["foo"]\n',
+                encoding="utf8",
+            )
+            CommitMsgHook().write(mode=Mode.PYTHONPATH)
+            message_file = tmpdir / "COMMIT_EDITMSG"
+
+            message_file.write_text("Add foo", encoding="utf8")
+            self.assertEqual(run_hook("commit-msg", [str(message_file)]), 0)
+
+            message_file.write_text("WIP", encoding="utf8")
+            self.assertEqual(run_hook("commit-msg", [str(message_file)]), 1)
+
+    @patch("autohooks.precommit.run.start_warm_up")
+    def test_post_checkout(self, start_warm_up_mock: MagicMock):
+        with tempgitdir() as tmpdir:
+            (tmpdir / "pyproject.toml").write_text(
+                '[tool.autohooks]\nmode = "pythonpath"\npre-commit = ["foo"]\n'
+                '[tool.autohooks.cache]\nplugins = ["foo"]\nwarm = true\n',
+                encoding="utf8",
+            )
+            PostCheckoutHook().write(mode=Mode.PYTHONPATH)
+
+            retval = run_hook("post-checkout", ["foo", "bar", "1"])
+
+        self.assertEqual(retval, 0)
+        start_warm_up_mock.assert_called_once_with("foo", "bar")
+
+    @patch("autohooks.precommit.run.start_warm_up")
+    def test_post_checkout_without_warm_up(self, start_warm_up_mock: MagicMock):
+        with tempgitdir() as tmpdir:
+            (tmpdir / "pyproject.toml").write_text(
+                '[tool.autohooks]\nmode = "pythonpath"\npre-commit = ["foo"]\n'
+                '[tool.autohooks.cache]\nplugins = ["foo"]\n',
+                encoding="utf8",
+            )
+            PostCheckoutHook().write(mode=Mode.PYTHONPATH)
+
+            retval = run_hook("post-checkout", ["foo", "bar", "1"])
+
+        self.assertEqual(retval, 0)
+        start_warm_up_mock.assert_not_called()
+
+
+METADATA_PLUGIN = """
+from autohooks.api import PluginMetadata
+
+AUTOHOOKS_METADATA = PluginMetadata({metadata})
+RUNS = []
+
+def precommit(**kwargs):
+    RUNS.append(1)
+    return 0
+"""
+
+
+def _metadata_plugin(metadata: str) -> str:
+    return METADATA_PLUGIN.replace("{metadata}", metadata)
+
+
+class RunPluginsMetadataTestCase(unittest.TestCase):
+    def setUp(self):
+        self.addCleanup(clear_repository_context)
+
+    def _config(self, **settings) -> AutohooksConfig:
+        return AutohooksConfig.from_dict(
+            {"tool": {"autohooks": {"pre-commit": ["foo"], **settings}}}
+        )
+
+    def test_skip_plugin_without_matching_files(self):
+        term = Terminal()
+        report = Report()
+        plugin = _metadata_plugin("patterns=('*.py',)")
+
+        with tempgitdir() as tmpdir, temp_python_module(plugin, name="foo"):
+            (tmpdir / "foo.md").write_text("Lorem", encoding="utf8")
+            git_add(tmpdir / "foo.md")
+
+            retval = run_plugins(term, self._config(), report=report)
+            runs = len(__import__("foo").RUNS)
+
+        self.assertEqual(retval, 0)
+        self.assertEqual(runs, 0)
+        self.assertEqual([plugin.name for plugin in report.plugins], ["foo"])
+
+    def test_run_plugin_with_matching_files(self):
+        term = Terminal()
+        plugin = _metadata_plugin("patterns=('*.py',)")
+
+        with tempgitdir() as tmpdir, temp_python_module(plugin, name="foo"):
+            (tmpdir / "foo.md").write_text("Lorem", encoding="utf8")
+            (tmpdir / "foo.py").write_text("Lorem", encoding="utf8")
+            git_add(tmpdir / "foo.md", tmpdir / "foo.py")
+
+            run_plugins(term, self._config())
+            runs = len(__import__("foo").RUNS)
+
+        self.assertEqual(runs, 1)
+
+    def test_run_mutating_plugins_first(self):
+        term = Terminal()
+        config = AutohooksConfig.from_dict(
+            {
+                "tool": {
+                    "autohooks": {"pre-commit": ["foo", "bar"], "workers": 2}
+                }
+            }
+        )
+
+        with (
+            tempgitdir() as tmpdir,
+            temp_python_module(
+                _metadata_plugin("parallel_safe=True"), name="foo"
+            ),
+            temp_python_module(
+                _metadata_plugin("mutates_files=True"), name="bar"
+            ),
+        ):
+            (tmpdir / "foo.py").write_text("Lorem", encoding="utf8")
+            git_add(tmpdir / "foo.py")
+
+            retval = run_plugins(term, config)
+            # only the plugin running in this process is recorded here
+            foo_runs = len(__import__("foo").RUNS)
+            bar_runs = len(__import__("bar").RUNS)
+
+        self.assertEqual(retval, 0)
+        self.assertEqual(foo_runs, 0)
+        self.assertEqual(bar_runs, 1)
+
+    def test_run_plugins_not_parallel_safe_on_their_own(self):
+        term = Terminal()
+        config = AutohooksConfig.from_dict(
+            {
+                "tool": {
+                    "autohooks": {
+                        "pre-commit": ["foo", "bar", "baz"],
+                        "workers": 2,
+                    }
+                }
+            }
+        )
+
+        with (
+            tempgitdir() as tmpdir,
+            temp_python_module(
+                _metadata_plugin("parallel_safe=True"), name="foo"
+            ),
+            temp_python_module(_metadata_plugin(""), name="bar"),
+            temp_python_module(
+                "RUNS = []\n"
+                "def precommit(**kwargs):\n"
+                "    RUNS.append(1)\n"
+                "    return 0\n",
+                name="baz",
+            ),
+        ):
+            (tmpdir / "foo.py").write_text("Lorem", encoding="utf8")
+            git_add(tmpdir / "foo.py")
+
+            retval = run_plugins(term, config)
+            # only the plugins running in this process are recorded here
+            foo_runs = len(__import__("foo").RUNS)
+            bar_runs = len(__import__("bar").RUNS)
+            baz_runs = len(__import__("baz").RUNS)
+
+        self.assertEqual(retval, 0)
+        self.assertEqual(foo_runs, 0)
+        self.assertEqual(bar_runs, 1)
+        # plugins without metadata may change files
+        self.assertEqual(baz_runs, 1)
+
+    def test_can_be_sharded(self):
+        config = self._config(**{"shard-plugins": ["foo"]})
+
+        with temp_python_module(
+            _metadata_plugin("parallel_safe=True"), name="bar"
+        ):
+            self.assertTrue(_can_be_sharded(config, "bar"))
+            self.assertFalse(_can_be_sharded(self._config(), "foo"))
+
+        with temp_python_module(
+            _metadata_plugin("mutates_files=True"), name="foo"
+        ):
+            self.assertFalse(_can_be_sharded(config, "foo"))
+
+        with temp_python_module(_metadata_plugin(""), name="foo"):
+            self.assertTrue(_can_be_sharded(config, "foo"))
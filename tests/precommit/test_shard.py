@@ -0,0 +1,120 @@
+# SPDX-FileCopyrightText: 2026 Greenbone AG
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+
+import unittest
+from pathlib import Path
+
+from autohooks.api.git import StatusEntry
+from autohooks.precommit.shard import (
+    distribute_duration,
+    get_shard_count,
+    get_shard_number,
+    shard_by_hash,
+    shard_by_size,
+)
+from tests import tempdir
+
+
+class GetShardCountTestCase(unittest.TestCase):
+    def test_shard_count(self):
+        self.assertEqual(get_shard_count(100, 4), 4)
+        self.assertEqual(get_shard_count(25, 4), 2)
+        self.assertEqual(get_shard_count(5, 4), 1)
+        self.assertEqual(get_shard_count(0, 4), 1)
+        self.assertEqual(get_shard_count(100, 0), 1)
+
+
+class ShardBySizeTestCase(unittest.TestCase):
+    def test_shard_by_size(self):
+        with tempdir() as tmpdir:
+            entries = []
+            for name, size in (
+                ("a", 10),
+                ("b", 60),
+                ("c", 20),
+                ("d", 30),
+                ("e", 40),
+            ):
+                (tmpdir / name).write_text("x" * size, encoding="utf8")
+                entries.append(StatusEntry(f"A  {name}", tmpdir))
+
+            shards = shard_by_size(entries, 2)
+
+            self.assertEqual(
+                [[str(entry.path) for entry in shard] for shard in shards],
+                [["b", "c"], ["a", "d", "e"]],
+            )
+
+    def test_shard_by_durations(self):
+        with tempdir() as tmpdir:
+            entries = []
+            for name in ("a", "b", "c", "d"):
+                (tmpdir / name).write_text("x" * 10, encoding="utf8")
+                entries.append(StatusEntry(f"A  {name}", tmpdir))
+
+            # checking a takes as long as all other files. the duration of d
+            # is estimated from its size and the durations of b and c.
+            shards = shard_by_size(
+                entries, 2, durations={"a": 4.0, "b": 1.0, "c": 1.0}
+            )
+
+            self.assertEqual(
+                [[str(entry.path) for entry in shard] for shard in shards],
+                [["a"], ["b", "c", "d"]],
+            )
+
+    def test_distribute_duration(self):
+        with tempdir() as tmpdir:
+            entries = []
+            for name, size in (("a", 0), ("b", 2)):
+                (tmpdir / name).write_text("x" * size, encoding="utf8")
+                entries.append(StatusEntry(f"A  {name}", tmpdir))
+
+            durations = distribute_duration(entries, 4.0)
+
+        self.assertEqual(durations, {"a": 1.0, "b": 3.0})
+
+    def test_missing_files(self):
+        entries = [
+            StatusEntry(f"A  {name}", Path("/does/not/exist"))
+            for name in ("a", "b", "c")
+        ]
+
+        shards = shard_by_size(entries, 2)
+
+        self.assertEqual(sorted(len(shard) for shard in shards), [1, 2])
+        self.assertCountEqual(
+            [entry for shard in shards for entry in shard], entries
+        )
+
+    def test_more_shards_than_entries(self):
+        entries = [StatusEntry("A  a", Path("/does/not/exist"))]
+
+        shards = shard_by_size(entries, 3)
+
+        self.assertEqual(len(shards), 3)
+        self.assertEqual(sum(len(shard) for shard in shards), 1)
+
+
+class ShardByHashTestCase(unittest.TestCase):
+    def test_get_shard_number(self):
+        # the shards must not change between versions and platforms
+        self.assertEqual(get_shard_number("foo.py", 4), 2)
+        self.assertEqual(get_shard_number("bar.py", 4), 1)
+        self.assertEqual(get_shard_number("foo.py", 1), 1)
+
+    def test_shard_by_hash(self):
+        entries = [
+            StatusEntry(f"A  dir/file{index}.py", Path("/does/not/exist"))
+            for index in range(100)
+        ]
+
+        shards = [shard_by_hash(entries, number, 3) for number in (1, 2, 3)]
+
+        self.assertTrue(all(shards))
+        self.assertCountEqual(
+            [entry for shard in shards for entry in shard], entries
+        )
+        self.assertEqual(shard_by_hash(entries, 2, 3), shards[1])
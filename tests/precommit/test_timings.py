@@ -0,0 +1,74 @@
+# SPDX-FileCopyrightText: 2026 Greenbone AG
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+
+import unittest
+
+from autohooks.precommit.timings import TimingStore, get_timings_path
+from autohooks.utils import clear_repository_context
+from tests import tempdir, tempgitdir
+
+
+class TimingStoreTestCase(unittest.TestCase):
+    def test_plugin_durations(self):
+        with tempdir() as tmpdir, TimingStore(tmpdir / "timings") as store:
+            self.assertEqual(store.get_plugin_durations(["foo"]), {})
+
+            store.add_plugin_durations({"foo": 1.0, "bar": 2.0})
+
+            self.assertEqual(
+                store.get_plugin_durations(["foo", "bar", "baz"]),
+                {"foo": 1.0, "bar": 2.0},
+            )
+
+    def test_smoothing(self):
+        with tempdir() as tmpdir, TimingStore(tmpdir / "timings") as store:
+            store.add_plugin_durations({"foo": 1.0})
+            store.add_plugin_durations({"foo": 3.0})
+
+            self.assertEqual(store.get_plugin_durations(["foo"]), {"foo": 2.0})
+
+    def test_file_durations(self):
+        paths = [f"dir/file{index}.py" for index in range(2000)]
+
+        with tempdir() as tmpdir:
+            with TimingStore(tmpdir / "timings") as store:
+                store.add_file_durations(dict.fromkeys(paths, 0.5))
+
+            # the durations are persisted
+            with TimingStore(tmpdir / "timings") as store:
+                durations = store.get_file_durations(paths)
+                self.assertEqual(store.get_plugin_durations(paths), {})
+
+        self.assertEqual(durations, dict.fromkeys(paths, 0.5))
+
+    def test_default_path(self):
+        self.addCleanup(clear_repository_context)
+
+        with tempgitdir() as tmpdir:
+            with TimingStore() as store:
+                store.add_plugin_durations({"foo": 1.0})
+
+            self.assertEqual(
+                get_timings_path(),
+                tmpdir / ".git" / "autohooks" / "timings.sqlite",
+            )
+            self.assertTrue(get_timings_path().exists())
+
+    def test_inaccessible_store(self):
+        with tempdir() as tmpdir:
+            path = tmpdir / "file"
+            path.touch()
+
+            # the parent of the database is a file
+            with TimingStore(path / "timings") as store:
+                store.add_plugin_durations({"foo": 1.0})
+                self.assertEqual(store.get_plugin_durations(["foo"]), {})
+
+    def test_outside_of_git_repository(self):
+        self.addCleanup(clear_repository_context)
+
+        with tempdir(change_into=True), TimingStore() as store:
+            store.add_plugin_durations({"foo": 1.0})
+            self.assertEqual(store.get_plugin_durations(["foo"]), {})
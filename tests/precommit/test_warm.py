@@ -0,0 +1,160 @@
+# SPDX-FileCopyrightText: 2026 Greenbone AG
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+
+import subprocess
+import sys
+import unittest
+from unittest.mock import MagicMock, patch
+
+from autohooks.config import AutohooksConfig
+from autohooks.precommit.run import run_plugins
+from autohooks.precommit.warm import (
+    get_warm_up_command,
+    get_warm_up_log_path,
+    start_warm_up,
+    warm_up,
+)
+from autohooks.terminal import Terminal
+from autohooks.utils import (
+    clear_repository_context,
+    exec_git,
+    get_repository_context,
+)
+from tests import temp_python_module, tempgitdir
+from tests.api.git import git_add, git_commit
+
+PLUGIN = """
+from autohooks.api.git import get_staged_status
+
+FILES = []
+
+def precommit(**kwargs):
+    FILES.append(sorted(str(f.path) for f in get_staged_status()))
+    return 0
+"""
+
+
+def warm_config(*, shard: bool = True) -> AutohooksConfig:
+    return AutohooksConfig.from_dict(
+        {
+            "tool": {
+                "autohooks": {
+                    "pre-commit": ["foo", "bar"],
+                    "shard-plugins": ["foo"] if shard else [],
+                    "cache": {"plugins": ["foo"], "warm": True},
+                }
+            }
+        }
+    )
+
+
+class GetWarmUpCommandTestCase(unittest.TestCase):
+    @patch("autohooks.precommit.warm.shutil.which")
+    def test_low_priority(self, which_mock: MagicMock):
+        which_mock.return_value = "/usr/bin/tool"
+
+        command = get_warm_up_command("foo", "bar")
+
+        self.assertEqual(
+            command,
+            [
+                "nice",
+                "-n",
+                "19",
+                "ionice",
+                "-c",
+                "3",
+                sys.executable,
+                "-m",
+                "autohooks.precommit.warm",
+                "foo",
+                "bar",
+            ],
+        )
+
+    @patch("autohooks.precommit.warm.shutil.which")
+    def test_without_nice(self, which_mock: MagicMock):
+        which_mock.return_value = None
+
+        command = get_warm_up_command("foo", "bar")
+
+        self.assertEqual(
+            command,
+            [sys.executable, "-m", "autohooks.precommit.warm", "foo", "bar"],
+        )
+
+
+class StartWarmUpTestCase(unittest.TestCase):
+    def setUp(self):
+        self.addCleanup(clear_repository_context)
+
+    def test_start_warm_up(self):
+        with tempgitdir() as tmpdir:
+            # determine the git paths before patching subprocess
+            get_repository_context().toplevel_path  # noqa: B018
+
+            with patch("subprocess.Popen") as popen_mock:
+                start_warm_up("foo", "bar")
+
+            self.assertTrue(get_warm_up_log_path().exists())
+
+        popen_mock.assert_called_once()
+        kwargs = popen_mock.call_args.kwargs
+        self.assertEqual(kwargs["cwd"], tmpdir)
+        self.assertEqual(kwargs["stdin"], subprocess.DEVNULL)
+        if sys.platform != "win32":
+            self.assertTrue(kwargs["start_new_session"])
+
+
+class WarmUpTestCase(unittest.TestCase):
+    def setUp(self):
+        self.addCleanup(clear_repository_context)
+
+    def test_warm_up(self):
+        term = Terminal()
+
+        with (
+            tempgitdir() as tmpdir,
+            temp_python_module(PLUGIN, name="foo"),
+            temp_python_module(PLUGIN, name="bar"),
+        ):
+            (tmpdir / "foo.txt").write_text("Lorem", encoding="utf8")
+            git_add(tmpdir / "foo.txt")
+            git_commit()
+            from_ref = exec_git("rev-parse", "HEAD").strip()
+
+            for name in ("bar.txt", "baz.txt"):
+                (tmpdir / name).write_text("Lorem", encoding="utf8")
+                git_add(tmpdir / name)
+            git_commit()
+            to_ref = exec_git("rev-parse", "HEAD").strip()
+
+            self.assertEqual(warm_up(term, warm_config(), from_ref, to_ref), 0)
+            warmed = list(sys.modules["foo"].FILES)
+            not_warmed = list(__import__("bar").FILES)
+
+            # the results of the single files are reused for other sets of
+            # files
+            (tmpdir / "bar.txt").write_text("Ipsum", encoding="utf8")
+            exec_git("reset", "-q", "HEAD~1")
+            git_add(tmpdir / "baz.txt")
+            run_plugins(term, warm_config())
+            committed = list(sys.modules["foo"].FILES)
+
+        self.assertEqual(warmed, [["bar.txt", "baz.txt"]])
+        self.assertEqual(not_warmed, [])
+        self.assertEqual(committed, warmed)
+
+    def test_warm_up_without_changes(self):
+        term = MagicMock(spec=Terminal)
+
+        with tempgitdir() as tmpdir:
+            (tmpdir / "foo.txt").write_text("Lorem", encoding="utf8")
+            git_add(tmpdir / "foo.txt")
+            git_commit()
+
+            self.assertEqual(warm_up(term, warm_config(), "HEAD", "HEAD"), 0)
+
+        term.bold_info.assert_not_called()
@@ -0,0 +1,149 @@
+# SPDX-FileCopyrightText: 2026 Greenbone AG
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+
+import sys
+import unittest
+
+from autohooks.config import AutohooksConfig
+from autohooks.precommit.run import run_plugins
+from autohooks.precommit.watch import (
+    InotifyWatcher,
+    PollingWatcher,
+    Watcher,
+    get_watcher,
+    watch,
+)
+from autohooks.terminal import Terminal
+from autohooks.utils import clear_repository_context
+from tests import temp_python_module, tempdir, tempgitdir
+from tests.api.git import git_add, git_commit
+
+PLUGIN = """
+from autohooks.api.git import get_staged_status
+
+FILES = []
+
+def precommit(**kwargs):
+    FILES.append(sorted(str(f.path) for f in get_staged_status()))
+    return 0
+"""
+
+
+class WatcherTestCase(unittest.TestCase):
+    def test_abstract(self):
+        with tempdir() as tmpdir, self.assertRaises(TypeError):
+            Watcher(tmpdir)  # type: ignore[abstract]
+
+
+class PollingWatcherTestCase(unittest.TestCase):
+    def test_detect_changes(self):
+        with tempdir() as tmpdir:
+            (tmpdir / "foo.txt").write_text("Lorem", encoding="utf8")
+            (tmpdir / ".git").mkdir()
+
+            with PollingWatcher(tmpdir, interval=0.01) as watcher:
+                self.assertEqual(watcher.wait(0.05), set())
+
+                (tmpdir / "foo.txt").write_text("Lorem Ipsum", encoding="utf8")
+                (tmpdir / "bar.txt").write_text("Lorem", encoding="utf8")
+                (tmpdir / ".git" / "index").write_text("", encoding="utf8")
+
+                self.assertEqual(
+                    watcher.wait(1.0), {tmpdir / "foo.txt", tmpdir / "bar.txt"}
+                )
+
+                (tmpdir / "bar.txt").unlink()
+
+                self.assertEqual(watcher.wait(1.0), {tmpdir / "bar.txt"})
+
+
+@unittest.skipUnless(sys.platform.startswith("linux"), "requires inotify")
+class InotifyWatcherTestCase(unittest.TestCase):
+    def test_detect_changes(self):
+        with tempdir() as tmpdir:
+            (tmpdir / ".git").mkdir()
+
+            with InotifyWatcher(tmpdir) as watcher:
+                self.assertEqual(watcher.wait(0.01), set())
+
+                (tmpdir / "foo.txt").write_text("Lorem", encoding="utf8")
+                (tmpdir / ".git" / "index").write_text("", encoding="utf8")
+
+                self.assertEqual(watcher.wait(1.0), {tmpdir / "foo.txt"})
+
+    def test_watch_new_directories(self):
+        with tempdir() as tmpdir, InotifyWatcher(tmpdir) as watcher:
+            (tmpdir / "sub").mkdir()
+
+            self.assertEqual(watcher.wait(1.0), {tmpdir / "sub"})
+
+            (tmpdir / "sub" / "foo.txt").write_text("Lorem", encoding="utf8")
+
+            self.assertEqual(watcher.wait(1.0), {tmpdir / "sub" / "foo.txt"})
+
+    def test_get_watcher(self):
+        with tempdir() as tmpdir:
+            with get_watcher(tmpdir) as watcher:
+                self.assertIsInstance(watcher, InotifyWatcher)
+
+            with get_watcher(tmpdir, polling=True) as watcher:
+                self.assertIsInstance(watcher, PollingWatcher)
+
+
+class ChangeWatcher(Watcher):
+    """
+    A watcher which changes a file on the first wait
+    """
+
+    def __init__(self, path, changes):
+        super().__init__(path)
+        self.changes = list(changes)
+
+    def wait(self, timeout=None):
+        if timeout is not None or not self.changes:
+            return set()
+
+        path, content = self.changes.pop(0)
+        path.write_text(content, encoding="utf8")
+        return {path}
+
+
+class WatchTestCase(unittest.TestCase):
+    def setUp(self):
+        self.addCleanup(clear_repository_context)
+
+    def test_watch(self):
+        term = Terminal()
+        config = AutohooksConfig.from_dict(
+            {
+                "tool": {
+                    "autohooks": {
+                        "pre-commit": ["foo"],
+                        "cache": {"plugins": ["foo"]},
+                    }
+                }
+            }
+        )
+
+        with tempgitdir() as tmpdir, temp_python_module(PLUGIN, name="foo"):
+            (tmpdir / "foo.txt").write_text("Lorem", encoding="utf8")
+            git_add(tmpdir / "foo.txt")
+            git_commit()
+
+            (tmpdir / "bar.txt").write_text("Lorem", encoding="utf8")
+            watcher = ChangeWatcher(tmpdir, [(tmpdir / "foo.txt", "Ipsum")])
+
+            watch(term, config, watcher, debounce=0.0, max_runs=2)
+
+            plugin = __import__("foo")
+            watched = list(plugin.FILES)
+
+            # the results have been cached for the commit
+            git_add(tmpdir / "foo.txt", tmpdir / "bar.txt")
+            run_plugins(term, config)
+            committed = list(plugin.FILES)
+
+        self.assertEqual(watched, [["bar.txt"], ["bar.txt", "foo.txt"]])
+        self.assertEqual(committed, watched)
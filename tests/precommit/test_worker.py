@@ -0,0 +1,88 @@
+# SPDX-FileCopyrightText: 2026 Greenbone AG
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+
+import os
+import sys
+import unittest
+
+from autohooks.precommit.worker import (
+    QueueProgress,
+    QueueTerminal,
+    WorkerPool,
+    is_worker_pool_supported,
+    send_message,
+)
+
+
+def _send_pid(name: str) -> None:
+    send_message(name, "result", os.getpid())
+
+
+def _use_terminal_and_progress(name: str) -> None:
+    term = QueueTerminal(name)
+    progress = QueueProgress(name)
+
+    progress.update(0, total=2)
+    term.info("foo", "bar")
+    progress.advance(0, 2)
+    term.ok("baz")
+
+    send_message(name, "result", 0)
+
+
+def _change_sys_path(name: str) -> None:
+    sys.path.append("foo")
+    send_message(name, "result", sys.path.count("foo"))
+
+
+def _crash(name: str) -> None:
+    os._exit(1)
+
+
+@unittest.skipUnless(is_worker_pool_supported(), "fork is not supported")
+class WorkerPoolTestCase(unittest.TestCase):
+    def test_run_in_worker_process(self):
+        with WorkerPool(2) as pool:
+            futures = [pool.submit(_send_pid, name) for name in ("foo", "bar")]
+            messages = list(pool.messages(futures))
+
+        self.assertEqual(len(messages), 2)
+        self.assertEqual({m[0] for m in messages}, {"foo", "bar"})
+        for _, kind, pid in messages:
+            self.assertEqual(kind, "result")
+            self.assertNotEqual(pid, os.getpid())
+
+    def test_isolate_tasks(self):
+        with WorkerPool(1) as pool:
+            futures = [
+                pool.submit(_change_sys_path, name) for name in ("foo", "bar")
+            ]
+            messages = list(pool.messages(futures))
+
+        # the change of the first task doesn't leak into the second one
+        self.assertEqual(messages, [("foo", "result", 1), ("bar", "result", 1)])
+
+    def test_forward_terminal_and_progress(self):
+        with WorkerPool(1) as pool:
+            future = pool.submit(_use_terminal_and_progress, "foo")
+            messages = list(pool.messages([future]))
+
+        self.assertEqual(
+            messages,
+            [
+                ("foo", "total", 2),
+                ("foo", "terminal", "info", "foo bar"),
+                ("foo", "advance", 2),
+                ("foo", "terminal", "ok", "baz"),
+                ("foo", "result", 0),
+            ],
+        )
+
+    def test_crashed_worker(self):
+        with WorkerPool(1) as pool:
+            future = pool.submit(_crash, "foo")
+            messages = list(pool.messages([future]))
+
+        self.assertEqual(messages, [])
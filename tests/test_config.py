@@ -11,6 +11,8 @@ from autohooks.config import (
     Config,
     Mode,
     load_config_from_pyproject_toml,
+    parse_duration,
+    parse_size,
 )
 
 
@@ -221,6 +223,238 @@ class AutohooksConfigTestCase(unittest.TestCase):
             "bar",
         )
 
+    def test_get_script_names(self):
+        config = AutohooksConfig.from_dict(
+            {
+                "tool": {
+                    "autohooks": {
+                        "pre-commit": ["foo"],
+                        "pre-push": ["bar", "baz"],
+                        "commit-msg": ["lorem"],
+                    }
+                }
+            }
+        )
+
+        self.assertEqual(config.get_script_names("pre-commit"), ["foo"])
+        self.assertEqual(config.get_script_names("pre-push"), ["bar", "baz"])
+        self.assertEqual(config.get_script_names("commit-msg"), ["lorem"])
+        self.assertEqual(config.get_script_names("post-merge"), [])
+        self.assertEqual(AutohooksConfig().get_script_names("pre-push"), [])
+
+    def test_get_script_names_for_warming_up(self):
+        config = AutohooksConfig.from_dict(
+            {
+                "tool": {
+                    "autohooks": {
+                        "pre-commit": ["foo", "bar"],
+                        "cache": {"plugins": ["bar", "baz"], "warm": True},
+                    }
+                }
+            }
+        )
+
+        self.assertEqual(config.get_script_names("post-checkout"), ["bar"])
+        self.assertEqual(config.get_script_names("post-merge"), ["bar"])
+
+        config.settings.warm_cache = False  # type: ignore[union-attr]
+
+        self.assertEqual(config.get_script_names("post-checkout"), [])
+
+    def test_fsmonitor(self):
+        config = AutohooksConfig.from_dict(
+            {"tool": {"autohooks": {"fsmonitor": True}}}
+        )
+
+        self.assertTrue(config.has_fsmonitor_enabled())
+
+    def test_fsmonitor_disabled_by_default(self):
+        config = AutohooksConfig.from_dict(
+            {"tool": {"autohooks": {"mode": "poetry"}}}
+        )
+
+        self.assertFalse(config.has_fsmonitor_enabled())
+        self.assertFalse(AutohooksConfig().has_fsmonitor_enabled())
+
+    def test_get_shard_plugin_names(self):
+        config = AutohooksConfig.from_dict(
+            {"tool": {"autohooks": {"shard-plugins": ["foo", "bar"]}}}
+        )
+
+        self.assertEqual(config.get_shard_plugin_names(), ["foo", "bar"])
+        self.assertEqual(AutohooksConfig().get_shard_plugin_names(), [])
+
+    def test_get_cache_plugin_names(self):
+        config = AutohooksConfig.from_dict(
+            {"tool": {"autohooks": {"cache": {"plugins": ["foo", "bar"]}}}}
+        )
+
+        self.assertEqual(config.get_cache_plugin_names(), ["foo", "bar"])
+        self.assertEqual(AutohooksConfig().get_cache_plugin_names(), [])
+
+    def test_cache_limits(self):
+        config = AutohooksConfig.from_dict(
+            {
+                "tool": {
+                    "autohooks": {
+                        "cache": {"max-size": "500 MiB", "max-age": "30d"}
+                    }
+                }
+            }
+        )
+
+        self.assertEqual(config.get_cache_max_size(), 500 * 1024 * 1024)
+        self.assertEqual(config.get_cache_max_age(), 30 * 86400)
+        self.assertIsNone(AutohooksConfig().get_cache_max_size())
+        self.assertIsNone(AutohooksConfig().get_cache_max_age())
+
+    def test_invalid_cache_limits(self):
+        config = AutohooksConfig.from_dict(
+            {
+                "tool": {
+                    "autohooks": {"cache": {"max-size": "lots", "max-age": 1.5}}
+                }
+            }
+        )
+
+        self.assertIsNone(config.get_cache_max_size())
+        self.assertIsNone(config.get_cache_max_age())
+        self.assertEqual(
+            config.get_invalid_settings(),
+            [
+                (
+                    'Ignoring invalid "max-size" setting in '
+                    "[tool.autohooks.cache]. Invalid size 'lots'. "
+                    "Expected e.g. 500MB."
+                ),
+                (
+                    'Ignoring invalid "max-age" setting in '
+                    "[tool.autohooks.cache]. Invalid duration 1.5. "
+                    "Expected e.g. 30d."
+                ),
+            ],
+        )
+
+    def test_workers(self):
+        config = AutohooksConfig.from_dict(
+            {"tool": {"autohooks": {"workers": "4"}}}
+        )
+
+        self.assertEqual(config.get_workers(), 4)
+        self.assertEqual(config.get_invalid_settings(), [])
+
+    def test_invalid_workers(self):
+        for value in ("auto", -1, [2]):
+            config = AutohooksConfig.from_dict(
+                {"tool": {"autohooks": {"workers": value}}}
+            )
+
+            self.assertEqual(config.get_workers(), 0)
+            self.assertEqual(
+                config.get_invalid_settings(),
+                [
+                    (
+                        'Ignoring invalid "workers" setting in '
+                        "[tool.autohooks]. Invalid number of workers "
+                        f"{value!r}. Expected e.g. 4."
+                    )
+                ],
+            )
+
+    def test_get_shared_cache_location(self):
+        config = AutohooksConfig.from_dict(
+            {"tool": {"autohooks": {"cache": {"shared": "/mnt/cache"}}}}
+        )
+
+        self.assertEqual(config.get_shared_cache_location(), "/mnt/cache")
+        self.assertIsNone(AutohooksConfig().get_shared_cache_location())
+
+    def test_get_plugin_config(self):
+        config = AutohooksConfig.from_dict(
+            {"tool": {"autohooks": {"plugins": {"foo": {"lorem": "ipsum"}}}}}
+        )
+
+        self.assertEqual(
+            config.get_plugin_config("foo").get_value("lorem"), "ipsum"
+        )
+        self.assertEqual(
+            config.get_plugin_config("autohooks.plugins.foo").get_value(
+                "lorem"
+            ),
+            "ipsum",
+        )
+        self.assertTrue(config.get_plugin_config("bar").is_empty())
+
+    def test_get_plugin_config_of_package(self):
+        config = AutohooksConfig.from_dict(
+            {"tool": {"autohooks": {"plugins": {"ruff": {"lorem": "ipsum"}}}}}
+        )
+        other_config = AutohooksConfig.from_dict(
+            {"tool": {"autohooks": {"plugins": {"ruff": {"lorem": "dolor"}}}}}
+        )
+
+        self.assertEqual(
+            config.get_plugin_config("autohooks.plugins.ruff.check").get_value(
+                "lorem"
+            ),
+            "ipsum",
+        )
+        self.assertNotEqual(
+            config.get_plugin_config_hash("autohooks.plugins.ruff.check"),
+            other_config.get_plugin_config_hash("autohooks.plugins.ruff.check"),
+        )
+
+    def test_get_plugin_config_hash(self):
+        config = AutohooksConfig.from_dict(
+            {
+                "tool": {
+                    "autohooks": {"plugins": {"foo": {"lorem": "ipsum"}}},
+                    "bar": {"lorem": "ipsum"},
+                }
+            }
+        )
+        other_config = AutohooksConfig.from_dict(
+            {"tool": {"autohooks": {"plugins": {"foo": {"lorem": "ipsum"}}}}}
+        )
+
+        self.assertEqual(
+            config.get_plugin_config_hash("foo"),
+            other_config.get_plugin_config_hash("foo"),
+        )
+        self.assertNotEqual(
+            config.get_plugin_config_hash("foo"),
+            config.get_plugin_config_hash("bar"),
+        )
+        self.assertNotEqual(
+            config.get_config_hash(), other_config.get_config_hash()
+        )
+
+
+class ParseSizeTestCase(unittest.TestCase):
+    def test_parse_size(self):
+        self.assertEqual(parse_size(100), 100)
+        self.assertEqual(parse_size("100"), 100)
+        self.assertEqual(parse_size("2KB"), 2000)
+        self.assertEqual(parse_size("2 kib"), 2048)
+        self.assertEqual(parse_size("1GB"), 1000**3)
+
+        with self.assertRaises(ValueError):
+            parse_size("1.5MB")
+
+        with self.assertRaises(ValueError):
+            parse_size(1.5)  # type: ignore[arg-type]
+
+
+class ParseDurationTestCase(unittest.TestCase):
+    def test_parse_duration(self):
+        self.assertEqual(parse_duration(100), 100)
+        self.assertEqual(parse_duration("45m"), 45 * 60)
+        self.assertEqual(parse_duration("12h"), 12 * 3600)
+        self.assertEqual(parse_duration("7 d"), 7 * 86400)
+
+        with self.assertRaises(ValueError):
+            parse_duration("1w")
+
 
 class ConfigTestCase(unittest.TestCase):
     def test_empty_config(self):
@@ -270,6 +504,33 @@ class ConfigTestCase(unittest.TestCase):
         config = Config({"foo": "bar"})
         self.assertTrue(config.has_key("foo"))
 
+    def test_hash(self):
+        config = Config({"foo": {"lorem": "ipsum", "dolor": [1, 2]}})
+
+        self.assertEqual(
+            config.hash(),
+            Config({"foo": {"dolor": [1, 2], "lorem": "ipsum"}}).hash(),
+        )
+        self.assertNotEqual(
+            config.hash(),
+            Config({"foo": {"lorem": "ipsum", "dolor": [2, 1]}}).hash(),
+        )
+        self.assertEqual(config.get("foo").hash(), config.get("foo").hash())
+        self.assertNotEqual(config.hash(), Config().hash())
+
+    def test_hash_of_toml_document(self):
+        config = AutohooksConfig.from_string(
+            "[tool.foo]\nlorem = 'ipsum'\ndate = 2026-01-01\n"
+        )
+        other_config = AutohooksConfig.from_string(
+            '[tool.foo]\ndate = 2026-01-01\nlorem = "ipsum"\n'
+        )
+
+        self.assertEqual(
+            config.get_config_hash("tool", "foo"),
+            other_config.get_config_hash("tool", "foo"),
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -10,7 +10,15 @@ from pathlib import Path
 from tempfile import TemporaryDirectory
 from unittest.mock import Mock
 
-from autohooks.hooks import PreCommitHook, get_pre_commit_hook_path
+from autohooks.hooks import (
+    CommitMsgHook,
+    PostCheckoutHook,
+    PostMergeHook,
+    PreCommitHook,
+    PrePushHook,
+    get_hook_path,
+    get_pre_commit_hook_path,
+)
 from autohooks.settings import Mode
 from autohooks.template import (
     PIPENV_MULTILINE_SHEBANG,
@@ -261,5 +269,68 @@ class StrTestCase(unittest.TestCase):
         path.__str__.assert_called_with()
 
 
+class GetHookPathTestCase(GitDirTestCase):
+    def test_get_path(self):
+        self.assertEqual(
+            get_hook_path("pre-push"),
+            self.temp_dir_path / ".git" / "hooks" / "pre-push",
+        )
+
+
+class InstallPrePushHookTestCase(GitDirTestCase):
+    def test_install(self):
+        pre_push_hook = PrePushHook()
+
+        self.assertEqual(
+            pre_push_hook.hook_path,
+            self.temp_dir_path / ".git" / "hooks" / "pre-push",
+        )
+        self.assertFalse(pre_push_hook.exists())
+
+        pre_push_hook.write(mode=Mode.POETRY)
+
+        self.assertTrue(pre_push_hook.exists())
+        self.assertTrue(pre_push_hook.is_autohooks_hook())
+        self.assertTrue(pre_push_hook.is_current_autohooks_hook())
+        self.assertEqual(pre_push_hook.read_mode(), Mode.POETRY)
+        self.assertIn('run_hook("pre-push"', pre_push_hook.content)
+        self.assertIn("git push --no-verify", pre_push_hook.content)
+
+
+class InstallCommitMsgHookTestCase(GitDirTestCase):
+    def test_install(self):
+        commit_msg_hook = CommitMsgHook()
+
+        commit_msg_hook.write(mode=Mode.UV_MULTILINE)
+
+        self.assertTrue(commit_msg_hook.is_autohooks_hook())
+        self.assertEqual(commit_msg_hook.read_mode(), Mode.UV_MULTILINE)
+        self.assertIn('run_hook("commit-msg"', commit_msg_hook.content)
+        self.assertIn("git commit --no-verify", commit_msg_hook.content)
+
+
+class InstallBackgroundHookTestCase(GitDirTestCase):
+    def test_install_post_checkout(self):
+        post_checkout_hook = PostCheckoutHook()
+
+        post_checkout_hook.write(mode=Mode.PYTHONPATH)
+
+        self.assertTrue(post_checkout_hook.is_autohooks_hook())
+        self.assertTrue(post_checkout_hook.is_current_autohooks_hook())
+        self.assertEqual(post_checkout_hook.read_mode(), Mode.PYTHONPATH)
+        self.assertIn('run_hook("post-checkout"', post_checkout_hook.content)
+        # the hook must not fail if autohooks isn't installed
+        self.assertNotIn("sys.exit(1)", post_checkout_hook.content)
+
+    def test_install_post_merge(self):
+        post_merge_hook = PostMergeHook()
+
+        post_merge_hook.write(mode=Mode.POETRY)
+
+        self.assertTrue(post_merge_hook.is_autohooks_hook())
+        self.assertEqual(post_merge_hook.read_mode(), Mode.POETRY)
+        self.assertIn('run_hook("post-merge"', post_merge_hook.content)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -7,6 +7,7 @@ import unittest
 
 from autohooks.settings import Mode
 from autohooks.template import (
+    HookTemplate,
     PreCommitTemplate,
     get_pre_commit_hook_template_path,
 )
@@ -134,3 +135,23 @@ class GetPreCommitHookTemplatePath(unittest.TestCase):
 
 if __name__ == "__main__":
     unittest.main()
+
+
+class HookTemplateTestCase(unittest.TestCase):
+    def test_render(self):
+        template = HookTemplate("pre-push", "push")
+        content = template.render(mode=Mode.PIPENV)
+
+        self.assertTrue(content.startswith("#!/usr/bin/env -S pipenv run"))
+        self.assertIn("# meta = { version = 1 }", content)
+        self.assertIn('sys.exit(run_hook("pre-push", sys.argv[1:]))', content)
+        self.assertIn("'git push --no-verify'", content)
+
+    def test_render_template_path(self):
+        path = FakeTemplatePath("$SHEBANG $HOOK $GIT_COMMAND")
+        template = HookTemplate("commit-msg", "commit", path)
+
+        self.assertEqual(
+            template.render(mode=Mode.UV),
+            "/usr/bin/env -S uv run python commit-msg commit",
+        )
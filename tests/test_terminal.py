@@ -8,9 +8,14 @@
 import os
 import unittest
 from io import StringIO
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
-from autohooks.terminal import Signs, Terminal
+from autohooks.terminal import (
+    BufferedTerminal,
+    ExpectedRemainingColumn,
+    Signs,
+    Terminal,
+)
 
 
 class TerminalTestCase(unittest.TestCase):
@@ -124,5 +129,73 @@ class TerminalTestCase(unittest.TestCase):
         self.assertEqual(ret, expected_msg)
 
 
+class BufferedTerminalTestCase(unittest.TestCase):
+    def test_buffer_until_flush(self):
+        term = MagicMock(spec=Terminal)
+        buffer = BufferedTerminal()
+
+        buffer.info("foo")
+        buffer.ok("bar")
+
+        term.info.assert_not_called()
+        term.ok.assert_not_called()
+
+        buffer.flush(term)
+
+        term.info.assert_called_once_with("foo")
+        term.ok.assert_called_once_with("bar")
+
+    def test_flush_once(self):
+        term = MagicMock(spec=Terminal)
+        buffer = BufferedTerminal()
+
+        buffer.warning("foo")
+        buffer.flush(term)
+        buffer.flush(term)
+
+        term.warning.assert_called_once_with("foo")
+
+    def test_keep_indentation(self):
+        term = Terminal()
+        buffer = BufferedTerminal()
+
+        buffer.print("foo")
+        with buffer.indent(2):
+            buffer.print("bar")
+
+        with patch("sys.stdout", new_callable=StringIO) as mock_stdout:
+            buffer.flush(term)
+
+        self.assertEqual(mock_stdout.getvalue(), " foo\n   bar\n")
+
+
+class ExpectedRemainingColumnTestCase(unittest.TestCase):
+    def test_render(self):
+        task = MagicMock(
+            fields={"expected": 75.5}, finished=False, elapsed=10.0
+        )
+
+        text = ExpectedRemainingColumn().render(task)
+
+        self.assertEqual(text.plain, "~1:05 left")
+
+    def test_exceeded(self):
+        task = MagicMock(fields={"expected": 5.0}, finished=False, elapsed=10)
+
+        text = ExpectedRemainingColumn().render(task)
+
+        self.assertEqual(text.plain, "~0:00 left")
+
+    def test_unknown(self):
+        column = ExpectedRemainingColumn()
+
+        for task in (
+            MagicMock(fields={}, finished=False, elapsed=1.0),
+            MagicMock(fields={"expected": 5.0}, finished=True, elapsed=1.0),
+            MagicMock(fields={"expected": 5.0}, finished=False, elapsed=None),
+        ):
+            self.assertEqual(column.render(task).plain, "")
+
+
 if __name__ == "__main__":
     unittest.main()
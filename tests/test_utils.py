@@ -12,12 +12,15 @@ from unittest.mock import MagicMock, patch
 
 from autohooks.utils import (
     GitError,
+    RepositoryContext,
+    clear_repository_context,
     exec_git,
     get_git_directory_path,
     get_git_hook_directory_path,
     get_project_autohooks_plugins_path,
     get_project_root_path,
     get_pyproject_toml_path,
+    get_repository_context,
     is_project_root,
     is_split_env,
 )
@@ -241,6 +244,142 @@ class GetGitDirectoryPath(unittest.TestCase):
             get_git_directory_path()
 
 
+class RepositoryContextTestCase(unittest.TestCase):
+    def setUp(self):
+        self.tempdir = TemporaryDirectory()
+        self.temp_path = Path(self.tempdir.name).resolve()
+
+        exec_git("-C", str(self.temp_path), "init")
+
+    def tearDown(self):
+        self.tempdir.cleanup()
+
+    def test_paths(self):
+        sub_path = self.temp_path / "foo"
+        sub_path.mkdir()
+        (self.temp_path / "pyproject.toml").touch()
+
+        context = RepositoryContext(sub_path)
+
+        self.assertEqual(context.path, sub_path)
+        self.assertEqual(context.project_root_path, self.temp_path)
+        self.assertEqual(context.toplevel_path, self.temp_path)
+        self.assertEqual(context.git_directory_path, self.temp_path / ".git")
+        self.assertEqual(
+            context.git_common_directory_path, self.temp_path / ".git"
+        )
+        self.assertEqual(
+            context.hook_directory_path, self.temp_path / ".git" / "hooks"
+        )
+
+    @patch("autohooks.utils.exec_git", wraps=exec_git)
+    def test_determine_git_paths_once(self, exec_git_mock: MagicMock):
+        context = RepositoryContext(self.temp_path)
+
+        self.assertEqual(context.toplevel_path, self.temp_path)
+        self.assertEqual(context.git_directory_path, self.temp_path / ".git")
+        self.assertEqual(
+            context.hook_directory_path, self.temp_path / ".git" / "hooks"
+        )
+
+        exec_git_mock.assert_called_once()
+
+    def test_hooks_path(self):
+        exec_git(
+            "-C", str(self.temp_path), "config", "core.hooksPath", "githooks"
+        )
+
+        context = RepositoryContext(self.temp_path)
+
+        self.assertEqual(
+            context.hook_directory_path, self.temp_path / "githooks"
+        )
+
+    def test_linked_worktree(self):
+        exec_git(
+            "-C",
+            str(self.temp_path),
+            "-c",
+            "user.name=Max Mustermann",
+            "-c",
+            "user.email=max.mustermann@example.com",
+            "commit",
+            "--allow-empty",
+            "--no-gpg-sign",
+            "-m",
+            "Foo",
+        )
+
+        with TemporaryDirectory() as f:
+            worktree_path = Path(f).resolve() / "worktree"
+            exec_git(
+                "-C",
+                str(self.temp_path),
+                "worktree",
+                "add",
+                str(worktree_path),
+            )
+
+            context = RepositoryContext(worktree_path)
+
+            self.assertEqual(context.toplevel_path, worktree_path)
+            self.assertEqual(
+                context.git_directory_path,
+                self.temp_path / ".git" / "worktrees" / "worktree",
+            )
+            self.assertEqual(
+                context.git_common_directory_path, self.temp_path / ".git"
+            )
+            self.assertEqual(
+                context.hook_directory_path, self.temp_path / ".git" / "hooks"
+            )
+
+    def test_submodule_paths(self):
+        with TemporaryDirectory() as f:
+            submodule_repo_path = Path(f).resolve()
+            exec_git("-C", str(submodule_repo_path), "init")
+            exec_git(
+                "-C",
+                str(submodule_repo_path),
+                "-c",
+                "user.name=Max Mustermann",
+                "-c",
+                "user.email=max.mustermann@example.com",
+                "commit",
+                "--allow-empty",
+                "--no-gpg-sign",
+                "-m",
+                "Foo",
+            )
+            exec_git(
+                "-C",
+                str(self.temp_path),
+                "-c",
+                "protocol.file.allow=always",
+                "submodule",
+                "add",
+                str(submodule_repo_path),
+                "foo",
+            )
+
+            context = RepositoryContext(self.temp_path)
+
+            self.assertEqual(context.submodule_paths, [self.temp_path / "foo"])
+
+    def test_get_repository_context(self):
+        os.chdir(str(self.temp_path))
+
+        context = get_repository_context()
+
+        self.assertIs(context, get_repository_context())
+        self.assertIs(context, get_repository_context(self.temp_path))
+        self.assertEqual(context.path, self.temp_path)
+
+        clear_repository_context()
+
+        self.assertIsNot(context, get_repository_context())
+
+
 class IsSplitEnvTestCase(unittest.TestCase):
     @patch("subprocess.run")
     def test_is_split_env(self, subprocess_mock: MagicMock):